@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of factory dispatch in Manager.cast.
+
+Compares per-node cost of exception-driven factory lookup (used before)
+with factory resolution cache. Run with "src" directory on PYTHONPATH."""
+from __future__ import print_function
+import timeit
+
+from pycomber.manager import Manager
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType
+
+
+class ExceptionDrivenManager(Manager):
+    """Manager that looks up factories the way it was done before"""
+
+    def cast(self, var):
+        try:
+            return self._table._factories[type(var)](var)
+        except KeyError:
+            return var
+
+
+def configured(manager):
+    ConfigurationAggregate(ConfigurationComplex(), ConfigurationPrimitives(),
+            ConfigurationNoneType())(manager)
+    return manager
+
+
+def measure(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main(width=10000, number=200000):
+    left = dict(('key%d' % i, i) for i in range(width))
+    right = dict(('key%d' % i, -i) for i in range(0, width * 2, 2))
+    print('%-24s %14s %14s' % ('', 'cast [ns]', 'node [ns]'))
+    for manager_class in (ExceptionDrivenManager, Manager):
+        manager = configured(manager_class())
+        cast = measure(lambda: manager.cast(1), number)
+        node = measure(lambda: manager(left, right), 10) / \
+                len(set(left) | set(right))
+        print('%-24s %14.1f %14.1f' % (manager_class.__name__, cast, node))
+
+
+if __name__ == '__main__':
+    main()
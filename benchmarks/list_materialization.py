@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark of eager (MergeList) and lazy (MergeListStream) list merges.
+
+Reports time and peak memory of merging two lists and consuming merged
+values. Run with "src" directory on PYTHONPATH."""
+from __future__ import print_function
+import sys
+import time
+import tracemalloc
+
+from pycomber.manager import Manager
+from pycomber.strategies import MergeList, MergeListStream, MergePrimitives
+
+
+def configured(strategy_class):
+    manager = Manager()
+    manager.set_strategy(strategy_class(manager), list)
+    manager.set_strategy(MergePrimitives(manager), int, type(None))
+    return manager
+
+
+def consume(values):
+    total = 0
+    for value in values:
+        total += value
+    return total
+
+
+def measure(strategy_class, left, right):
+    manager = configured(strategy_class)
+    tracemalloc.start()
+    start = time.time()
+    consume(manager(left, right))
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (elapsed, peak)
+
+
+def main(size=1000000):
+    left = list(range(0, size, 2))
+    right = list(range(1, size, 2))
+    print('%-18s %10s %14s' % ('', 'time [s]', 'peak [MiB]'))
+    for strategy_class in (MergeList, MergeListStream):
+        (elapsed, peak) = measure(strategy_class, left, right)
+        print('%-18s %10.2f %14.1f' % (strategy_class.__name__, elapsed, \
+                peak / 2.0 ** 20))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
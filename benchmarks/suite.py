@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark suite of merges of objects of various shapes and sizes.
+
+Every case is merged several times and the best time is reported, peak
+memory is measured by separate run with tracemalloc enabled. Results can be
+written as JSON and two such files (e.g. of two revisions) can be compared:
+
+    PYTHONPATH=src python benchmarks/suite.py --output before.json
+    PYTHONPATH=src python benchmarks/suite.py --output after.json
+    python benchmarks/suite.py --compare before.json after.json
+
+Comparison exits with status 1 if any case got slower (or used more memory)
+than given threshold allows."""
+from __future__ import print_function
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+
+def default_manager():
+    from pycomber import merger
+    return merger
+
+
+def immutable_manager():
+    from pycomber.manager import Manager
+    from pycomber.configuration import ConfigurationAggregate, \
+            ConfigurationComplex, ConfigurationPrimitives, \
+            ConfigurationNoneType, ConfigurationImmutable
+    manager = Manager()
+    ConfigurationAggregate(ConfigurationComplex(), ConfigurationPrimitives(), \
+            ConfigurationNoneType(), ConfigurationImmutable())(manager)
+    return manager
+
+
+def wide_dict(scale):
+    size = 20000 * scale
+    return ({'k%d' % i: i for i in range(0, size, 2)}, \
+            {'k%d' % i: i for i in range(size // 2, size + size // 2)})
+
+
+def deep_dict(scale):
+    return (_nested(150, 10 * scale, 'l'), _nested(150, 10 * scale, 'r'))
+
+
+def _nested(depth, width, prefix):
+    """Returns dicts nested given number of times, all of them having
+    given number of own keys (with given prefix) and "child" key"""
+    out = {}
+    for level in range(depth):
+        child = out
+        out = dict(('%s%d' % (prefix, i), level) for i in range(width))
+        out['child'] = child
+    return out
+
+
+def hashable_list(scale):
+    size = 100000 * scale
+    return (list(range(0, size, 2)), list(range(size // 2, size)))
+
+
+def unhashable_list(scale):
+    size = 5000 * scale
+    return ([{'id': i} for i in range(0, size, 2)], \
+            [{'id': i} for i in range(size // 2, size)])
+
+
+def sets(scale):
+    size = 100000 * scale
+    return (set(range(0, size, 2)), set(range(size // 2, size)))
+
+
+def tuples(scale):
+    size = 100000 * scale
+    return (tuple(range(0, size, 2)), tuple(range(size // 2, size)))
+
+
+def document(scale):
+    def make(offset):
+        return {'items': [{'id': i, 'tags': ['t%d' % (i % 7)], \
+                'meta': {'n': i, 'v': [i, i + 1]}} \
+                for i in range(offset, offset + 2000 * scale)], \
+                'index': {'k%d' % i: i for i in range(offset, \
+                offset + 8000 * scale)}}
+    return (make(0), make(1000 * scale))
+
+
+# (name, manager factory, objects factory)
+CASES = [
+    ('wide_dict', default_manager, wide_dict),
+    ('deep_dict', default_manager, deep_dict),
+    ('hashable_list', default_manager, hashable_list),
+    ('unhashable_list', default_manager, unhashable_list),
+    ('set', default_manager, sets),
+    ('tuple', default_manager, tuples),
+    ('document', default_manager, document),
+    ('immutable_document', immutable_manager, document),
+]
+
+
+def measure(manager, left, right, repeat):
+    """Returns best time of merge of given objects and peak memory
+    allocated during merge"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        manager(left, right)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    manager(left, right)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'time': best, 'peak': peak}
+
+
+def run(repeat, scale, only=None):
+    results = {}
+    for (name, manager_factory, objects_factory) in CASES:
+        if only and name not in only:
+            continue
+        (left, right) = objects_factory(scale)
+        results[name] = measure(manager_factory(), left, right, repeat)
+        print('%-20s %10.4f s %10.2f MiB' % (name, results[name]['time'], \
+                results[name]['peak'] / 2.0 ** 20), file=sys.stderr)
+    return {'python': platform.python_version(), 'repeat': repeat, \
+            'scale': scale, 'results': results}
+
+
+def compare(before, after, threshold):
+    """Prints comparison of given results and returns number of cases
+    that regressed above given threshold"""
+    regressions = 0
+    print('%-20s %10s %10s %8s %10s %10s %8s' % ('', 'before [s]', \
+            'after [s]', 'ratio', 'before MiB', 'after MiB', 'ratio'))
+    for name in sorted(set(before['results']) & set(after['results'])):
+        (old, new) = (before['results'][name], after['results'][name])
+        time_ratio = new['time'] / old['time'] if old['time'] else 1.0
+        peak_ratio = new['peak'] / float(old['peak']) if old['peak'] else 1.0
+        regressed = time_ratio > threshold or peak_ratio > threshold
+        regressions += regressed
+        print('%-20s %10.4f %10.4f %8.2f %10.2f %10.2f %8.2f%s' % (name, \
+                old['time'], new['time'], time_ratio, \
+                old['peak'] / 2.0 ** 20, new['peak'] / 2.0 ** 20, \
+                peak_ratio, '  REGRESSION' if regressed else ''))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5, \
+            help='number of timed merges per case (best one is reported)')
+    parser.add_argument('--scale', type=int, default=1, \
+            help='multiplier of sizes of merged objects')
+    parser.add_argument('--case', action='append', choices=[case[0] for \
+            case in CASES], help='run given case only (may be repeated)')
+    parser.add_argument('--output', help='write JSON results to given file')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), \
+            help='compare two JSON result files instead of running')
+    parser.add_argument('--threshold', type=float, default=1.1, \
+            help='ratio above which case is reported as regression')
+    args = parser.parse_args(argv)
+    if args.compare:
+        with open(args.compare[0]) as f:
+            before = json.load(f)
+        with open(args.compare[1]) as f:
+            after = json.load(f)
+        return 1 if compare(before, after, args.threshold) else 0
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 5000))
+    results = run(args.repeat, args.scale, args.case)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,4 +16,5 @@ setup(name='PyComber',
     author='Michał Bachowski',
     author_email='michal@bachowski.pl',
     packages=['pycomber'],
-    package_dir={'': 'src'})
+    package_dir={'': 'src'},
+    extras_require={'numpy': ['numpy']})
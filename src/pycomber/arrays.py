@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Merge strategies for numpy arrays. Requires numpy, so this module
+is imported only when it is needed (see ConfigurationNumpy)."""
+import functools
+import numpy
+from pycomber.strategies import MergeAbstract
+
+
+class MergeArrayOverride(MergeAbstract):
+    """Merger for numpy arrays. Overrides merge_to with merge_from"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given arrays
+
+        Arguments:
+            :param    merge_from: merge from this array
+            :type     merge_from: numpy.ndarray
+            :param    merge_to: merge to this array
+            :type     merge_to: numpy.ndarray
+        :returns: numpy.ndarray -- copy of merge_from
+        """
+        return numpy.array(merge_from, copy=True)
+
+    def merge_many(self, values):
+        """Merges all given arrays at once
+
+        Arguments:
+            :param    values: arrays to be merged
+            :type     values: list
+        :returns: numpy.ndarray -- copy of first array
+        """
+        return numpy.array(values[0], copy=True)
+
+
+class MergeArrayConcat(MergeAbstract):
+    """Merger for numpy arrays. Joins two arrays together along first axis"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given arrays
+
+        Arguments:
+            :param    merge_from: merge from this array
+            :type     merge_from: numpy.ndarray
+            :param    merge_to: merge to this array
+            :type     merge_to: numpy.ndarray
+        :returns: numpy.ndarray -- merged instances
+        :raises: ValueError
+        """
+        return numpy.concatenate((merge_from, merge_to))
+
+    def merge_many(self, values):
+        """Merges all given arrays at once
+
+        Arguments:
+            :param    values: arrays to be merged
+            :type     values: list
+        :returns: numpy.ndarray -- merged instances
+        :raises: ValueError
+        """
+        return numpy.concatenate(values)
+
+
+class MergeArrayUnique(MergeAbstract):
+    """Merger for numpy arrays. Returns sorted, flat array
+    of unique values of both arrays"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given arrays
+
+        Arguments:
+            :param    merge_from: merge from this array
+            :type     merge_from: numpy.ndarray
+            :param    merge_to: merge to this array
+            :type     merge_to: numpy.ndarray
+        :returns: numpy.ndarray -- merged instances
+        """
+        return numpy.union1d(merge_from, merge_to)
+
+    def merge_many(self, values):
+        """Merges all given arrays at once
+
+        Arguments:
+            :param    values: arrays to be merged
+            :type     values: list
+        :returns: numpy.ndarray -- merged instances
+        """
+        return numpy.unique(numpy.concatenate([numpy.ravel(value) \
+                for value in values]))
+
+
+class MergeArrayElementwise(MergeAbstract):
+    """Merger for numpy arrays. Combines items of arrays on the same
+    positions with given function (arrays are broadcast against each other)"""
+
+    def __init__(self, manager, function=numpy.add):
+        """Object initialization
+
+        Arguments:
+            :param    manager: merge manager instance
+            :type     manager: pycomber.manager.Manager
+            :param    function: function called with merge_from and merge_to
+                                (e.g. numpy.add, numpy.maximum)
+            :type     function: numpy.ufunc
+        """
+        MergeAbstract.__init__(self, manager)
+        self._function = function
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given arrays
+
+        Arguments:
+            :param    merge_from: merge from this array
+            :type     merge_from: numpy.ndarray
+            :param    merge_to: merge to this array
+            :type     merge_to: numpy.ndarray
+        :returns: numpy.ndarray -- merged instances
+        :raises: ValueError
+        """
+        return self._function(merge_from, merge_to)
+
+    def merge_many(self, values):
+        """Merges all given arrays at once
+
+        Arguments:
+            :param    values: arrays to be merged
+            :type     values: list
+        :returns: numpy.ndarray -- merged instances
+        :raises: ValueError
+        """
+        return functools.reduce(self._function, values)
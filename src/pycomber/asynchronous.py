@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+from pycomber.manager import Traversal
+
+
+async def merge_async(manager, merge_from=None, merge_to=None, nodes=1000, \
+        interval=None, executor=None, threshold=None):
+    """Merges given instances merge_from and merge_to without blocking
+    event loop for long. Objects are traversed using explicit stack
+    (see pycomber.manager.Traversal) and control is given back
+    to event loop every given number of merged nodes or microseconds.
+
+    Objects with at least threshold child merges on top level
+    are merged by given executor instead.
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    merge_from: merge from this object
+        :type     merge_from: object
+        :param    merge_to: merge to this object
+        :type     merge_to: object
+        :param    nodes: number of nodes merged between yields
+        :type     nodes: int
+        :param    interval: time in microseconds between yields
+        :type     interval: int
+        :param    executor: executor to merge large objects with
+                            (default executor of event loop if None)
+        :type     executor: concurrent.futures.Executor
+        :param    threshold: minimal number of child merges on top level
+                             to use executor for (executor is not used
+                             if None)
+        :type     threshold: int
+    :returns: object
+    :raises: TypeError
+    """
+    parts = manager.decompose(merge_from, merge_to)
+    if parts is None:
+        return manager(merge_from, merge_to)
+    (children, build) = parts
+    if threshold is not None and len(children) >= threshold:
+        return await asyncio.get_running_loop().run_in_executor(executor, \
+                _merge_children, manager, children, build)
+    traversal = Traversal(manager, children, build)
+    # clock is checked after every node if interval is given
+    step = nodes if interval is None else 1
+    count = 0
+    deadline = _deadline(interval)
+    while not traversal.run(step):
+        count += step
+        if count >= nodes or (deadline is not None and \
+                time.monotonic() >= deadline):
+            await asyncio.sleep(0)
+            count = 0
+            deadline = _deadline(interval)
+    return traversal.value
+
+
+def _merge_children(manager, children, build):
+    """Merges given child merges and builds merged instance from them
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    children: arguments for child merges
+        :type     children: list
+        :param    build: callable that builds merged instance
+        :type     build: callable
+    :returns: object
+    """
+    return manager.cast(build([manager(*args) for args in children]))
+
+
+def _deadline(interval):
+    """Returns time of next yield
+
+    Arguments:
+        :param    interval: time in microseconds between yields
+        :type     interval: int
+    :returns: float | None
+    """
+    if interval is None:
+        return None
+    return time.monotonic() + interval / 1e6
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from pycomber.value_objects import ImmutableDict
+from pycomber.persistent import PersistentMap, PersistentVector
 from pycomber.strategies import MergeList, MergeDict, MergeSet, MergeTuple, \
-        MergePrimitives, MergeNone
+        MergePrimitives, MergeNone, MergeDictShared, MergeListShared, \
+        MergeSetShared, MergeTupleShared, MergePersistentMap, \
+        MergePersistentVector, MergePersistentSet
 
 
 class ConfigurationAbstract(object):
@@ -60,6 +63,25 @@ class ConfigurationComplex(ConfigurationAbstract):
         manager.set_strategy(MergeTuple(manager), tuple)
 
 
+class ConfigurationShared(ConfigurationAbstract):
+    """Configures manager to share untouched values of merged dicts, lists,
+    sets and tuples with the result instead of copying them
+    (dict, list, set, tuple)"""
+
+    def __call__(self, manager):
+        """Performs configuration for given manager instance
+
+        Arguments:
+            :param    manager: merge manager instance to be configured
+            :type     manager: pycomber.manager.Manager
+        :returns: None
+        """
+        manager.set_strategy(MergeDictShared(manager), dict)
+        manager.set_strategy(MergeListShared(manager), list)
+        manager.set_strategy(MergeSetShared(manager), set)
+        manager.set_strategy(MergeTupleShared(manager), tuple)
+
+
 class ConfigurationPrimitives(ConfigurationAbstract):
     """Configures manager to merge primitives (str, int, float, complex, bool)"""
 
@@ -120,3 +142,70 @@ class ConfigurationImmutable(ConfigurationAbstract):
         manager.set_factory(list, tuple)
         manager.set_factory(dict, ImmutableDict)
         manager.set_factory(set, frozenset)
+
+
+class ConfigurationPersistent(ConfigurationAbstract):
+    """Configures manager to produce persistent instances of input objects
+    (see pycomber.persistent). Merged maps and vectors share untouched parts
+    of merge_to, so repeated merges of overlays onto the same base
+    do not copy the base. Sets are cast to frozensets, frozensets holding
+    all merged values are shared."""
+
+    def __call__(self, manager):
+        """Performs configuration for given manager instance
+
+        Arguments:
+            :param    manager: merge manager instance to be configured
+            :type     manager: pycomber.manager.Manager
+        :returns: None
+        """
+        manager.set_factory(list, PersistentVector)
+        manager.set_factory(dict, PersistentMap)
+        manager.set_factory(set, frozenset)
+        manager.set_strategy(MergePersistentMap(manager), \
+                (dict, PersistentMap))
+        manager.set_strategy(MergePersistentVector(manager), \
+                (list, PersistentVector))
+        manager.set_strategy(MergePersistentSet(manager), (set, frozenset))
+
+        # plain objects are converted recursively, persistent ones are shared
+        NoneType = type(None)
+        manager.set_strategy(MergePersistentMap(manager), dict, NoneType)
+        manager.set_strategy(MergePersistentVector(manager), list, NoneType)
+        types = (PersistentMap, PersistentVector)
+        manager.set_strategy(MergeNone(manager), NoneType, types)
+        manager.set_strategy(MergeNone(manager), types, NoneType)
+
+
+class ConfigurationNumpy(ConfigurationAbstract):
+    """Configures manager to merge numpy arrays (numpy.ndarray).
+    Requires numpy, which is imported when configuration is performed."""
+
+    def __init__(self, strategy=None):
+        """Object constructor
+
+        Arguments:
+            :param  strategy: strategy class to merge arrays with
+                              (see pycomber.arrays), by default arrays
+                              are overridden (MergeArrayOverride)
+            :type   strategy: callable
+        """
+        self._strategy = strategy
+
+    def __call__(self, manager):
+        """Performs configuration for given manager instance
+
+        Arguments:
+            :param    manager: merge manager instance to be configured
+            :type     manager: pycomber.manager.Manager
+        :returns: None
+        :raises: ImportError
+        """
+        import numpy
+        from pycomber.arrays import MergeArrayOverride
+        strategy = self._strategy or MergeArrayOverride
+        manager.set_strategy(strategy(manager), numpy.ndarray)
+
+        NoneType = type(None)
+        manager.set_strategy(MergeNone(manager), NoneType, numpy.ndarray)
+        manager.set_strategy(MergeNone(manager), numpy.ndarray, NoneType)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from pycomber.strategies import MergePrimitives
+
+
+class DispatchTable(object):
+    """Read-only table of merge strategies and factories.
+
+    Registration of strategy or factory returns new table, so tables
+    can be shared between threads without locking. Resolved strategies
+    and factories are cached; cache is never invalidated as table
+    itself never changes."""
+
+    _missing = object()
+
+    def __init__(self, strategies=None, factories=None):
+        """Object initialization
+
+        Arguments:
+            :param    strategies: strategies for pairs of types
+                                  ({left_type: {right_type: strategy}})
+            :type     strategies: dict
+            :param    factories: factories for types ({base_type: factory})
+            :type     factories: dict
+        """
+        self._strategies = strategies or {}
+        self._factories = factories or {}
+        self._resolved = {}
+        self._resolved_factories = {}
+        self._leaf_types = None
+
+    def with_strategy(self, strategy, pairs):
+        """Returns new table with given strategy set for given pairs of types
+
+        Arguments:
+            :param    strategy: strategy of merging left_type to right_type
+            :type     strategy: callable
+            :param    pairs: pairs of types (left_type, right_type)
+            :type     pairs: iterable
+        :returns: DispatchTable
+        """
+        strategies = dict((l, dict(rights)) \
+                for (l, rights) in self._strategies.items())
+        for (l, r) in pairs:
+            strategies.setdefault(l, {})[r] = strategy
+        return DispatchTable(strategies, self._factories)
+
+    def with_factory(self, base_type, factory):
+        """Returns new table with given factory set for given base type
+
+        Arguments:
+            :param    base_type: base type to cast from
+            :type     base_type: type
+            :param    factory: factory used to cast variable
+            :type     factory: callable
+        :returns: DispatchTable
+        """
+        factories = dict(self._factories)
+        factories[base_type] = factory
+        return DispatchTable(self._strategies, factories)
+
+    def get_strategy(self, left_type, right_type):
+        """Returns merging strategy for left_type (from) and right_type (to)
+
+        Strategies registered for base classes are used for subclasses.
+        Walks MRO of left_type first, so the closest base class
+        of left_type wins.
+
+        Arguments:
+            :param    left_type: merge from this type
+            :type     left_type: type
+            :param    right_type: merge to this type
+            :type     right_type: type
+        :returns: callable -- merging strategy
+        :raises:  TypeError
+        """
+        try:
+            return self._resolved[(left_type, right_type)]
+        except KeyError:
+            pass
+        for l in self._mro(left_type):
+            strategies = self._strategies.get(l)
+            if strategies is None:
+                continue
+            for r in self._mro(right_type):
+                if r in strategies:
+                    self._resolved[(left_type, right_type)] = strategies[r]
+                    return strategies[r]
+        raise TypeError("Missing strategy for types %s and %s" % \
+                                                        (left_type, right_type))
+
+    def get_factory(self, base_type):
+        """Returns factory function for given base type.
+        Factories registered for base classes are used for subclasses.
+
+        Arguments:
+            :param    base_type: type to get factory for
+            :type     base_type: type
+        :returns: callable -- factory method
+        :raises:  KeyError
+        """
+        factory = self.find_factory(base_type)
+        if factory is None:
+            raise KeyError(base_type)
+        return factory
+
+    def find_factory(self, base_type):
+        """Returns factory function for given type or its closest base class
+
+        Arguments:
+            :param    base_type: type to get factory for
+            :type     base_type: type
+        :returns: callable | None -- factory method or None if there is none
+        """
+        factory = self._resolved_factories.get(base_type, self._missing)
+        if factory is not self._missing:
+            return factory
+        factory = None
+        for t in self._mro(base_type):
+            if t in self._factories:
+                factory = self._factories[t]
+                break
+        self._resolved_factories[base_type] = factory
+        return factory
+
+    def leaf_types(self):
+        """Returns primitive types, whose instances are returned unchanged
+        when merged with None (merged by MergePrimitives and not cast
+        by any factory), so containers holding only such values
+        do not have to merge them one by one.
+
+        :returns: frozenset
+        """
+        if self._leaf_types is None:
+            NoneType = type(None)
+            leaf_types = set()
+            for t in self._strategies:
+                try:
+                    strategy = self.get_strategy(t, NoneType)
+                except TypeError:
+                    continue
+                if type(strategy) is MergePrimitives and \
+                        self.find_factory(t) is None:
+                    leaf_types.add(t)
+            self._leaf_types = frozenset(leaf_types)
+        return self._leaf_types
+
+    def _mro(self, var_type):
+        """Returns given type followed by its base classes
+
+        Arguments:
+            :param    var_type: type to get base classes for
+            :type     var_type: type
+        :returns: tuple
+        """
+        return getattr(var_type, '__mro__', (var_type,))
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import itertools
+import weakref
+
+# Python 2to3 support
+try:
+    from collections.abc import Mapping, Set
+except ImportError:
+    from collections import Mapping, Set
+
+
+class Fingerprint(object):
+    """Hashable structural representation of unhashable value.
+    Built bottom-up from fingerprints of items, so hash of every node
+    is computed once, when node is created, from cached hashes
+    of its items. Nodes are interned, so equal nodes are usually
+    the same object and comparing them does not descend into items."""
+
+    __slots__ = ('_type', '_items', '_hash', '__weakref__')
+
+    def __init__(self, value_type, items):
+        """Object initialization
+
+        Arguments:
+            :param    value_type: type of represented value
+            :type     value_type: type
+            :param    items: fingerprints of items of represented value
+                             (frozenset for unordered values, tuple
+                             for ordered ones)
+            :type     items: frozenset | tuple
+        """
+        self._type = value_type
+        self._items = items
+        self._hash = hash((value_type, items))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Fingerprint):
+            return NotImplemented
+        return self._hash == other._hash and self._type is other._type \
+                and self._items == other._items
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __repr__(self):
+        return '%s(%s, %r)' % (type(self).__name__, self._type.__name__, \
+                self._items)
+
+
+# marks values that are represented by fingerprint nodes
+_NODE = object()
+
+# hashable values that are represented by fingerprint nodes in strict mode
+_STRICT_NODES = (tuple, frozenset, Mapping)
+
+# interned fingerprint nodes by their types and items (keys must not refer
+# to nodes, so nodes are freed once they are not used), items of new nodes
+# are compared by identity
+_interned = weakref.WeakValueDictionary()
+
+
+def fingerprint(value, cache=None, strict=False):
+    """Returns hashable representation of given value.
+    Hashable values are returned as they are. Unhashable values
+    are represented by their type and fingerprints of their items
+    (see Fingerprint), so equal structures get equal fingerprints.
+    Values are traversed using explicit stack, so they can be nested
+    deeper than recursion limit.
+
+    Strict fingerprints tell apart leaves that are equal but of different
+    types (e.g. True, 1 and 1.0). Hashable leaves are paired with their
+    types and tuples, frozensets and mappings are always represented
+    by fingerprint nodes.
+
+    Given cache maps ids of already fingerprinted values to fingerprints.
+    It can be shared by calls for values that share subtrees, as long as
+    values are not modified in the meantime and all calls are either
+    strict or not.
+
+    Arguments:
+        :param    value: value to generate fingerprint for
+        :type     value: object
+        :param    cache: fingerprints of unhashable values by their ids
+        :type     cache: dict
+        :param    strict: whether types of hashable leaves are significant
+        :type     strict: bool
+    :returns: object -- hashable fingerprint
+    :raises: TypeError, ValueError
+    """
+    out = _leaf(value, strict)
+    if out is not _NODE:
+        return out
+    if cache is None:
+        cache = {}
+    out = _cached(value, cache)
+    if out is not None:
+        return out
+    # ids of values on the stack, to detect values containing themselves
+    active = set([id(value)])
+    stack = [_frame(value)]
+    while stack:
+        (node, pairs, items, fingerprints) = stack[-1]
+        for item in items:
+            out = _leaf(item, strict)
+            if out is _NODE:
+                out = _cached(item, cache)
+                if out is None:
+                    if id(item) in active:
+                        raise ValueError("Value contains itself")
+                    active.add(id(item))
+                    stack.append(_frame(item))
+                    break
+            fingerprints.append(out)
+        else:
+            stack.pop()
+            active.discard(id(node))
+            if pairs:
+                items = frozenset(zip(fingerprints[0::2], \
+                        fingerprints[1::2]))
+            elif isinstance(node, Set):
+                items = frozenset(fingerprints)
+            else:
+                items = tuple(fingerprints)
+            key = (type(node), items)
+            out = _interned.get(key)
+            if out is None:
+                out = Fingerprint(type(node), items)
+                _interned[key] = out
+            # value is kept so its id is not reused while cache is alive
+            cache[id(node)] = (node, out)
+            if stack:
+                stack[-1][3].append(out)
+    return out
+
+
+def _leaf(value, strict):
+    """Returns fingerprint of given value if it is a leaf
+
+    Arguments:
+        :param    value: value to generate fingerprint for
+        :type     value: object
+        :param    strict: whether types of hashable leaves are significant
+        :type     strict: bool
+    :returns: object -- fingerprint or _NODE if value has items
+              to fingerprint
+    """
+    if strict and isinstance(value, _STRICT_NODES):
+        return _NODE
+    try:
+        hash(value)
+    except TypeError:
+        return _NODE
+    if strict:
+        return (type(value), value)
+    return value
+
+
+def _cached(value, cache):
+    """Returns fingerprint of given value from given cache
+
+    Arguments:
+        :param    value: value represented by fingerprint node
+        :type     value: object
+        :param    cache: fingerprints of unhashable values by their ids
+        :type     cache: dict
+    :returns: Fingerprint | None -- None if value is not in cache
+    """
+    entry = cache.get(id(value))
+    if entry is not None and entry[0] is value:
+        return entry[1]
+    return None
+
+
+def _frame(value):
+    """Returns frame of stack used to fingerprint given value
+
+    Arguments:
+        :param    value: value represented by fingerprint node
+        :type     value: object
+    :returns: tuple -- value, whether its items are key-value pairs,
+              iterator over its items and list for their fingerprints
+    :raises: TypeError
+    """
+    if isinstance(value, Mapping):
+        return (value, True, itertools.chain.from_iterable(value.items()), \
+                [])
+    return (value, False, iter(value), [])
@@ -1,17 +1,36 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import functools
 import itertools
-from collections import defaultdict
+import threading
 from pycomber.strategies import MergeAbstract
+from pycomber.dispatch import DispatchTable
+from pycomber.plan import MergePlan
+from pycomber.memo import MergeCache
+from pycomber.profiling import Profile, ProfilingTable
 
 
 class Manager(MergeAbstract):
-    """Merge manager. Needs to be configured before can be used"""
+    """Merge manager. Needs to be configured before can be used
+
+    Strategies and factories are kept in read-only dispatch table that
+    is replaced on every registration, so manager can be shared between
+    threads while new strategies are registered. Merges read the table
+    without locking, registrations are serialized by a lock."""
 
     def __init__(self):
         """Object initialization"""
-        self._strategies = defaultdict(dict)
-        self._factories = {}
+        self._table = DispatchTable()
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     def set_factory(self, base_type, factory):
         """Sets factory for given base type
@@ -24,11 +43,13 @@ class Manager(MergeAbstract):
         :returns: Manager -- instance of Manager class (self)
         :raises:  TypeError
         """
-        self._factories[base_type] = factory
+        with self._lock:
+            self._table = self._table.with_factory(base_type, factory)
         return self
 
     def get_factory(self, base_type):
-        """Returns factory function for given base type
+        """Returns factory function for given base type.
+        Factories registered for base classes are used for subclasses.
 
         Arguments:
             :param    base_type: type to get factory for
@@ -36,7 +57,17 @@ class Manager(MergeAbstract):
         :returns: callable -- factory method
         :raises:  KeyError
         """
-        return self._factories[base_type]
+        return self._table.get_factory(base_type)
+
+    def find_factory(self, base_type):
+        """Returns factory function for given type or its closest base class
+
+        Arguments:
+            :param    base_type: type to get factory for
+            :type     base_type: type
+        :returns: callable | None -- factory method or None if there is none
+        """
+        return self._table.find_factory(base_type)
 
     def set_strategy(self, strategy, left_type, right_type=None):
         """Sets strategy of merging from left_type to right_type
@@ -55,13 +86,16 @@ class Manager(MergeAbstract):
             :type     right_type: type | iterable
         :returns: Manager -- instance of Manager class (self)
         """
-        for (l, r) in self._cartesian_product(left_type, right_type):
-            self._strategies[l][r] = strategy
+        pairs = list(self._cartesian_product(left_type, right_type))
+        with self._lock:
+            self._table = self._table.with_strategy(strategy, pairs)
         return self
 
     def get_strategy(self, left_type, right_type):
         """Returns merging strategy for left_type (from) and right_type (to)
 
+        Strategies registered for base classes are used for subclasses.
+
         Arguments:
             :param    left_type: merge from this type
             :type     left_type: type
@@ -70,11 +104,85 @@ class Manager(MergeAbstract):
         :returns: callable -- factory method
         :raises:  TypeError
         """
-        try:
-            return self._strategies[left_type][right_type]
-        except KeyError:
-            raise TypeError("Missing strategy for types %s and %s" % \
-                                                        (left_type, right_type))
+        return self._table.get_strategy(left_type, right_type)
+
+    def leaf_types(self):
+        """Returns types whose instances are returned unchanged when merged
+        with None (see pycomber.dispatch.DispatchTable.leaf_types)
+
+        :returns: frozenset
+        """
+        return self._table.leaf_types()
+
+    def memoize(self, maxsize=128, subtrees=False):
+        """Returns merge function that remembers merge results
+        (see pycomber.memo.MergeCache). Manager has to be configured
+        to produce immutable results (see ConfigurationImmutable).
+
+        Arguments:
+            :param    maxsize: maximal number of cached merge results
+            :type     maxsize: int
+            :param    subtrees: whether to cache merge results of children
+                                of merged objects as well
+            :type     subtrees: bool
+        :returns: pycomber.memo.MergeCache
+        :raises: TypeError
+        """
+        return MergeCache(self, maxsize, subtrees)
+
+    def freeze(self):
+        """Returns read-only snapshot of current configuration of manager.
+        Snapshot is not affected by later registrations and can be
+        shared between threads without locking.
+
+        :returns: pycomber.dispatch.DispatchTable
+        """
+        return self._table
+
+    def enable_profiling(self, hook=None):
+        """Starts recording calls of strategies and factories
+        (see pycomber.profiling.Profile). Merges are not measured
+        until profiling is enabled.
+
+        Arguments:
+            :param    hook: callable called after every measured call
+                            with kind ("strategy" or "factory"), key
+                            ((left_type, right_type) or type) and time
+                            of the call in seconds
+            :type     hook: callable
+        :returns: pycomber.profiling.Profile -- collected statistics
+        """
+        profile = Profile(hook)
+        with self._lock:
+            self.disable_profiling()
+            self._table = ProfilingTable(self._table, profile)
+        return profile
+
+    def disable_profiling(self):
+        """Stops recording calls of strategies and factories
+
+        :returns: pycomber.profiling.Profile | None -- collected statistics
+                  or None if profiling was not enabled
+        """
+        with self._lock:
+            profile = getattr(self._table, 'profile', None)
+            if profile is not None:
+                self._table = self._table.unwrap()
+        return profile
+
+    def compile(self, sample_left=None, sample_right=None):
+        """Returns merge function specialized for layout of types
+        of given samples. Samples are merged once during compilation.
+
+        Arguments:
+            :param    sample_left: sample object to merge from
+            :type     sample_left: object
+            :param    sample_right: sample object to merge to
+            :type     sample_right: object
+        :returns: pycomber.plan.MergePlan -- compiled merge function
+        :raises: TypeError
+        """
+        return MergePlan(self, sample_left, sample_right)
 
     def _cartesian_product(self, left_type, right_type):
         """Makes cartesiam product of left_type x right_type
@@ -123,9 +231,148 @@ class Manager(MergeAbstract):
         """
         (left_type, right_type) = (type(merge_from), type(merge_to))
         strategy = self.get_strategy(left_type, right_type)
-        return self._cast(strategy(merge_from, merge_to))
+        return self.cast(strategy(merge_from, merge_to))
+
+    def decompose(self, merge_from=None, merge_to=None):
+        """Splits merge of given instances into child merges using strategy
+        registered for their types (see MergeAbstract.decompose).
+        Merged instance is built by calling build with list of results
+        of child merges and casting it (see cast).
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: tuple | None -- (list of arguments for child merges, build)
+                  or None if strategy can not be decomposed
+        :raises: TypeError
+        """
+        strategy = self.get_strategy(type(merge_from), type(merge_to))
+        return self._split(strategy, merge_from, merge_to)
+
+    def _split(self, strategy, merge_from, merge_to):
+        """Splits merge of given instances using given strategy
+        (see decompose)
+
+        Arguments:
+            :param    strategy: strategy registered for types of instances
+            :type     strategy: callable
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: tuple | None
+        """
+        decompose = getattr(strategy, 'decompose', None)
+        if decompose is None:
+            return None
+        return decompose(merge_from, merge_to)
+
+    def merge_into(self, target=None, source=None):
+        """Merges source into target updating target in place where merge
+        strategy allows it (see MergeAbstract.update). Updated target
+        is returned as it is, without casting it with factories.
+
+        Arguments:
+            :param    target: merge to this object
+            :type     target: object
+            :param    source: merge from this object
+            :type     source: object
+        :returns: object -- target or new merged instance
+        :raises: TypeError
+        """
+        strategy = self.get_strategy(type(source), type(target))
+        update = getattr(strategy, 'update', None)
+        if update is None:
+            return self.cast(strategy(source, target))
+        merged = update(source, target)
+        if merged is target:
+            return merged
+        return self.cast(merged)
+
+    def merge_many(self, *objs):
+        """Merges all given objects at once. Gives the same result as
+        reducing them with the manager (objects on the left take precedence)
+        but values are grouped across all objects and merged only once.
+        Falls back to reducing objects when their types require different
+        strategies.
+
+        Arguments:
+            :param    *objs: objects to be merged
+            :type     *objs: list
+        :returns: object
+        :raises: TypeError
+        """
+        if len(objs) < 3:
+            return self(*objs)
+        left_type = type(objs[0])
+        try:
+            strategy = self.get_strategy(left_type, type(objs[1]))
+            merge_many = getattr(strategy, 'merge_many', None)
+            if merge_many is not None and any(self.get_strategy(left_type, \
+                    type(obj)) is not strategy for obj in objs[2:]):
+                merge_many = None
+        except TypeError:
+            # types may still be merged once previous results are cast
+            merge_many = None
+        if merge_many is None:
+            return functools.reduce(self, objs)
+        return self.cast(merge_many(objs))
+
+    def merge_parallel(self, merge_from=None, merge_to=None, workers=None, \
+            threshold=1000):
+        """Merges given instances merge_from and merge_to spreading child
+        merges of top level objects across pool of processes
+        (see pycomber.parallel.merge_parallel). Objects with less child
+        merges than threshold are merged in current process.
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+            :param    workers: number of worker processes
+            :type     workers: int
+            :param    threshold: minimal number of child merges to use
+                                 pool of processes for
+            :type     threshold: int
+        :returns: object
+        :raises: TypeError
+        """
+        # concurrent.futures is not available in Python 2
+        from pycomber.parallel import merge_parallel
+        return merge_parallel(self, merge_from, merge_to, workers, threshold)
 
-    def _cast(self, var):
+    def merge_async(self, merge_from=None, merge_to=None, nodes=1000, \
+            interval=None, executor=None, threshold=None):
+        """Returns coroutine that merges given instances merge_from
+        and merge_to giving control back to event loop every given number
+        of merged nodes or microseconds
+        (see pycomber.asynchronous.merge_async)
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+            :param    nodes: number of nodes merged between yields
+            :type     nodes: int
+            :param    interval: time in microseconds between yields
+            :type     interval: int
+            :param    executor: executor to merge large objects with
+            :type     executor: concurrent.futures.Executor
+            :param    threshold: minimal number of child merges on top level
+                                 to use executor for
+            :type     threshold: int
+        :returns: coroutine
+        """
+        # coroutines can not be even compiled by Python 2
+        from pycomber.asynchronous import merge_async
+        return merge_async(self, merge_from, merge_to, nodes, interval, \
+                executor, threshold)
+
+    def cast(self, var):
         """Casts given variable using predefined factory (if available)
 
         Arguments:
@@ -133,7 +380,124 @@ class Manager(MergeAbstract):
             :type     var: type
         :returns: object
         """
-        try:
-            return self.get_factory(type(var))(var)
-        except KeyError:
+        factory = self._table.find_factory(type(var))
+        if factory is None:
             return var
+        return factory(var)
+
+
+class IterativeManager(Manager):
+    """Merge manager that traverses merged objects using explicit stack
+    instead of recursive calls through strategies (see Traversal).
+    Allows to merge objects nested deeper than recursion limit.
+    Strategies that can not be decomposed are called directly, as well as
+    strategies merging containers of leaf values as a whole, so cost
+    per merged node stays close to that of Manager."""
+
+    def __call__(self, merge_from=None, merge_to=None):
+        """Merges given instances merge_from and merge_to.
+        Creates new instances during merge process.
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object
+        :raises: TypeError
+        """
+        parts = self.decompose(merge_from, merge_to)
+        if parts is None:
+            return Manager.__call__(self, merge_from, merge_to)
+        traversal = Traversal(self, *parts)
+        traversal.run()
+        return traversal.value
+
+
+class Traversal(object):
+    """Merge of decomposed objects (see Manager.decompose) that traverses
+    their children using explicit stack instead of recursive calls
+    through strategies. Can be run in steps of given number of child merges
+    (e.g. to give control back to event loop in between)."""
+
+    # marker of merge that has been split into child merges
+    _descended = object()
+
+    def __init__(self, manager, children, build):
+        """Object initialization
+
+        Arguments:
+            :param    manager: merge manager instance
+            :type     manager: pycomber.manager.Manager
+            :param    children: arguments for child merges
+            :type     children: list
+            :param    build: callable that builds merged instance
+                             from list of merged children
+            :type     build: callable
+        """
+        self._manager = manager
+        self._stack = [(iter(children), build, [])]
+        self.value = self._descended
+
+    def run(self, nodes=None):
+        """Performs given number of child merges (all of them if None)
+
+        Arguments:
+            :param    nodes: number of child merges to perform
+            :type     nodes: int
+        :returns: bool -- whether merge is finished (merged instance
+                  is kept in value attribute)
+        :raises: TypeError
+        """
+        (enter, cast, descended) = (self._enter, self._manager.cast, \
+                self._descended)
+        stack = self._stack
+        value = self.value
+        while stack:
+            (children, build, values) = stack[-1]
+            if value is not descended:
+                values.append(value)
+                value = descended
+            if nodes is not None and nodes <= 0:
+                break
+            merged = len(values)
+            for args in itertools.islice(children, nodes):
+                value = enter(*args)
+                if value is descended:
+                    break
+                values.append(value)
+            else:
+                if nodes is not None:
+                    nodes -= len(values) - merged
+                    if nodes <= 0:
+                        # children may be left, so they are merged later
+                        value = descended
+                        continue
+                stack.pop()
+                value = cast(build(values))
+                continue
+            if nodes is not None:
+                nodes -= len(values) - merged + 1
+        self.value = value
+        return not stack
+
+    def _enter(self, merge_from=None, merge_to=None):
+        """Starts merge of given instances. Merges them if strategy can
+        not be decomposed, otherwise pushes child merges on the stack.
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object -- merged instance or marker of descending
+        :raises: TypeError
+        """
+        manager = self._manager
+        strategy = manager.get_strategy(type(merge_from), type(merge_to))
+        parts = manager._split(strategy, merge_from, merge_to)
+        if parts is None:
+            return manager.cast(strategy(merge_from, merge_to))
+        (children, build) = parts
+        self._stack.append((iter(children), build, []))
+        return self._descended
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from pycomber.fingerprint import fingerprint
+
+
+class MergeCache(object):
+    """Merges objects using given manager and remembers merge results
+    (least recently used ones are evicted). Cached results are shared
+    between callers, so manager must cast merged dicts, lists and sets
+    to immutable types (see pycomber.configuration.ConfigurationImmutable).
+
+    Objects are looked up by their structural fingerprints, so equal
+    objects share merge results."""
+
+    def __init__(self, manager, maxsize=128, subtrees=False):
+        """Object initialization
+
+        Arguments:
+            :param    manager: merge manager instance
+            :type     manager: pycomber.manager.Manager
+            :param    maxsize: maximal number of cached merge results
+            :type     maxsize: int
+            :param    subtrees: whether to cache merge results of children
+                                of merged objects as well
+            :type     subtrees: bool
+        :raises: TypeError
+        """
+        for base_type in (dict, list, set):
+            if manager.freeze().find_factory(base_type) is None:
+                raise TypeError("Manager does not cast %s to immutable type" \
+                        % base_type)
+        self._manager = manager
+        self._maxsize = maxsize
+        self._subtrees = subtrees
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, merge_from=None, merge_to=None):
+        """Merges given instances merge_from and merge_to
+        or returns result of previous merge of equal instances
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object
+        :raises: TypeError
+        """
+        return self._lookup({}, merge_from, merge_to)
+
+    def _lookup(self, cache, merge_from=None, merge_to=None):
+        """Merges given instances or returns result of previous merge
+        of equal instances. Objects are looked up by strict fingerprints,
+        so equal leaves of different types do not share merge results.
+
+        Arguments:
+            :param    cache: fingerprints of unhashable values by their ids,
+                             shared by lookups of all subtrees of a merge
+                             (see pycomber.fingerprint.fingerprint)
+            :type     cache: dict
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object
+        :raises: TypeError
+        """
+        key = (fingerprint(merge_from, cache, True), \
+                fingerprint(merge_to, cache, True))
+        if key in self._cache:
+            self._hits += 1
+            # OrderedDict.move_to_end is not available in Python 2
+            value = self._cache.pop(key)
+            self._cache[key] = value
+            return value
+        self._misses += 1
+        value = self._merge(cache, merge_from, merge_to)
+        self._cache[key] = value
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+        return value
+
+    def _merge(self, cache, merge_from, merge_to):
+        """Merges given instances. Merges of children go through the cache
+        if subtrees are cached and strategy can be decomposed.
+
+        Arguments:
+            :param    cache: fingerprints of unhashable values by their ids
+            :type     cache: dict
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object
+        :raises: TypeError
+        """
+        parts = None
+        if self._subtrees:
+            parts = self._manager.decompose(merge_from, merge_to)
+        if parts is None:
+            return self._manager(merge_from, merge_to)
+        (children, build) = parts
+        return self._manager.cast(build([self._lookup(cache, *args) \
+                for args in children]))
+
+    def info(self):
+        """Returns statistics of the cache
+
+        :returns: dict -- hits, misses, evictions, size and maxsize
+        """
+        return {'hits': self._hits, 'misses': self._misses, \
+                'evictions': self._evictions, 'size': len(self._cache), \
+                'maxsize': self._maxsize}
+
+    def clear(self):
+        """Removes all cached merge results and resets statistics
+
+        :returns: None
+        """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
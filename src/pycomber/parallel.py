@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+# manager used by worker processes
+_manager = None
+
+
+def _initialize(manager):
+    """Sets manager used by worker process
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+    :returns: None
+    """
+    global _manager
+    _manager = manager
+
+
+def _merge(args):
+    """Merges given pair of objects in worker process
+
+    Arguments:
+        :param    args: arguments for merge manager
+        :type     args: tuple
+    :returns: object
+    """
+    return _manager(*args)
+
+
+def merge_parallel(manager, merge_from=None, merge_to=None, workers=None, \
+        threshold=1000):
+    """Merges given instances merge_from and merge_to. Child merges
+    of top level objects (e.g. values of dict keys) are spread across
+    pool of processes. Manager (with its strategies and factories)
+    and merged objects must be picklable.
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    merge_from: merge from this object
+        :type     merge_from: object
+        :param    merge_to: merge to this object
+        :type     merge_to: object
+        :param    workers: number of worker processes (defaults to
+                           number of CPUs)
+        :type     workers: int
+        :param    threshold: minimal number of child merges to use
+                             pool of processes for
+        :type     threshold: int
+    :returns: object
+    :raises: TypeError
+    """
+    parts = manager.decompose(merge_from, merge_to)
+    if parts is None or len(parts[0]) < threshold:
+        return manager(merge_from, merge_to)
+    (children, build) = parts
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_initialize, \
+            initargs=(manager,)) as pool:
+        values = list(pool.map(_merge, children, \
+                chunksize=max(1, len(children) // (workers * 4))))
+    return manager.cast(build(values))
@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Python 2to3 support
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
+
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+# marker of missing key
+_missing = object()
+
+
+def _popcount(value):
+    """Returns number of bits set in given integer
+
+    Arguments:
+        :param    value: integer to count bits of
+        :type     value: int
+    :returns: int
+    """
+    return bin(value).count('1')
+
+
+class _BitmapNode(object):
+    """Node of hash array mapped trie. Holds up to 32 entries, each being
+    either leaf (tuple of hash, key and value) or another node."""
+
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def get(self, key_hash, shift, key):
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return _missing
+        entry = self.entries[_popcount(self.bitmap & (bit - 1))]
+        if isinstance(entry, tuple):
+            if entry[0] == key_hash and entry[1] == key:
+                return entry[2]
+            return _missing
+        return entry.get(key_hash, shift + _BITS, key)
+
+    def assoc(self, key_hash, shift, key, value):
+        """Returns node with given key set to given value and flag
+        telling whether new key has been added"""
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        idx = _popcount(self.bitmap & (bit - 1))
+        if not self.bitmap & bit:
+            return (_BitmapNode(self.bitmap | bit, self.entries[:idx] + \
+                    ((key_hash, key, value),) + self.entries[idx:]), True)
+        entry = self.entries[idx]
+        if isinstance(entry, tuple):
+            if entry[0] == key_hash and entry[1] == key:
+                if entry[2] is value:
+                    return (self, False)
+                (node, added) = ((key_hash, key, value), False)
+            else:
+                (node, added) = (_join(shift + _BITS, entry, \
+                        (key_hash, key, value)), True)
+        else:
+            (node, added) = entry.assoc(key_hash, shift + _BITS, key, value)
+            if node is entry:
+                return (self, False)
+        return (_BitmapNode(self.bitmap, self.entries[:idx] + (node,) + \
+                self.entries[idx + 1:]), added)
+
+    def dissoc(self, key_hash, shift, key):
+        """Returns node without given key or None if node is empty"""
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        idx = _popcount(self.bitmap & (bit - 1))
+        entry = self.entries[idx]
+        if isinstance(entry, tuple):
+            if entry[0] != key_hash or entry[1] != key:
+                return self
+            node = None
+        else:
+            node = entry.dissoc(key_hash, shift + _BITS, key)
+            if node is entry:
+                return self
+        if node is not None:
+            return _BitmapNode(self.bitmap, self.entries[:idx] + (node,) + \
+                    self.entries[idx + 1:])
+        if self.bitmap == bit:
+            return None
+        return _BitmapNode(self.bitmap ^ bit, self.entries[:idx] + \
+                self.entries[idx + 1:])
+
+    def leaves(self):
+        for entry in self.entries:
+            if isinstance(entry, tuple):
+                yield entry
+            else:
+                for leaf in entry.leaves():
+                    yield leaf
+
+
+class _CollisionNode(object):
+    """Node of hash array mapped trie holding leaves with the same hash"""
+
+    __slots__ = ('key_hash', 'entries')
+
+    def __init__(self, key_hash, entries):
+        self.key_hash = key_hash
+        self.entries = entries
+
+    def get(self, key_hash, shift, key):
+        if key_hash == self.key_hash:
+            for entry in self.entries:
+                if entry[1] == key:
+                    return entry[2]
+        return _missing
+
+    def assoc(self, key_hash, shift, key, value):
+        if key_hash != self.key_hash:
+            node = _BitmapNode(1 << ((self.key_hash >> shift) & _MASK), \
+                    (self,))
+            return node.assoc(key_hash, shift, key, value)
+        for (idx, entry) in enumerate(self.entries):
+            if entry[1] == key:
+                if entry[2] is value:
+                    return (self, False)
+                return (_CollisionNode(key_hash, self.entries[:idx] + \
+                        ((key_hash, key, value),) + \
+                        self.entries[idx + 1:]), False)
+        return (_CollisionNode(key_hash, self.entries + \
+                ((key_hash, key, value),)), True)
+
+    def dissoc(self, key_hash, shift, key):
+        if key_hash != self.key_hash:
+            return self
+        entries = tuple(entry for entry in self.entries if entry[1] != key)
+        if len(entries) == len(self.entries):
+            return self
+        if len(entries) == 1:
+            return _BitmapNode(1 << ((key_hash >> shift) & _MASK), entries)
+        return _CollisionNode(key_hash, entries)
+
+    def leaves(self):
+        return iter(self.entries)
+
+
+def _join(shift, leaf, other):
+    """Returns node holding both given leaves
+
+    Arguments:
+        :param    shift: number of hash bits consumed by parent nodes
+        :type     shift: int
+        :param    leaf: leaf (tuple of hash, key and value)
+        :type     leaf: tuple
+        :param    other: leaf (tuple of hash, key and value)
+        :type     other: tuple
+    :returns: _BitmapNode | _CollisionNode
+    """
+    if leaf[0] == other[0]:
+        return _CollisionNode(leaf[0], (leaf, other))
+    node = _BitmapNode(1 << ((leaf[0] >> shift) & _MASK), (leaf,))
+    return node.assoc(other[0], shift, other[1], other[2])[0]
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class PersistentMap(Mapping):
+    """Immutable mapping implemented as hash array mapped trie.
+    Updated versions (see assoc and dissoc) share almost all memory
+    with the original one and are created in O(log n) time.
+    """
+
+    __slots__ = ('_root', '_len', '_hash')
+
+    def __init__(self, inner=()):
+        """Object initialization
+
+        Arguments:
+            :param    inner: mapping or iterable of (key, value) pairs
+            :type     inner: dict | iterable
+        """
+        if isinstance(inner, Mapping):
+            inner = inner.items()
+        (root, length) = (_EMPTY_NODE, 0)
+        for (key, value) in inner:
+            (root, added) = root.assoc(hash(key), 0, key, value)
+            length += added
+        self._root = root
+        self._len = length
+        self._hash = None
+
+    @classmethod
+    def _make(cls, root, length):
+        """Creates map from given root node"""
+        out = cls.__new__(cls)
+        out._root = root
+        out._len = length
+        out._hash = None
+        return out
+
+    def assoc(self, key, value):
+        """Returns map with given key set to given value
+
+        Arguments:
+            :param    key: key to be set
+            :type     key: object
+            :param    value: value to be set
+            :type     value: object
+        :returns: PersistentMap
+        """
+        (root, added) = self._root.assoc(hash(key), 0, key, value)
+        if root is self._root:
+            return self
+        return self._make(root, self._len + added)
+
+    def dissoc(self, key):
+        """Returns map without given key
+
+        Arguments:
+            :param    key: key to be removed
+            :type     key: object
+        :returns: PersistentMap
+        """
+        root = self._root.dissoc(hash(key), 0, key)
+        if root is self._root:
+            return self
+        return self._make(root or _EMPTY_NODE, self._len - 1)
+
+    def __getitem__(self, key):
+        value = self._root.get(hash(key), 0, key)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._root.get(hash(key), 0, key) is not _missing
+
+    def __iter__(self):
+        for leaf in self._root.leaves():
+            yield leaf[1]
+
+    def items(self):
+        return [(leaf[1], leaf[2]) for leaf in self._root.leaves()]
+
+    def __len__(self):
+        return self._len
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, PersistentMap) and self._hash is not None and \
+                other._hash is not None and self._hash != other._hash:
+            return False
+        return Mapping.__eq__(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, dict(self.items()))
+
+
+class PersistentVector(Sequence):
+    """Immutable sequence implemented as trie of 32-element nodes.
+    Updated versions (see append and assoc) share almost all memory
+    with the original one and are created in O(log n) time.
+    """
+
+    __slots__ = ('_count', '_shift', '_root', '_tail', '_hash')
+
+    def __init__(self, inner=()):
+        """Object initialization
+
+        Arguments:
+            :param    inner: initial items
+            :type     inner: iterable
+        """
+        (self._count, self._shift, self._root, self._tail) = (0, _BITS, (), ())
+        self._hash = None
+        vector = self
+        for item in inner:
+            vector = vector.append(item)
+        (self._count, self._shift, self._root, self._tail) = (vector._count, \
+                vector._shift, vector._root, vector._tail)
+
+    @classmethod
+    def _make(cls, count, shift, root, tail):
+        """Creates vector from given trie"""
+        out = cls.__new__(cls)
+        (out._count, out._shift, out._root, out._tail) = \
+                (count, shift, root, tail)
+        out._hash = None
+        return out
+
+    def _tailoff(self):
+        """Returns index of first item kept in tail"""
+        return self._count - len(self._tail)
+
+    def _leaf(self, idx):
+        """Returns leaf node holding item with given index"""
+        if idx >= self._tailoff():
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(idx >> level) & _MASK]
+            level -= _BITS
+        return node
+
+    def append(self, value):
+        """Returns vector with given value appended
+
+        Arguments:
+            :param    value: value to be appended
+            :type     value: object
+        :returns: PersistentVector
+        """
+        if len(self._tail) < _WIDTH:
+            return self._make(self._count + 1, self._shift, self._root, \
+                    self._tail + (value,))
+        if (self._count >> _BITS) > (1 << self._shift):
+            return self._make(self._count + 1, self._shift + _BITS, \
+                    (self._root, self._path(self._shift, self._tail)), \
+                    (value,))
+        return self._make(self._count + 1, self._shift, \
+                self._push_tail(self._shift, self._root, self._tail), (value,))
+
+    def _push_tail(self, level, parent, tail):
+        """Returns copy of parent node with given tail node pushed into it"""
+        idx = ((self._count - 1) >> level) & _MASK
+        if level == _BITS:
+            node = tail
+        elif idx < len(parent):
+            node = self._push_tail(level - _BITS, parent[idx], tail)
+        else:
+            node = self._path(level - _BITS, tail)
+        return parent[:idx] + (node,) + parent[idx + 1:]
+
+    def _path(self, level, node):
+        """Returns branch of given height leading to given node"""
+        while level > 0:
+            node = (node,)
+            level -= _BITS
+        return node
+
+    def assoc(self, idx, value):
+        """Returns vector with item at given index set to given value
+
+        Arguments:
+            :param    idx: index of item (equal to length to append)
+            :type     idx: int
+            :param    value: value to be set
+            :type     value: object
+        :returns: PersistentVector
+        :raises: IndexError
+        """
+        if idx < 0:
+            idx += self._count
+        if idx == self._count:
+            return self.append(value)
+        if not 0 <= idx < self._count:
+            raise IndexError(idx)
+        if idx >= self._tailoff():
+            pos = idx & _MASK
+            return self._make(self._count, self._shift, self._root, \
+                    self._tail[:pos] + (value,) + self._tail[pos + 1:])
+        return self._make(self._count, self._shift, \
+                self._assoc(self._shift, self._root, idx, value), self._tail)
+
+    def _assoc(self, level, node, idx, value):
+        """Returns copy of given node with item at given index replaced"""
+        if level == 0:
+            pos = idx & _MASK
+            return node[:pos] + (value,) + node[pos + 1:]
+        pos = (idx >> level) & _MASK
+        return node[:pos] + (self._assoc(level - _BITS, node[pos], idx, \
+                value),) + node[pos + 1:]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return PersistentVector(self[i] for i in \
+                    range(*idx.indices(self._count)))
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError(idx)
+        return self._leaf(idx)[idx & _MASK]
+
+    def __iter__(self):
+        for start in range(0, self._tailoff(), _WIDTH):
+            for item in self._leaf(start):
+                yield item
+        for item in self._tail:
+            yield item
+
+    def __len__(self):
+        return self._count
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, (PersistentVector, list, tuple)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if isinstance(other, PersistentVector) and self._hash is not None \
+                and other._hash is not None and self._hash != other._hash:
+            return False
+        return all(a == b for (a, b) in zip(self, other))
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self))
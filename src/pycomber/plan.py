@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+class MergePlan(object):
+    """Merge function specialized for layout of types of sample objects.
+
+    Strategies and factories for every pair of types found in samples are
+    resolved once. Objects with pairs of types not found in samples are
+    merged by the manager."""
+
+    def __init__(self, manager, sample_left=None, sample_right=None):
+        """Object initialization. Merges samples to learn layout of types
+
+        Arguments:
+            :param    manager: merge manager instance
+            :type     manager: pycomber.manager.Manager
+            :param    sample_left: sample object to merge from
+            :type     sample_left: object
+            :param    sample_right: sample object to merge to
+            :type     sample_right: object
+        :raises: TypeError
+        """
+        self._manager = manager
+        self._plan = {}
+        self._learn(sample_left, sample_right)
+
+    def _learn(self, merge_from=None, merge_to=None):
+        """Merges given instances and records resolved strategy,
+        type of merged instance and factory for every pair of types
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object
+        :raises: TypeError
+        """
+        key = (type(merge_from), type(merge_to))
+        strategy = self._manager.get_strategy(*key)
+        parts = self._manager.decompose(merge_from, merge_to)
+        if parts is None:
+            decompose = None
+            value = strategy(merge_from, merge_to)
+        else:
+            decompose = strategy.decompose
+            (children, build) = parts
+            value = build([self._learn(*args) for args in children])
+        factory = self._manager.find_factory(type(value))
+        self._plan.setdefault(key, (strategy, decompose, type(value), factory))
+        if factory is None:
+            return value
+        return factory(value)
+
+    def __call__(self, merge_from=None, merge_to=None):
+        """Merges given instances merge_from and merge_to.
+        Creates new instances during merge process.
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object
+        :raises: TypeError
+        """
+        node = self._plan.get((type(merge_from), type(merge_to)))
+        if node is None:
+            return self._manager(merge_from, merge_to)
+        (strategy, decompose, result_type, factory) = node
+        parts = None
+        if decompose is not None:
+            parts = decompose(merge_from, merge_to)
+        if parts is None:
+            value = strategy(merge_from, merge_to)
+        else:
+            (children, build) = parts
+            value = build([self(*args) for args in children])
+        if type(value) is not result_type:
+            return self._manager.cast(value)
+        if factory is None:
+            return value
+        return factory(value)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import functools
+import time
+from pycomber.dispatch import DispatchTable
+
+# Python 2to3 support
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+class Profile(object):
+    """Collects number of calls, cumulative time and number of merged nodes
+    per pair of merged types and number of calls and cumulative time
+    per factory.
+
+    Time and nodes are inclusive (contain nested merges), nested merges
+    of the same pair of types are counted once. Merges split into merges
+    of their children (see pycomber.manager.Manager.decompose) are counted
+    as one call and one node, and only the split itself is timed.
+    Profile is not thread-safe.
+    """
+
+    def __init__(self, hook=None):
+        """Object initialization
+
+        Arguments:
+            :param    hook: callable called after every measured call
+                            with kind ("strategy" or "factory"), key
+                            ((left_type, right_type) or type) and time
+                            of the call in seconds
+            :type     hook: callable
+        """
+        self._hook = hook
+        self.reset()
+
+    def reset(self):
+        """Removes all collected statistics
+
+        :returns: None
+        """
+        self._strategies = {}
+        self._factories = {}
+        self._active = {}
+        self._nodes = 0
+
+    def measure_strategy(self, key, strategy, merge_from, merge_to):
+        """Calls given strategy measuring it under given pair of types
+
+        Arguments:
+            :param    key: pair of merged types (left_type, right_type)
+            :type     key: tuple
+            :param    strategy: strategy to be called
+            :type     strategy: callable
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object -- result of strategy
+        """
+        stats = self._strategies.get(key)
+        if stats is None:
+            stats = self._strategies[key] = [0, 0.0, 0]
+        depth = self._active.get(key, 0)
+        self._active[key] = depth + 1
+        nodes = self._nodes
+        self._nodes += 1
+        start = _timer()
+        try:
+            return strategy(merge_from, merge_to)
+        finally:
+            elapsed = _timer() - start
+            self._active[key] = depth
+            stats[0] += 1
+            if not depth:
+                stats[1] += elapsed
+                stats[2] += self._nodes - nodes
+            if self._hook is not None:
+                self._hook('strategy', key, elapsed)
+
+    def measure_split(self, key, decompose, merge_from, merge_to):
+        """Calls given decompose method of strategy measuring it under given
+        pair of types. Nothing is recorded if merge is not split, as it is
+        measured when strategy is called.
+
+        Arguments:
+            :param    key: pair of merged types (left_type, right_type)
+            :type     key: tuple
+            :param    decompose: decompose method to be called
+            :type     decompose: callable
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: tuple | None -- result of decompose
+        """
+        start = _timer()
+        parts = decompose(merge_from, merge_to)
+        elapsed = _timer() - start
+        if parts is None:
+            return parts
+        stats = self._strategies.get(key)
+        if stats is None:
+            stats = self._strategies[key] = [0, 0.0, 0]
+        self._nodes += 1
+        stats[0] += 1
+        if not self._active.get(key, 0):
+            stats[1] += elapsed
+            stats[2] += 1
+        if self._hook is not None:
+            self._hook('strategy', key, elapsed)
+        return parts
+
+    def measure_factory(self, key, factory, var):
+        """Calls given factory measuring it under given type
+
+        Arguments:
+            :param    key: casted type
+            :type     key: type
+            :param    factory: factory to be called
+            :type     factory: callable
+            :param    var: variable to cast
+            :type     var: object
+        :returns: object -- result of factory
+        """
+        stats = self._factories.get(key)
+        if stats is None:
+            stats = self._factories[key] = [0, 0.0]
+        start = _timer()
+        try:
+            return factory(var)
+        finally:
+            elapsed = _timer() - start
+            stats[0] += 1
+            stats[1] += elapsed
+            if self._hook is not None:
+                self._hook('factory', key, elapsed)
+
+    def as_dict(self):
+        """Returns collected statistics
+
+        :returns: dict -- {"strategies": {(left_type, right_type):
+                  {"calls": int, "time": float, "nodes": int}},
+                  "factories": {type: {"calls": int, "time": float}}}
+        """
+        return {
+            'strategies': dict((key, {'calls': s[0], 'time': s[1], \
+                    'nodes': s[2]}) for (key, s) in self._strategies.items()),
+            'factories': dict((key, {'calls': s[0], 'time': s[1]}) \
+                    for (key, s) in self._factories.items()),
+        }
+
+
+class ProfiledStrategy(object):
+    """Wrapper of strategy that measures its calls and splits
+    (see Profile.measure_split). Other attributes (e.g. update) are taken
+    from wrapped strategy as they are."""
+
+    def __init__(self, strategy, key, profile):
+        """Object initialization
+
+        Arguments:
+            :param    strategy: wrapped strategy
+            :type     strategy: callable
+            :param    key: pair of merged types (left_type, right_type)
+            :type     key: tuple
+            :param    profile: profile to record calls in
+            :type     profile: Profile
+        """
+        self._strategy = strategy
+        self._key = key
+        self._profile = profile
+
+    def __call__(self, merge_from, merge_to):
+        return self._profile.measure_strategy(self._key, self._strategy, \
+                merge_from, merge_to)
+
+    def __getattr__(self, name):
+        if name == '_strategy':
+            raise AttributeError(name)
+        value = getattr(self._strategy, name)
+        if name == 'decompose' and value is not None:
+            return functools.partial(self._profile.measure_split, \
+                    self._key, value)
+        return value
+
+
+class ProfilingTable(DispatchTable):
+    """Dispatch table that returns strategies and factories wrapped
+    so their calls are recorded in given profile"""
+
+    def __init__(self, table, profile):
+        """Object initialization
+
+        Arguments:
+            :param    table: table with strategies and factories
+            :type     table: pycomber.dispatch.DispatchTable
+            :param    profile: profile to record calls in
+            :type     profile: Profile
+        """
+        DispatchTable.__init__(self, table._strategies, table._factories)
+        self.profile = profile
+        self._wrapped = {}
+        self._wrapped_factories = {}
+
+    def with_strategy(self, strategy, pairs):
+        return ProfilingTable(DispatchTable.with_strategy(self, strategy, \
+                pairs), self.profile)
+
+    def with_factory(self, base_type, factory):
+        return ProfilingTable(DispatchTable.with_factory(self, base_type, \
+                factory), self.profile)
+
+    def unwrap(self):
+        """Returns table with the same strategies and factories
+        that does not record their calls
+
+        :returns: pycomber.dispatch.DispatchTable
+        """
+        return DispatchTable(self._strategies, self._factories)
+
+    def leaf_types(self):
+        """Returns no types, so merges of all values are recorded
+
+        :returns: frozenset
+        """
+        return frozenset()
+
+    def get_strategy(self, left_type, right_type):
+        key = (left_type, right_type)
+        try:
+            return self._wrapped[key]
+        except KeyError:
+            pass
+        strategy = ProfiledStrategy(DispatchTable.get_strategy(self, \
+                left_type, right_type), key, self.profile)
+        self._wrapped[key] = strategy
+        return strategy
+
+    def find_factory(self, base_type):
+        try:
+            return self._wrapped_factories[base_type]
+        except KeyError:
+            pass
+        factory = DispatchTable.find_factory(self, base_type)
+        if factory is not None:
+            factory = ProfiledFactory(factory, base_type, self.profile)
+        self._wrapped_factories[base_type] = factory
+        return factory
+
+
+class ProfiledFactory(object):
+    """Wrapper of factory that measures its calls"""
+
+    def __init__(self, factory, key, profile):
+        """Object initialization
+
+        Arguments:
+            :param    factory: wrapped factory
+            :type     factory: callable
+            :param    key: casted type
+            :type     key: type
+            :param    profile: profile to record calls in
+            :type     profile: Profile
+        """
+        self._factory = factory
+        self._key = key
+        self._profile = profile
+
+    def __call__(self, var):
+        return self._profile.measure_factory(self._key, self._factory, var)
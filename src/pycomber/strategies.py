@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import copy
+import functools
 import itertools
 import operator
 import sys
+from pycomber.fingerprint import fingerprint
+from pycomber.persistent import PersistentMap, PersistentVector
 
 
 # Python 2to3 support
@@ -10,6 +14,10 @@ try:
     mapper = itertools.imap
 except AttributeError:
     mapper = map
+try:
+    from collections.abc import MutableMapping, MutableSequence, MutableSet
+except ImportError:
+    from collections import MutableMapping, MutableSequence, MutableSet
 
 
 class MergeAbstract(object):
@@ -37,11 +45,81 @@ class MergeAbstract(object):
         """
         raise NotImplementedError("Method __call__ is not implemented")
 
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given objects into merges of their children.
+        Allows to merge objects without recursive calls to the manager.
+        Strategies that can not be split (or merge given objects faster
+        as a whole) return None.
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: tuple | None -- pair of list of arguments for child merges
+                                  and callable that builds merged instance
+                                  from list of merged children
+        """
+        return None
+
+    def update(self, merge_from, merge_to):
+        """Merges given objects updating merge_to in place.
+        By default merge_to is left intact and new merged instance is returned
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object -- merge_to or new merged instance
+        """
+        return self(merge_from, merge_to)
+
+    def _copy(self, value):
+        """Returns value of merge_from to be put into merge_to by in-place
+        merge (see update). Mutable containers are merged into their emptied
+        shallow copies (which keep their state, e.g. default_factory
+        of defaultdict), so later in-place merges into merge_to do not
+        modify merge_from. Containers that can not be copied and emptied
+        are merged by the manager.
+
+        Arguments:
+            :param    value: value of merge_from
+            :type     value: object
+        :returns: object
+        """
+        if isinstance(value, (MutableMapping, MutableSequence, MutableSet)):
+            try:
+                empty = copy.copy(value)
+                empty.clear()
+            except (TypeError, AttributeError, copy.Error):
+                return self._manager(value)
+            return self._manager.merge_into(empty, value)
+        return self._manager(value)
+
+    def _leaves_only(self, *containers):
+        """Tells whether given containers hold only values that manager
+        returns unchanged (see pycomber.manager.Manager.leaf_types),
+        so they do not have to be merged one by one
+
+        Arguments:
+            :param    *containers: containers to be checked
+            :type     *containers: list
+        :returns: bool
+        """
+        leaf_types = self._manager.leaf_types()
+        for container in containers:
+            if not leaf_types.issuperset(mapper(type, container)):
+                return False
+        return True
+
 
 class MergeList(MergeAbstract):
     """Merger for list type. Joins two list and eliminates duplicates
     Recursively applies merge to all values"""
 
+    lazy = False
+
     def __call__(self, merge_from, merge_to):
         """Merges given objects
 
@@ -50,10 +128,79 @@ class MergeList(MergeAbstract):
             :type     merge_from: object
             :param    merge_to: merge to this object
             :type     merge_to: object
-        :returns: object -- merged instances
+        :returns: list | iterator -- merged instances
         """
-        return mapper(self._manager, self._unique(sorted(itertools.chain(\
-                                merge_from, merge_to), key=self._cmp_key)))
+        if not self.lazy and self._leaves_only(merge_from, merge_to):
+            return list(self._unique(sorted(itertools.chain(merge_from, \
+                    merge_to), key=self._cmp_key)))
+        return self._merged(itertools.chain(merge_from, merge_to))
+
+    def merge_many(self, values):
+        """Merges all given lists at once
+
+        Arguments:
+            :param    values: lists to be merged
+            :type     values: list
+        :returns: list | iterator -- merged instances
+        """
+        return self._merged(itertools.chain(*values))
+
+    def _merged(self, items):
+        """Merges unique values from given iterable
+
+        Arguments:
+            :param    items: values to be merged
+            :type     items: iterable
+        :returns: list | iterator -- merged instances
+        """
+        values = mapper(self._manager, self._unique(sorted(items, \
+                                                        key=self._cmp_key)))
+        if self.lazy:
+            return values
+        return list(values)
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given lists into merges of their unique values
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: tuple | None -- arguments for child merges and builder
+                  or None if lists hold only values that are not merged
+                  one by one (see __call__)
+        """
+        if not self.lazy and self._leaves_only(merge_from, merge_to):
+            return None
+        return ([(item,) for item in self._unique(sorted(itertools.chain(\
+                merge_from, merge_to), key=self._cmp_key))], \
+                iter if self.lazy else list)
+
+    def update(self, merge_from, merge_to):
+        """Merges given lists updating merge_to in place.
+        Appends values from merge_from missing in merge_to.
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merge_to
+        """
+        if self._leaves_only(merge_from, merge_to):
+            seen = set(merge_to)
+            merge_to.extend(item for item in merge_from \
+                    if item not in seen and not seen.add(item))
+            return merge_to
+        cache = {}
+        seen = set(fingerprint(item, cache) for item in merge_to)
+        for item in merge_from:
+            key = fingerprint(item, cache)
+            if key not in seen:
+                seen.add(key)
+                merge_to.append(self._copy(item))
+        return merge_to
 
     def _cmp_key(self, item):
         """Prepares key for comparison purposes.
@@ -84,30 +231,36 @@ class MergeList(MergeAbstract):
             pass
         return False
 
-    def _key_func(self, item):
-        """Function that fetches key for given item
+    def _key_func(self, item, cache=None):
+        """Function that fetches key for given item.
+        Equal items (including unhashable ones) get equal keys.
 
         Arguments:
-            :param    items: item to generate key for
-            :type     items: list
-        :returns: object
-        :raises: IndexError
+            :param    item: item to generate key for
+            :type     item: object
+            :param    cache: fingerprints of already seen unhashable items
+                             (see pycomber.fingerprint.fingerprint)
+            :type     cache: dict
+        :returns: object -- item itself or its structural fingerprint
+        :raises: TypeError
         """
-        try:
-            return hash(item)
-        except TypeError:
-            return frozenset(iter(item))
+        return fingerprint(item, cache)
 
     def _unique(self, iterable):
-        """Returns unique values from dict
+        """Returns unique values from iterable (first occurrences)
 
         Arguments:
             :param    iterable: iterable to remove duplicates from
             :type     iterable: iterable
         :returns: iterable
         :raises: TypeError"""
-        return mapper(next, mapper(operator.itemgetter(1), \
-                                itertools.groupby(iterable, self._key_func)))
+        seen = set()
+        cache = {}
+        for item in iterable:
+            key = self._key_func(item, cache)
+            if key not in seen:
+                seen.add(key)
+                yield item
 
 
 class MergeListOverride(MergeList):
@@ -126,6 +279,347 @@ class MergeListOverride(MergeList):
         """
         return MergeList.__call__(self, merge_from, [])
 
+    def decompose(self, merge_from, merge_to):
+        return MergeList.decompose(self, merge_from, [])
+
+    def update(self, merge_from, merge_to):
+        merge_to[:] = [self._copy(item) for item in \
+                self._unique(sorted(merge_from, key=self._cmp_key))]
+        return merge_to
+
+    def merge_many(self, values):
+        return MergeList.__call__(self, values[0], [])
+
+
+class MergeListStream(MergeList):
+    """Merger for list type. Joins two list and eliminates duplicates
+    Recursively applies merge to all values
+
+    Returns iterator that merges values while it is consumed, so merged list
+    is never kept in memory as a whole. Iterator can be consumed only once
+    and factories registered for list are not applied to it."""
+
+    lazy = True
+
+
+class MergeListStreamOverride(MergeListOverride):
+    """Merger for list type. Overrides merge_to with merge_from
+    Recursively applies merge to all values
+
+    Returns iterator that merges values while it is consumed
+    (see MergeListStream)."""
+
+    lazy = True
+
+
+class MergeListOrdered(MergeAbstract):
+    """Merger for list type. Joins two lists and eliminates duplicates
+    keeping order of first occurrences (items from merge_from go first).
+    Duplicates are found using hash of items (or their structural
+    fingerprint for unhashable items), so lists are not sorted.
+    Recursively applies merge to all values"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given lists
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merged instances
+        """
+        return [self._manager(item) for item in \
+                self._unique(itertools.chain(merge_from, merge_to))]
+
+    def merge_many(self, values):
+        """Merges all given lists at once
+
+        Arguments:
+            :param    values: lists to be merged
+            :type     values: list
+        :returns: list -- merged instances
+        """
+        return [self._manager(item) for item in \
+                self._unique(itertools.chain(*values))]
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given lists into merges of their unique values
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: tuple -- arguments for child merges and builder
+        """
+        return ([(item,) for item in \
+                self._unique(itertools.chain(merge_from, merge_to))], list)
+
+    def _unique(self, iterable):
+        """Returns unique values from iterable in order of first occurrence
+
+        Arguments:
+            :param    iterable: iterable to remove duplicates from
+            :type     iterable: iterable
+        :returns: list
+        """
+        seen = set()
+        cache = {}
+        out = []
+        for item in iterable:
+            key = fingerprint(item, cache)
+            if key not in seen:
+                seen.add(key)
+                out.append(item)
+        return out
+
+
+class MergeListOrderedOverride(MergeListOrdered):
+    """Merger for list type. Overrides merge_to with merge_from
+    keeping order of items. Recursively applies merge to all values"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given lists
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merged instances
+        """
+        return MergeListOrdered.__call__(self, merge_from, [])
+
+    def decompose(self, merge_from, merge_to):
+        return MergeListOrdered.decompose(self, merge_from, [])
+
+    def merge_many(self, values):
+        return MergeListOrdered.__call__(self, values[0], [])
+
+
+class MergeListPositional(MergeAbstract):
+    """Merger for list type. Merges items on the same positions
+    (item of merge_from into item of merge_to). Items of the longer list
+    that have no counterpart are shared with the result as they are.
+    Recursively applies merge to pairs of values"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given lists
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merged instances
+        """
+        out = list(itertools.starmap(self._manager, zip(merge_from, merge_to)))
+        out.extend(self._tail(merge_from, merge_to))
+        return out
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given lists into merges of items
+        on the same positions
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: tuple -- arguments for child merges and builder
+        """
+        return (list(zip(merge_from, merge_to)), functools.partial(\
+                self._build, self._tail(merge_from, merge_to)))
+
+    def update(self, merge_from, merge_to):
+        """Merges given lists updating merge_to in place.
+        Items of merge_from on positions missing in merge_to are appended.
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merge_to
+        """
+        for (idx, (item, target)) in enumerate(zip(merge_from, merge_to)):
+            merge_to[idx] = self._manager.merge_into(target, item)
+        merge_to.extend([self._copy(item) for item in \
+                itertools.islice(merge_from, len(merge_to), None)])
+        return merge_to
+
+    def _tail(self, merge_from, merge_to):
+        """Returns iterator over items of the longer list that have
+        no counterpart in the shorter one
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: iterator
+        """
+        if len(merge_from) > len(merge_to):
+            return itertools.islice(merge_from, len(merge_to), None)
+        return itertools.islice(merge_to, len(merge_from), None)
+
+    def _build(self, tail, values):
+        """Appends given tail to merged values
+
+        Arguments:
+            :param    tail: items without counterpart
+            :type     tail: iterable
+            :param    values: list of merged values
+            :type     values: list
+        :returns: list
+        """
+        values.extend(tail)
+        return values
+
+
+class MergeListKeyed(MergeAbstract):
+    """Merger for list type. Merges items with the same identity
+    (e.g. dicts with the same "id" field) and keeps order of merge_to.
+    Items of merge_from without counterpart are appended in their order.
+    Items without identity (or with unhashable one) are never matched.
+    Recursively applies merge to all values"""
+
+    def __init__(self, manager, key='id'):
+        """Class initialization
+
+        Arguments:
+            :param    manager: merge manager instance
+            :type     manager: pycomber.manager.Manager
+            :param    key: name of identity field or function that returns
+                           identity of given item (None if there is none)
+            :type     key: str | callable
+        """
+        MergeAbstract.__init__(self, manager)
+        if callable(key):
+            self._key = key
+        else:
+            self._key = functools.partial(self._field, key)
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given lists
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merged instances
+        """
+        return [self._manager(*args) for args in \
+                self._pairs(merge_from, merge_to)]
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given lists into merges of items
+        with the same identity and merges of remaining items
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: tuple -- arguments for child merges and builder
+        """
+        return (self._pairs(merge_from, merge_to), list)
+
+    def update(self, merge_from, merge_to):
+        """Merges given lists updating merge_to in place.
+        Items of merge_from without counterpart are appended.
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list -- merge_to
+        """
+        index = self._index(merge_from)
+        matched = set()
+        for (idx, item) in enumerate(merge_to):
+            pos = index.pop(self._identity(item), None)
+            if pos is not None:
+                matched.add(pos)
+                merge_to[idx] = self._manager.merge_into(item, \
+                        merge_from[pos])
+        merge_to.extend([self._copy(item) for (pos, item) in \
+                enumerate(merge_from) if pos not in matched])
+        return merge_to
+
+    def _pairs(self, merge_from, merge_to):
+        """Returns arguments of child merges in order of merged list
+
+        Arguments:
+            :param    merge_from: merge from this list
+            :type     merge_from: list
+            :param    merge_to: merge to this list
+            :type     merge_to: list
+        :returns: list
+        """
+        index = self._index(merge_from)
+        matched = set()
+        children = []
+        for item in merge_to:
+            pos = index.pop(self._identity(item), None)
+            if pos is None:
+                children.append((item,))
+            else:
+                matched.add(pos)
+                children.append((merge_from[pos], item))
+        children.extend([(item,) for (pos, item) in enumerate(merge_from) \
+                if pos not in matched])
+        return children
+
+    def _index(self, items):
+        """Returns positions of items by their identity.
+        Duplicated identities point to first item.
+
+        Arguments:
+            :param    items: items to be indexed
+            :type     items: list
+        :returns: dict
+        """
+        index = {}
+        for (pos, item) in enumerate(items):
+            key = self._identity(item)
+            if key is not None and key not in index:
+                index[key] = pos
+        return index
+
+    def _identity(self, item):
+        """Returns identity of given item or None if it has no hashable one
+
+        Arguments:
+            :param    item: item to get identity of
+            :type     item: object
+        :returns: object
+        """
+        key = self._key(item)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _field(self, name, item):
+        """Returns value of given field of given item
+
+        Arguments:
+            :param    name: name of field
+            :type     name: str
+            :param    item: item to get field of
+            :type     item: object
+        :returns: object -- value of field or None if item has no such field
+        """
+        try:
+            return item[name]
+        except (KeyError, IndexError, TypeError):
+            return None
+
 
 class MergeTuple(MergeAbstract):
     """Merger for tuple type. Joins two tuples together.
@@ -141,8 +635,39 @@ class MergeTuple(MergeAbstract):
             :type     merge_to: tuple
         :returns: tuple -- merged instances
         """
+        if self._leaves_only(merge_from, merge_to):
+            return tuple(set(merge_from + merge_to))
         return tuple(mapper(self._manager, set(merge_from + merge_to)))
 
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given tuples into merges of their unique values
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple | None -- arguments for child merges and builder
+                  or None if tuples hold only values that are not merged
+                  one by one (see __call__)
+        """
+        if self._leaves_only(merge_from, merge_to):
+            return None
+        return ([(item,) for item in set(merge_from + merge_to)], tuple)
+
+    def merge_many(self, values):
+        """Merges all given tuples at once
+
+        Arguments:
+            :param    values: tuples to be merged
+            :type     values: list
+        :returns: tuple -- merged instances
+        """
+        merged = set(itertools.chain(*values))
+        if self._leaves_only(merged):
+            return tuple(merged)
+        return tuple(mapper(self._manager, merged))
+
 
 class MergeTupleOverride(MergeTuple):
     """Merger for tuple type. Overrides merge_to with merge_from.
@@ -160,6 +685,166 @@ class MergeTupleOverride(MergeTuple):
         """
         return MergeTuple.__call__(self, merge_from, tuple())
 
+    def decompose(self, merge_from, merge_to):
+        return MergeTuple.decompose(self, merge_from, tuple())
+
+    def merge_many(self, values):
+        return MergeTuple.__call__(self, values[0], tuple())
+
+
+class MergeTupleConcat(MergeAbstract):
+    """Merger for tuple type. Joins two tuples together keeping all items
+    in order (items from merge_from go first).
+    Recursively applies merge to all values"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given tuples
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple -- merged instances
+        """
+        if self._leaves_only(merge_from, merge_to):
+            return merge_from + merge_to
+        return tuple(mapper(self._manager, itertools.chain(merge_from, \
+                merge_to)))
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given tuples into merges of their values
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple | None -- arguments for child merges and builder
+                  or None if tuples hold only values that are not merged
+                  one by one (see __call__)
+        """
+        if self._leaves_only(merge_from, merge_to):
+            return None
+        return ([(item,) for item in itertools.chain(merge_from, merge_to)], \
+                tuple)
+
+    def merge_many(self, values):
+        """Merges all given tuples at once
+
+        Arguments:
+            :param    values: tuples to be merged
+            :type     values: list
+        :returns: tuple -- merged instances
+        """
+        if self._leaves_only(*values):
+            return tuple(itertools.chain(*values))
+        return tuple(mapper(self._manager, itertools.chain(*values)))
+
+
+class MergeTupleOrdered(MergeListOrdered):
+    """Merger for tuple type. Joins two tuples and eliminates duplicates
+    keeping order of first occurrences (items from merge_from go first).
+    Duplicates are found using hash of items (or their structural
+    fingerprint for unhashable items).
+    Recursively applies merge to all values"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given tuples
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple -- merged instances
+        """
+        return self.merge_many((merge_from, merge_to))
+
+    def merge_many(self, values):
+        """Merges all given tuples at once
+
+        Arguments:
+            :param    values: tuples to be merged
+            :type     values: list
+        :returns: tuple -- merged instances
+        """
+        if self._leaves_only(*values):
+            return tuple(dict.fromkeys(itertools.chain(*values)))
+        return tuple(mapper(self._manager, \
+                self._unique(itertools.chain(*values))))
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given tuples into merges of their unique values
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple | None -- arguments for child merges and builder
+                  or None if tuples hold only values that are not merged
+                  one by one (see merge_many)
+        """
+        if self._leaves_only(merge_from, merge_to):
+            return None
+        return ([(item,) for item in \
+                self._unique(itertools.chain(merge_from, merge_to))], tuple)
+
+
+class MergeTuplePositional(MergeAbstract):
+    """Merger for tuple type. Merges items on the same positions
+    (item of merge_from into item of merge_to). Items of the longer tuple
+    that have no counterpart are merged with None.
+    Recursively applies merge to all values"""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given tuples
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple -- merged instances
+        """
+        tail = self._tail(merge_from, merge_to)
+        if self._leaves_only(tail):
+            tail = iter(tail)
+        else:
+            tail = mapper(self._manager, tail)
+        return tuple(itertools.chain(itertools.starmap(self._manager, \
+                zip(merge_from, merge_to)), tail))
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given tuples into merges of items
+        on the same positions
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple -- arguments for child merges and builder
+        """
+        return (list(zip(merge_from, merge_to)) + [(item,) for item in \
+                self._tail(merge_from, merge_to)], tuple)
+
+    def _tail(self, merge_from, merge_to):
+        """Returns items of the longer sequence that have no counterpart
+        in the shorter one
+
+        Arguments:
+            :param    merge_from: merge from this sequence
+            :type     merge_from: tuple
+            :param    merge_to: merge to this sequence
+            :type     merge_to: tuple
+        :returns: tuple
+        """
+        if len(merge_from) > len(merge_to):
+            return merge_from[len(merge_to):]
+        return merge_to[len(merge_from):]
+
 
 class MergeSet(MergeAbstract):
     """Merger for set type. Joins two sets together.
@@ -175,8 +860,56 @@ class MergeSet(MergeAbstract):
             :type     merge_to: set
         :returns: set -- merged instances
         """
+        if self._leaves_only(merge_from, merge_to):
+            return set().union(merge_from, merge_to)
         return set([self._manager(item) for item in merge_from | merge_to])
 
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given sets into merges of their values
+
+        Arguments:
+            :param    merge_from: merge from this set
+            :type     merge_from: set
+            :param    merge_to: merge to this set
+            :type     merge_to: set
+        :returns: tuple | None -- arguments for child merges and builder
+                  or None if sets hold only values that are not merged
+                  one by one (see __call__)
+        """
+        if self._leaves_only(merge_from, merge_to):
+            return None
+        return ([(item,) for item in merge_from | merge_to], set)
+
+    def update(self, merge_from, merge_to):
+        """Merges given sets updating merge_to in place
+
+        Arguments:
+            :param    merge_from: merge from this set
+            :type     merge_from: set
+            :param    merge_to: merge to this set
+            :type     merge_to: set
+        :returns: set -- merge_to
+        """
+        if self._leaves_only(merge_from):
+            merge_to.update(merge_from)
+            return merge_to
+        merge_to.update([self._manager(item) for item in merge_from \
+                if item not in merge_to])
+        return merge_to
+
+    def merge_many(self, values):
+        """Merges all given sets at once
+
+        Arguments:
+            :param    values: sets to be merged
+            :type     values: list
+        :returns: set -- merged instances
+        """
+        merged = set().union(*values)
+        if self._leaves_only(merged):
+            return merged
+        return set([self._manager(item) for item in merged])
+
 
 class MergeSetOverride(MergeSet):
     """Merger for set type. Overrides merge_to with merge_from.
@@ -194,6 +927,18 @@ class MergeSetOverride(MergeSet):
         """
         return MergeSet.__call__(self, merge_from, set())
 
+    def decompose(self, merge_from, merge_to):
+        return MergeSet.decompose(self, merge_from, set())
+
+    def update(self, merge_from, merge_to):
+        items = [self._manager(item) for item in merge_from]
+        merge_to.clear()
+        merge_to.update(items)
+        return merge_to
+
+    def merge_many(self, values):
+        return MergeSet.__call__(self, values[0], set())
+
 
 class MergeDict(MergeAbstract):
     """Merger for dict type. Adds missing keys from merge_from to merge_to.
@@ -216,6 +961,78 @@ class MergeDict(MergeAbstract):
             out[group_key] = self._merge_values(group_values)
         return out
 
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given dicts into merges of values for each key
+
+        Arguments:
+            :param    merge_from: merge from this dict
+            :type     merge_from: dict
+            :param    merge_to: merge to this dict
+            :type     merge_to: dict
+        :returns: tuple -- arguments for child merges and builder
+        """
+        keys = sorted(set(merge_from).union(merge_to))
+        children = []
+        for key in keys:
+            if key not in merge_to:
+                children.append((merge_from[key],))
+            elif key not in merge_from:
+                children.append((merge_to[key],))
+            else:
+                children.append((merge_from[key], merge_to[key]))
+        return (children, functools.partial(self._build, keys))
+
+    def _build(self, keys, values):
+        """Builds dict from list of keys and list of merged values
+
+        Arguments:
+            :param    keys: list of keys
+            :type     keys: list
+            :param    values: list of merged values
+            :type     values: list
+        :returns: dict
+        """
+        return dict(zip(keys, values))
+
+    def update(self, merge_from, merge_to):
+        """Merges given dicts updating merge_to in place.
+        Values for keys in common are merged in place as well.
+
+        Arguments:
+            :param    merge_from: merge from this dict
+            :type     merge_from: dict
+            :param    merge_to: merge to this dict
+            :type     merge_to: dict
+        :returns: dict -- merge_to
+        """
+        for (key, value) in merge_from.items():
+            if key in merge_to:
+                merge_to[key] = self._manager.merge_into(merge_to[key], value)
+            else:
+                merge_to[key] = self._copy(value)
+        return merge_to
+
+    def merge_many(self, values):
+        """Merges all given dicts at once. Values for every key are grouped
+        across all dicts and merged together.
+
+        Arguments:
+            :param    values: dicts to be merged
+            :type     values: list
+        :returns: dict -- merged instances
+        """
+        groups = {}
+        for value in values:
+            for (key, item) in value.items():
+                if key in groups:
+                    groups[key].append(item)
+                else:
+                    groups[key] = [item]
+        out = {}
+        for (key, items) in groups.items():
+            out[key] = self._manager.merge_many(*items)
+        return out
+
     def _chained(self, merge_from, merge_to):
         """Chains list of (key, value) pairs from given dictionaries
 
@@ -277,6 +1094,403 @@ class MergeDictOverride(MergeDict):
     def __call__(self, merge_from, merge_to):
         return MergeDict.__call__(self, merge_from, {})
 
+    def decompose(self, merge_from, merge_to):
+        return MergeDict.decompose(self, merge_from, {})
+
+    def update(self, merge_from, merge_to):
+        items = [(key, self._copy(value)) \
+                for (key, value) in merge_from.items()]
+        merge_to.clear()
+        merge_to.update(items)
+        return merge_to
+
+    def merge_many(self, values):
+        return self(values[0], {})
+
+
+class MergeDictHashJoin(MergeDict):
+    """Merger for dict type. Adds missing keys from merge_from to merge_to.
+    Recursively merges all keys in common.
+
+    Keys are joined by hash lookups instead of sorting, so merge runs in
+    linear time, works with keys that can not be compared with each other
+    and keeps insertion order (keys from merge_from first)."""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given dicts
+
+        Arguments:
+            :param    merge_from: merge from this dict
+            :type     merge_from: dict
+            :param    merge_to: merge to this dict
+            :type     merge_to: dict
+        :returns: dict -- merged instances
+        """
+        out = {}
+        for (key, value) in merge_from.items():
+            if key in merge_to:
+                out[key] = self._manager(value, merge_to[key])
+            else:
+                out[key] = self._manager(value)
+        for (key, value) in merge_to.items():
+            if key not in merge_from:
+                out[key] = self._manager(value)
+        return out
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given dicts into merges of values for each key
+
+        Arguments:
+            :param    merge_from: merge from this dict
+            :type     merge_from: dict
+            :param    merge_to: merge to this dict
+            :type     merge_to: dict
+        :returns: tuple -- arguments for child merges and builder
+        """
+        keys = []
+        children = []
+        for (key, value) in merge_from.items():
+            keys.append(key)
+            if key in merge_to:
+                children.append((value, merge_to[key]))
+            else:
+                children.append((value,))
+        for (key, value) in merge_to.items():
+            if key not in merge_from:
+                keys.append(key)
+                children.append((value,))
+        return (children, functools.partial(self._build, keys))
+
+
+class MergeDictHashJoinOverride(MergeDictHashJoin):
+    """Merger for dict type. Overrides merge_to with merge_from.
+    Recursively applies merge to all values. Keeps insertion order."""
+
+    def __call__(self, merge_from, merge_to):
+        return MergeDictHashJoin.__call__(self, merge_from, {})
+
+    def decompose(self, merge_from, merge_to):
+        return MergeDictHashJoin.decompose(self, merge_from, {})
+
+    def update(self, merge_from, merge_to):
+        items = [(key, self._copy(value)) \
+                for (key, value) in merge_from.items()]
+        merge_to.clear()
+        merge_to.update(items)
+        return merge_to
+
+    def merge_many(self, values):
+        return self(values[0], {})
+
+
+class MergeDictShared(MergeAbstract):
+    """Merger for dict type. Adds missing keys from merge_from to merge_to.
+    Recursively merges all keys in common.
+
+    Values present on one side only, as well as values that are the very
+    same object on both sides, are not merged but shared with the result
+    by reference. Cost of merge depends on size of merged subtrees only."""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given dicts
+
+        Arguments:
+            :param    merge_from: merge from this dict
+            :type     merge_from: dict
+            :param    merge_to: merge to this dict
+            :type     merge_to: dict
+        :returns: dict -- merged instances
+        """
+        (children, build) = self.decompose(merge_from, merge_to)
+        return build([self._manager(*args) for args in children])
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given dicts into merges of values for keys
+        in common. Remaining values are copied by reference.
+
+        Arguments:
+            :param    merge_from: merge from this dict
+            :type     merge_from: dict
+            :param    merge_to: merge to this dict
+            :type     merge_to: dict
+        :returns: tuple -- arguments for child merges and builder
+        """
+        out = dict(merge_to)
+        keys = []
+        children = []
+        for (key, value) in merge_from.items():
+            if key not in out:
+                out[key] = value
+            elif out[key] is not value:
+                keys.append(key)
+                children.append((value, out[key]))
+        return (children, functools.partial(self._build, out, keys))
+
+    def _build(self, out, keys, values):
+        """Updates given dict with merged values
+
+        Arguments:
+            :param    out: dict to be updated
+            :type     out: dict
+            :param    keys: list of keys
+            :type     keys: list
+            :param    values: list of merged values
+            :type     values: list
+        :returns: dict
+        """
+        out.update(zip(keys, values))
+        return out
+
+
+class MergeSetShared(MergeSet):
+    """Merger for set type. Joins two sets together.
+
+    Values are present on one side only or equal on both sides, so like
+    values present on one side only in MergeDictShared, they are shared
+    with the result by reference instead of being merged with None."""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given sets
+
+        Arguments:
+            :param    merge_from: merge from this set
+            :type     merge_from: set
+            :param    merge_to: merge to this set
+            :type     merge_to: set
+        :returns: set -- merged instances
+        """
+        return set().union(merge_from, merge_to)
+
+    def decompose(self, merge_from, merge_to):
+        """Returns None, as values of sets are not merged one by one
+
+        :returns: None
+        """
+        return None
+
+    def merge_many(self, values):
+        """Merges all given sets at once
+
+        Arguments:
+            :param    values: sets to be merged
+            :type     values: list
+        :returns: set -- merged instances
+        """
+        return set().union(*values)
+
+
+class MergeListShared(MergeList):
+    """Merger for list type. Joins two list and eliminates duplicates.
+
+    Values are shared with the result by reference instead of being merged
+    with None (see MergeSetShared), so merged list is the only new object.
+    Duplicates are still found by comparing values (see _key_func)."""
+
+    def decompose(self, merge_from, merge_to):
+        """Returns None, as values of lists are not merged one by one
+
+        :returns: None
+        """
+        return None
+
+    def _merged(self, items):
+        """Returns unique values from given iterable
+
+        Arguments:
+            :param    items: values to be merged
+            :type     items: iterable
+        :returns: list -- merged instances
+        """
+        return list(self._unique(sorted(items, key=self._cmp_key)))
+
+
+class MergeTupleShared(MergeTuple):
+    """Merger for tuple type. Joins two tuples together.
+
+    Values are shared with the result by reference instead of being merged
+    with None (see MergeSetShared), so merged tuple is the only new object.
+    """
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given tuples
+
+        Arguments:
+            :param    merge_from: merge from this tuple
+            :type     merge_from: tuple
+            :param    merge_to: merge to this tuple
+            :type     merge_to: tuple
+        :returns: tuple -- merged instances
+        """
+        return tuple(set(merge_from + merge_to))
+
+    def decompose(self, merge_from, merge_to):
+        """Returns None, as values of tuples are not merged one by one
+
+        :returns: None
+        """
+        return None
+
+    def merge_many(self, values):
+        """Merges all given tuples at once
+
+        Arguments:
+            :param    values: tuples to be merged
+            :type     values: list
+        :returns: tuple -- merged instances
+        """
+        return tuple(set(itertools.chain(*values)))
+
+
+class MergePersistentMap(MergeAbstract):
+    """Merger for persistent maps (see pycomber.persistent.PersistentMap).
+    Adds missing keys from merge_from to merge_to.
+    Recursively merges all keys in common.
+
+    Keys are set on merge_to, so result shares all untouched subtrees
+    of merge_to. Values present in merge_to only, as well as values that
+    are the very same object on both sides, are not merged.
+    Plain dicts (or None) given as merge_to are converted to persistent maps
+    with all their values merged (so converted) by the manager."""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given maps
+
+        Arguments:
+            :param    merge_from: merge from this map
+            :type     merge_from: dict | pycomber.persistent.PersistentMap
+            :param    merge_to: merge to this map
+            :type     merge_to: dict | pycomber.persistent.PersistentMap
+        :returns: pycomber.persistent.PersistentMap -- merged instances
+        """
+        (children, build) = self.decompose(merge_from, merge_to)
+        return build([self._manager(*args) for args in children])
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given maps into merges of values from merge_from
+
+        Arguments:
+            :param    merge_from: merge from this map
+            :type     merge_from: dict | pycomber.persistent.PersistentMap
+            :param    merge_to: merge to this map
+            :type     merge_to: dict | pycomber.persistent.PersistentMap
+        :returns: tuple -- arguments for child merges and builder
+        """
+        shared = isinstance(merge_to, PersistentMap)
+        if shared:
+            out = merge_to
+        else:
+            (out, merge_to) = (PersistentMap(), merge_to or {})
+        keys = []
+        children = []
+        for (key, value) in merge_from.items():
+            current = merge_to.get(key, None)
+            if not shared or current is not value or key not in merge_to:
+                keys.append(key)
+                children.append((value, current))
+        if not shared:
+            for (key, value) in merge_to.items():
+                if key not in merge_from:
+                    keys.append(key)
+                    children.append((value,))
+        return (children, functools.partial(self._build, out, keys))
+
+    def _build(self, out, keys, values):
+        """Sets merged values on given map
+
+        Arguments:
+            :param    out: map to set values on
+            :type     out: pycomber.persistent.PersistentMap
+            :param    keys: list of keys
+            :type     keys: list
+            :param    values: list of merged values
+            :type     values: list
+        :returns: pycomber.persistent.PersistentMap
+        """
+        for (key, value) in zip(keys, values):
+            out = out.assoc(key, value)
+        return out
+
+
+class MergePersistentVector(MergeAbstract):
+    """Merger for persistent vectors
+    (see pycomber.persistent.PersistentVector).
+    Appends values from merge_from missing in merge_to, so result shares
+    all nodes of merge_to. Plain lists (or None) given as merge_to
+    are converted to persistent vectors with all their items merged
+    (so converted) by the manager."""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given vectors
+
+        Arguments:
+            :param    merge_from: merge from this vector
+            :type     merge_from: list | pycomber.persistent.PersistentVector
+            :param    merge_to: merge to this vector
+            :type     merge_to: list | pycomber.persistent.PersistentVector
+        :returns: pycomber.persistent.PersistentVector -- merged instances
+        """
+        merge_to = merge_to or ()
+        cache = {}
+        seen = set(fingerprint(item, cache) for item in merge_to)
+        if not isinstance(merge_to, PersistentVector):
+            merge_to = PersistentVector([self._manager(item) \
+                    for item in merge_to])
+        for item in merge_from:
+            key = fingerprint(item, cache)
+            if key not in seen:
+                seen.add(key)
+                merge_to = merge_to.append(self._manager(item))
+        return merge_to
+
+
+class MergePersistentSet(MergeSet):
+    """Merger for sets cast to frozensets
+    (see pycomber.configuration.ConfigurationPersistent).
+    Joins two sets together. Frozenset given as merge_to that already holds
+    all values of merge_from is returned as it is, so result shares memory
+    with merge_to."""
+
+    def __call__(self, merge_from, merge_to):
+        """Merges given sets
+
+        Arguments:
+            :param    merge_from: merge from this set
+            :type     merge_from: set | frozenset
+            :param    merge_to: merge to this set
+            :type     merge_to: set | frozenset
+        :returns: set | frozenset -- merged instances
+        """
+        if self._covers(merge_from, merge_to):
+            return merge_to
+        return MergeSet.__call__(self, merge_from, merge_to)
+
+    def decompose(self, merge_from, merge_to):
+        """Splits merge of given sets into merges of their values
+
+        Arguments:
+            :param    merge_from: merge from this set
+            :type     merge_from: set | frozenset
+            :param    merge_to: merge to this set
+            :type     merge_to: set | frozenset
+        :returns: tuple | None -- arguments for child merges and builder
+                  or None if sets are not merged one by one (see __call__)
+        """
+        if self._covers(merge_from, merge_to):
+            return None
+        return MergeSet.decompose(self, merge_from, merge_to)
+
+    def _covers(self, merge_from, merge_to):
+        """Checks whether merge_to can be shared as result of merge
+
+        Arguments:
+            :param    merge_from: merge from this set
+            :type     merge_from: set | frozenset
+            :param    merge_to: merge to this set
+            :type     merge_to: set | frozenset
+        :returns: bool
+        """
+        return isinstance(merge_to, frozenset) and merge_from <= merge_to
+
 
 class MergePrimitives(MergeAbstract):
     """Merger for primitives. Always returns merge_from"""
@@ -310,3 +1524,18 @@ class MergeNone(MergeAbstract):
         if merge_from is None:
             return merge_to
         return merge_from
+
+    def update(self, merge_from, merge_to):
+        """Merges given objects. Returns merge_to if merge_from is None,
+        otherwise copy of merge_from (see MergeAbstract._copy)
+
+        Arguments:
+            :param    merge_from: merge from this object
+            :type     merge_from: object
+            :param    merge_to: merge to this object
+            :type     merge_to: object
+        :returns: object -- merge_to or copy of merge_from
+        """
+        if merge_from is None:
+            return merge_to
+        return self._copy(merge_from)
@@ -0,0 +1,466 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import codecs
+import itertools
+import json
+import re
+from pycomber.strategies import MergeDict, MergeDictShared, MergeNone
+
+# Python 2to3 support
+try:
+    from collections.abc import Mapping, Set
+except ImportError:
+    from collections import Mapping, Set
+
+try:
+    zip_longest = itertools.izip_longest
+except AttributeError:
+    zip_longest = itertools.zip_longest
+
+
+def merge_ndjson(manager, merge_from, merge_to, out):
+    """Merges two streams of newline delimited JSON documents record
+    by record and writes merged records to given output as they are merged.
+    Records missing in shorter stream are merged with None.
+    Only one pair of records is kept in memory at a time.
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    merge_from: lines to merge from (e.g. file object)
+        :type     merge_from: iterable
+        :param    merge_to: lines to merge to (e.g. file object)
+        :type     merge_to: iterable
+        :param    out: output to write merged records to
+        :type     out: file
+    :returns: int -- number of written records
+    :raises: TypeError, ValueError
+    """
+    count = 0
+    for (left, right) in zip_longest(_records(merge_from), \
+            _records(merge_to)):
+        dump(manager(left, right), out)
+        out.write('\n')
+        count += 1
+    return count
+
+
+def merge_json(manager, merge_from, merge_to, out, chunk_size=65536):
+    """Merges two JSON documents read chunk by chunk from given seekable
+    binary files and writes merged document to given output as it is merged.
+
+    Objects present on both sides are merged member by member when dicts
+    are merged by MergeDict or MergeDictShared, values present on one side
+    only that would be returned unchanged are copied to output as they are
+    (without being validated).
+    Other values (e.g. arrays present on both sides) are decoded and merged
+    by the manager. Only keys and offsets of members of objects being merged
+    are kept in memory, so memory does not depend on size of documents
+    but on their nesting depth, number of members of their objects
+    and size of values decoded as a whole.
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    merge_from: binary file with document to merge from
+        :type     merge_from: file
+        :param    merge_to: binary file with document to merge to or None
+        :type     merge_to: file
+        :param    out: output to write merged document to
+        :type     out: file
+        :param    chunk_size: number of bytes read from files at once
+        :type     chunk_size: int
+    :returns: None
+    :raises: TypeError, ValueError
+    """
+    left = _Document(merge_from, chunk_size)
+    if merge_to is None:
+        (right, span) = (None, None)
+    else:
+        right = _Document(merge_to, chunk_size)
+        span = right.root()
+    _merge_values(manager, left, left.root(), right, span, out)
+
+
+def dump(value, out):
+    """Writes given value to given output as JSON, chunk by chunk
+
+    Arguments:
+        :param    value: value to be written
+        :type     value: object
+        :param    out: output to write value to
+        :type     out: file
+    :returns: None
+    :raises: TypeError
+    """
+    for chunk in _encoder.iterencode(value):
+        out.write(chunk)
+
+
+def _records(lines):
+    """Decodes JSON documents from given lines skipping blank ones
+
+    Arguments:
+        :param    lines: lines with JSON documents
+        :type     lines: iterable
+    :returns: generator
+    :raises: ValueError
+    """
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _merge_values(manager, left, left_span, right, right_span, out):
+    """Merges values at given spans of given documents writing them to output
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    left: document to merge from
+        :type     left: _Document
+        :param    left_span: offsets of value to merge from
+        :type     left_span: tuple
+        :param    right: document to merge to
+        :type     right: _Document
+        :param    right_span: offsets of value to merge to or None
+        :type     right_span: tuple
+        :param    out: output to write merged value to
+        :type     out: file
+    :returns: None
+    :raises: TypeError, ValueError
+    """
+    left_type = left.type(left_span)
+    right_type = right.type(right_span) if right_span else type(None)
+    if left_type is dict and right_type is dict and _by_members(manager):
+        _merge_members(manager, left, left_span, right, right_span, out)
+    elif right_span is None and _unchanged(manager, left_type):
+        left.copy(left_span, out)
+    else:
+        dump(manager(left.load(left_span), \
+                right.load(right_span) if right_span else None), out)
+
+
+def _merge_members(manager, left, left_span, right, right_span, out):
+    """Merges objects at given spans of given documents member by member
+    writing them to output
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    left: document to merge from
+        :type     left: _Document
+        :param    left_span: offsets of object to merge from
+        :type     left_span: tuple
+        :param    right: document to merge to
+        :type     right: _Document
+        :param    right_span: offsets of object to merge to
+        :type     right_span: tuple
+        :param    out: output to write merged object to
+        :type     out: file
+    :returns: None
+    :raises: TypeError, ValueError
+    """
+    members = list(right.members(right_span))
+    merge_to = dict(members)
+    separator = ''
+    out.write('{')
+    for (key, span) in left.members(left_span):
+        out.write(separator)
+        dump(key, out)
+        out.write(':')
+        _merge_values(manager, left, span, right, merge_to.pop(key, None), \
+                out)
+        separator = ','
+    for (key, span) in members:
+        if key in merge_to:
+            out.write(separator)
+            dump(key, out)
+            out.write(':')
+            # values present in merge_to only are merged like in MergeDict
+            _merge_values(manager, right, merge_to.pop(key), None, None, \
+                    out)
+            separator = ','
+    out.write('}')
+
+
+def _by_members(manager):
+    """Checks whether given manager merges dicts member by member
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+    :returns: bool
+    """
+    try:
+        strategy = manager.get_strategy(dict, dict)
+    except TypeError:
+        return False
+    return type(strategy) in (MergeDict, MergeDictShared)
+
+
+def _unchanged(manager, value_type):
+    """Checks whether given manager returns values of given type merged
+    with None unchanged
+
+    Arguments:
+        :param    manager: merge manager instance
+        :type     manager: pycomber.manager.Manager
+        :param    value_type: type of merged values
+        :type     value_type: type
+    :returns: bool
+    """
+    try:
+        strategy = manager.get_strategy(value_type, type(None))
+    except TypeError:
+        return False
+    return type(strategy) is MergeNone
+
+
+class _Document(object):
+    """JSON document in seekable binary file. Values are located by their
+    offsets in the file, file is read chunk by chunk and values are
+    decoded only when they are loaded."""
+
+    _WHITESPACE = re.compile(br'[ \t\n\r]*')
+    _STRING = re.compile(br'"[^"\\]*(?:\\.[^"\\]*)*"')
+    _SCALAR = re.compile(br'[^ \t\n\r,:\[\]{}"]+')
+    # strings and other bytes up to next bracket (in parts of limited size),
+    # strings cut by the end of the buffer match up to it, so they are read
+    # whole once buffer is extended
+    _RUN = re.compile(br'(?:[^"\[\]{}]|"[^"\\]*(?:\\.?[^"\\]*)*"?)' \
+            br'{0,4096}[\[\]{}]?')
+    _TYPES = {b'{': dict, b'[': list, b'"': str}
+
+    def __init__(self, source, chunk_size):
+        """Object initialization
+
+        Arguments:
+            :param    source: binary file with JSON document
+            :type     source: file
+            :param    chunk_size: number of bytes read from file at once
+            :type     chunk_size: int
+        """
+        self._source = source
+        self._chunk_size = chunk_size
+        self._buffer = b''
+        self._offset = 0
+        self._eof = False
+
+    def root(self):
+        """Returns offsets of top level value of the document
+
+        :returns: tuple -- (start, end) offsets
+        :raises: ValueError
+        """
+        span = self.span(0)
+        if self._peek(self._skip_whitespace(span[1])):
+            raise ValueError("Extra data after JSON document")
+        return span
+
+    def span(self, pos):
+        """Returns offsets of value that starts at given offset
+        (after whitespace)
+
+        Arguments:
+            :param    pos: offset in the file
+            :type     pos: int
+        :returns: tuple -- (start, end) offsets
+        :raises: ValueError
+        """
+        start = self._skip_whitespace(pos)
+        first = self._peek(start)
+        if first == b'"':
+            return (start, self._match(self._STRING, start)[1])
+        if first not in (b'{', b'['):
+            return (start, self._match(self._SCALAR, start)[1])
+        (depth, pos, run) = (0, start, self._RUN.match)
+        while True:
+            self._fill(pos)
+            (buffer, offset) = (self._buffer, self._offset)
+            (i, size) = (pos - offset, len(buffer))
+            # runs ending before the end of the buffer are complete
+            while True:
+                end = run(buffer, i).end()
+                if end == i or end == size and not self._eof:
+                    break
+                bracket = buffer[end - 1:end]
+                if bracket in (b'{', b'['):
+                    depth += 1
+                elif bracket in (b'}', b']'):
+                    depth -= 1
+                    if not depth:
+                        return (start, end + offset)
+                i = end
+            if self._eof:
+                raise ValueError("Unterminated value at offset %d" % start)
+            pos = i + offset
+            self._read(pos)
+
+    def type(self, span):
+        """Returns type of value at given offsets (dict, list, str
+        or object for other values)
+
+        Arguments:
+            :param    span: (start, end) offsets of value
+            :type     span: tuple
+        :returns: type
+        """
+        return self._TYPES.get(self._peek(span[0]), object)
+
+    def members(self, span):
+        """Returns keys and offsets of values of object at given offsets
+
+        Arguments:
+            :param    span: (start, end) offsets of object
+            :type     span: tuple
+        :returns: generator -- (key, (start, end)) pairs
+        :raises: ValueError
+        """
+        pos = self._skip_whitespace(span[0] + 1)
+        if self._peek(pos) == b'}':
+            return
+        while True:
+            (key, pos) = self._match(self._STRING, pos)
+            pos = self._skip_whitespace(pos)
+            if self._peek(pos) != b':':
+                raise ValueError("Expecting ':' at offset %d" % pos)
+            value = self.span(pos + 1)
+            yield (json.loads(key.decode('utf-8')), value)
+            pos = self._skip_whitespace(value[1])
+            separator = self._peek(pos)
+            if separator == b'}':
+                return
+            if separator != b',':
+                raise ValueError("Expecting ',' at offset %d" % pos)
+            pos = self._skip_whitespace(pos + 1)
+
+    def load(self, span):
+        """Decodes value at given offsets
+
+        Arguments:
+            :param    span: (start, end) offsets of value
+            :type     span: tuple
+        :returns: object
+        :raises: ValueError
+        """
+        self._source.seek(span[0])
+        return json.loads(self._source.read(span[1] - span[0]).decode(\
+                'utf-8'))
+
+    def copy(self, span, out):
+        """Writes value at given offsets to given output chunk by chunk
+
+        Arguments:
+            :param    span: (start, end) offsets of value
+            :type     span: tuple
+            :param    out: output to write value to
+            :type     out: file
+        :returns: None
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for pos in range(span[0], span[1], self._chunk_size):
+            self._source.seek(pos)
+            out.write(decoder.decode(self._source.read(min(\
+                    self._chunk_size, span[1] - pos))))
+        out.write(decoder.decode(b'', True))
+
+    def _skip_whitespace(self, pos):
+        """Returns offset of first byte that is not whitespace
+        at given offset or after it
+
+        Arguments:
+            :param    pos: offset in the file
+            :type     pos: int
+        :returns: int
+        """
+        return self._match(self._WHITESPACE, pos)[1]
+
+    def _peek(self, pos):
+        """Returns byte at given offset (empty at the end of the file)
+
+        Arguments:
+            :param    pos: offset in the file
+            :type     pos: int
+        :returns: bytes
+        """
+        self._fill(pos)
+        i = pos - self._offset
+        return self._buffer[i:i + 1]
+
+    def _match(self, pattern, pos):
+        """Matches given pattern at given offset. Buffer is extended
+        until match ends before its end, so tokens split between chunks
+        are matched whole.
+
+        Arguments:
+            :param    pattern: pattern to match
+            :type     pattern: re.RegexObject
+            :param    pos: offset in the file
+            :type     pos: int
+        :returns: tuple -- matched bytes and offset of their end
+        :raises: ValueError
+        """
+        self._fill(pos)
+        while True:
+            match = pattern.match(self._buffer, pos - self._offset)
+            if match is not None and (self._eof or \
+                    match.end() < len(self._buffer)):
+                return (match.group(), match.end() + self._offset)
+            if self._eof:
+                raise ValueError("Invalid JSON at offset %d" % pos)
+            self._read(pos)
+
+    def _fill(self, pos):
+        """Makes buffer hold given offset and at least one byte after it
+        (unless file ends)
+
+        Arguments:
+            :param    pos: offset in the file
+            :type     pos: int
+        :returns: None
+        """
+        if not self._offset <= pos <= self._offset + len(self._buffer):
+            (self._buffer, self._offset, self._eof) = (b'', pos, False)
+        while not self._eof and pos - self._offset >= len(self._buffer):
+            self._read(pos)
+
+    def _read(self, pos):
+        """Drops bytes before given offset from the buffer and appends
+        next chunk of the file to it
+
+        Arguments:
+            :param    pos: offset in the file held by the buffer
+            :type     pos: int
+        :returns: None
+        """
+        self._buffer = self._buffer[pos - self._offset:]
+        self._offset = pos
+        self._source.seek(self._offset + len(self._buffer))
+        chunk = self._source.read(self._chunk_size)
+        if chunk:
+            self._buffer += chunk
+        else:
+            self._eof = True
+
+
+def _default(value):
+    """Converts merged values that are not supported by JSON encoder
+
+    Arguments:
+        :param    value: value to convert
+        :type     value: object
+    :returns: dict | list
+    :raises: TypeError
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Set):
+        return list(value)
+    try:
+        return list(iter(value))
+    except TypeError:
+        raise TypeError("%r is not JSON serializable" % (value,))
+
+
+_encoder = json.JSONEncoder(separators=(',', ':'), default=_default)
@@ -1,16 +1,30 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from collections import MutableMapping
 
+# Python 2to3 support
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
-class ImmutableDict(MutableMapping):
+
+class ImmutableDict(Mapping):
     """Configuration value object for immutable dict
 
-    Configuration represented by this class is **Immutable**
+    Configuration represented by this class is **Immutable**.
+    Given dict is copied, so later changes to it are not reflected.
+    Instances are hashable (as long as their values are hashable)
+    and their hash is computed once.
     """
 
+    __slots__ = ('_inner', '_hash')
+
     def __init__(self, inner):
-        self._inner = inner
+        object.__setattr__(self, '_inner', dict(inner))
+        object.__setattr__(self, '_hash', None)
+
+    def __reduce__(self):
+        return (type(self), (self._inner,))
 
     def __getitem__(self, key):
         return self._inner[key]
@@ -21,6 +35,18 @@ class ImmutableDict(MutableMapping):
     def __delitem__(self, key):
         raise TypeError("Object is immutable")
 
+    def __setattr__(self, name, value):
+        raise TypeError("Object is immutable")
+
+    def __delattr__(self, name):
+        raise TypeError("Object is immutable")
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Object is immutable")
+
+    # methods of dict that would modify it
+    update = clear = pop = popitem = setdefault = _immutable
+
     def __iter__(self):
         return self._inner.__iter__()
 
@@ -29,3 +55,30 @@ class ImmutableDict(MutableMapping):
 
     def __contains__(self, x):
         return self._inner.__contains__(x)
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', \
+                    hash(frozenset(self._inner.items())))
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, ImmutableDict):
+            if self is other:
+                return True
+            if self._hash is not None and other._hash is not None and \
+                    self._hash != other._hash:
+                return False
+            return self._inner == other._inner
+        if isinstance(other, Mapping):
+            return self._inner == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self._inner)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+from functools import partial
+
+##
+# third party modules
+#
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.manager import Manager
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType, \
+        ConfigurationNumpy
+if numpy is not None:
+    from pycomber.arrays import MergeArrayOverride, MergeArrayConcat, \
+            MergeArrayUnique, MergeArrayElementwise
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class MergeArrayTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = mock.Mock()
+        self.a = numpy.array([3, 1, 2])
+        self.b = numpy.array([2, 5, 4])
+
+    def assertArrayEqual(self, first, second):
+        self.assertTrue(isinstance(first, numpy.ndarray))
+        self.assertEqual(first.tolist(), second)
+
+    def test_override_returns_copy_of_merge_from(self):
+        merger = MergeArrayOverride(self.manager)
+        merged = merger(self.a, self.b)
+        self.assertArrayEqual(merged, [3, 1, 2])
+        self.assertFalse(merged is self.a)
+        self.assertArrayEqual(merger.merge_many([self.a, self.b]), [3, 1, 2])
+
+    def test_concat_joins_arrays(self):
+        merger = MergeArrayConcat(self.manager)
+        self.assertArrayEqual(merger(self.a, self.b), [3, 1, 2, 2, 5, 4])
+        self.assertArrayEqual(merger(numpy.ones((1, 2)), \
+                numpy.zeros((1, 2))), [[1, 1], [0, 0]])
+        self.assertArrayEqual(merger.merge_many([self.a, self.b, self.a]), \
+                [3, 1, 2, 2, 5, 4, 3, 1, 2])
+
+    def test_unique_returns_sorted_unique_values(self):
+        merger = MergeArrayUnique(self.manager)
+        self.assertArrayEqual(merger(self.a, self.b), [1, 2, 3, 4, 5])
+        self.assertArrayEqual(merger.merge_many([self.a, self.b, \
+                numpy.array([[0, 9]])]), [0, 1, 2, 3, 4, 5, 9])
+
+    def test_elementwise_combines_items(self):
+        merger = MergeArrayElementwise(self.manager)
+        self.assertArrayEqual(merger(self.a, self.b), [5, 6, 6])
+        merger = MergeArrayElementwise(self.manager, numpy.maximum)
+        self.assertArrayEqual(merger(self.a, self.b), [3, 5, 4])
+        self.assertArrayEqual(merger.merge_many([self.a, self.b, \
+                numpy.array([4, 4, 4])]), [4, 5, 4])
+        self.assertRaises(ValueError, partial(merger, self.a, \
+                numpy.array([1, 2])))
+
+    def test_strategies_do_not_call_manager(self):
+        for cls in (MergeArrayOverride, MergeArrayConcat, MergeArrayUnique, \
+                MergeArrayElementwise):
+            cls(self.manager)(self.a, self.b)
+        self.assertEqual(self.manager.call_count, 0)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class ConfigurationNumpyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+
+    def test_arrays_are_overridden_by_default(self):
+        ConfigurationNumpy()(self.manager)
+        merged = self.manager({'a': numpy.array([1]), 'b': numpy.array([2])}, \
+                {'a': numpy.array([3]), 'c': numpy.array([4])})
+        self.assertEqual(dict((k, v.tolist()) for (k, v) in merged.items()), \
+                {'a': [1], 'b': [2], 'c': [4]})
+
+    def test_given_strategy_is_used(self):
+        ConfigurationNumpy(MergeArrayConcat)(self.manager)
+        self.assertEqual(self.manager(numpy.array([1]), \
+                numpy.array([2])).tolist(), [1, 2])
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+##
+# pycomber modules
+#
+from pycomber.manager import Manager
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType
+
+
+class MergeAsyncTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.left = dict(('k%d' % i, {'a': i, 'b': [i]}) for i in range(50))
+        self.right = dict(('k%d' % i, {'a': -i, 'c': set([i])}) \
+                for i in range(0, 100, 2))
+
+    def _run(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_merge_gives_same_result_as_manager(self):
+        self.assertEqual(self._run(self.manager.merge_async(self.left, \
+                self.right)), self.manager(self.left, self.right))
+        self.assertEqual(self._run(self.manager.merge_async(1, 2)), 1)
+
+    def test_merge_gives_control_back_to_event_loop(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def merge(**kwargs):
+            task = asyncio.ensure_future(tick())
+            merged = await self.manager.merge_async(self.left, self.right, \
+                    **kwargs)
+            task.cancel()
+            return merged
+
+        self._run(merge(nodes=10))
+        self.assertTrue(len(ticks) > 10)
+        del ticks[:]
+        self._run(merge(interval=0))
+        self.assertTrue(len(ticks) > 100)
+
+    def test_merge_uses_executor_above_threshold(self):
+        threads = set()
+
+        def strategy(a, b):
+            threads.add(threading.current_thread())
+            return a
+        self.manager.set_strategy(strategy, int, (int, type(None)))
+        executor = ThreadPoolExecutor(1)
+        self._run(self.manager.merge_async(self.left, self.right, \
+                executor=executor, threshold=len(self.left)))
+        executor.shutdown()
+        self.assertFalse(threading.current_thread() in threads)
+        threads.clear()
+        self._run(self.manager.merge_async(self.left, self.right, \
+                threshold=len(self.left) * 2))
+        self.assertEqual(threads, set([threading.current_thread()]))
+
+
+if "__main__" == __name__:
+    unittest.main()
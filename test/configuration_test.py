@@ -14,10 +14,20 @@ from testutils import mock, IsA, IsCallable
 ##
 # pycomber modules
 #
+from pycomber.manager import Manager
+from pycomber.persistent import PersistentMap, PersistentVector
 from pycomber.strategies import MergeAbstract
 from pycomber.configuration import ConfigurationAbstract, \
         ConfigurationAggregate, ConfigurationComplex, ConfigurationPrimitives, \
-        ConfigurationNoneType, ConfigurationImmutable
+        ConfigurationNoneType, ConfigurationImmutable, ConfigurationShared, \
+        ConfigurationPersistent, ConfigurationNumpy
+
+
+def configured(*configurations):
+    manager = Manager()
+    ConfigurationAggregate(ConfigurationComplex(), ConfigurationPrimitives(), \
+            ConfigurationNoneType(), *configurations)(manager)
+    return manager
 
 
 class ConfigurationTestMixin(object):
@@ -94,6 +104,25 @@ class ConfigurationComplexTestCase(unittest.TestCase, ConfigurationTestMixin):
                 IsCallable())
 
 
+class ConfigurationSharedTestCase(unittest.TestCase, ConfigurationTestMixin):
+
+    def setUp(self):
+        self.conf_class = ConfigurationShared
+        ConfigurationTestMixin.setUp(self)
+
+    def test_calls_set_strategy_on_given_object(self):
+        self.conf(self.manager)
+        self.manager.set_strategy.assert_called_with(IsA(MergeAbstract), \
+                IsCallable())
+
+    def test_merge_shares_values_of_lists_and_tuples(self):
+        manager = configured(self.conf)
+        (a, b, c) = ({'x': [1]}, {'y': [2]}, (3, (4,)))
+        merged = manager({'l': [a], 't': (c,)}, {'l': [b], 't': ((5,),)})
+        self.assertTrue(merged['l'][0] is a and merged['l'][1] is b)
+        self.assertTrue([item for item in merged['t'] if item == c][0] is c)
+
+
 class ConfigurationPrimitivesTestCase(unittest.TestCase, ConfigurationTestMixin):
 
     def setUp(self):
@@ -132,6 +161,82 @@ class ConfigurationImmutableTestCase(unittest.TestCase, ConfigurationTestMixin):
         self.manager.set_factory.assert_called_with(IsA(type), \
                 IsCallable())
 
+    def test_merged_lists_are_cast_to_tuples(self):
+        manager = configured(self.conf)
+        self.assertEqual(manager([1, [2]], [3]), (1, 3, (2,)))
+
+
+class ConfigurationPersistentTestCase(unittest.TestCase, \
+        ConfigurationTestMixin):
+
+    def setUp(self):
+        self.conf_class = ConfigurationPersistent
+        ConfigurationTestMixin.setUp(self)
+
+    def test_calls_set_factory_on_given_object(self):
+        self.conf(self.manager)
+        self.manager.set_factory.assert_called_with(IsA(type), \
+                IsCallable())
+
+    def test_calls_set_strategy_on_given_object(self):
+        self.conf(self.manager)
+        self.assertTrue(self.manager.set_strategy.call_count > 0)
+
+    def test_merge_produces_persistent_instances(self):
+        manager = configured(self.conf)
+        base = manager({'a': {'b': [1, {'c': 2}]}, 'd': {'e': set([3])}})
+        self.assertTrue(isinstance(base, PersistentMap))
+        self.assertTrue(isinstance(base['a']['b'], PersistentVector))
+        self.assertTrue(isinstance(base['a']['b'][1], PersistentMap))
+        self.assertEqual(base['d']['e'], frozenset([3]))
+        merged = manager({'a': {'b': [4]}}, base)
+        self.assertEqual(merged, {'a': {'b': [1, {'c': 2}, 4]}, \
+                'd': {'e': frozenset([3])}})
+        self.assertTrue(merged['d'] is base['d'])
+        self.assertTrue(merged['a']['b'][1] is base['a']['b'][1])
+
+    def test_plain_merge_to_is_converted_recursively(self):
+        manager = configured(self.conf)
+        merged = manager({'a': 1}, {'b': {'c': [1, {'d': set([2])}]}})
+        self.assertTrue(isinstance(merged['b'], PersistentMap))
+        self.assertTrue(isinstance(merged['b']['c'], PersistentVector))
+        self.assertTrue(isinstance(merged['b']['c'][1], PersistentMap))
+        self.assertEqual(hash(merged), hash(manager(merged)))
+        merged = manager([1], [[2]])
+        self.assertEqual(list(merged), [PersistentVector([2]), 1])
+        hash(merged)
+
+    def test_merge_of_results_containing_sets(self):
+        manager = configured(self.conf)
+        (a, b) = (manager({'s': set([2])}, None), manager({'s': set([1])}))
+        merged = manager(a, b)
+        self.assertEqual(merged, {'s': frozenset([1, 2])})
+        self.assertTrue(isinstance(merged['s'], frozenset))
+        self.assertEqual(manager({'s': set([3])}, merged)['s'], \
+                frozenset([1, 2, 3]))
+        self.assertTrue(manager({'s': set([2])}, merged)['s'] is merged['s'])
+        self.assertTrue(manager(a, merged) is merged)
+
+
+class ConfigurationNumpyTestCase(unittest.TestCase, ConfigurationTestMixin):
+
+    def setUp(self):
+        self.conf_class = ConfigurationNumpy
+        ConfigurationTestMixin.setUp(self)
+
+    def test_init_accepts_strategy_class(self):
+        strategy = mock.Mock()
+        self.conf_class(strategy)
+
+    def test_calls_set_strategy_on_given_object(self):
+        try:
+            import numpy
+        except ImportError:
+            self.assertRaises(ImportError, partial(self.conf, self.manager))
+        else:
+            self.conf(self.manager)
+            self.assertTrue(self.manager.set_strategy.call_count > 0)
+
 
 if "__main__" == __name__:
     unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+from collections import OrderedDict
+from functools import partial
+
+##
+# pycomber modules
+#
+from pycomber.dispatch import DispatchTable
+from pycomber.strategies import MergePrimitives, MergeNone
+
+
+class DispatchTableTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.table = DispatchTable()
+
+    def test_init_requires_no_arguments(self):
+        err = False
+        try:
+            DispatchTable()
+        except TypeError:
+            err = True
+        self.assertFalse(err)
+
+    def test_with_strategy_returns_new_table(self):
+        table = self.table.with_strategy('a', [(int, int), (int, str)])
+        self.assertFalse(table is self.table)
+        self.assertEqual(table.get_strategy(int, int), 'a')
+        self.assertEqual(table.get_strategy(int, str), 'a')
+        self.assertRaises(TypeError, partial(self.table.get_strategy, int, \
+                int))
+
+    def test_with_strategy_does_not_change_previous_table(self):
+        table = self.table.with_strategy('a', [(int, int)])
+        table.with_strategy('b', [(int, int), (int, str)])
+        self.assertEqual(table.get_strategy(int, int), 'a')
+        self.assertRaises(TypeError, partial(table.get_strategy, int, str))
+
+    def test_with_factory_returns_new_table(self):
+        table = self.table.with_factory(dict, 'a')
+        self.assertEqual(table.get_factory(OrderedDict), 'a')
+        self.assertEqual(table.find_factory(OrderedDict), 'a')
+        self.assertRaises(KeyError, partial(self.table.get_factory, dict))
+        self.assertEqual(self.table.find_factory(dict), None)
+
+    def test_get_strategy_does_not_modify_registered_strategies(self):
+        table = self.table.with_strategy('a', [(dict, dict)])
+        self.assertEqual(table.get_strategy(OrderedDict, OrderedDict), 'a')
+        self.assertRaises(TypeError, partial(table.get_strategy, list, dict))
+        self.assertEqual(table._strategies, {dict: {dict: 'a'}})
+
+    def test_leaf_types_are_types_merged_by_primitives_without_factory(self):
+        NoneType = type(None)
+        table = self.table.with_strategy(MergePrimitives(None), \
+                [(int, NoneType), (str, NoneType), (float, NoneType)]) \
+                .with_strategy(MergeNone(None), [(list, NoneType)]) \
+                .with_strategy('a', [(dict, NoneType)]) \
+                .with_strategy(MergePrimitives(None), [(bytes, bytes)]) \
+                .with_factory(float, int)
+        self.assertEqual(table.leaf_types(), frozenset([int, str]))
+        self.assertTrue(table.leaf_types() is table.leaf_types())
+        self.assertEqual(self.table.leaf_types(), frozenset())
+
+
+if "__main__" == __name__:
+    unittest.main()
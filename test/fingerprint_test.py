@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import gc
+import sys
+import unittest
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.fingerprint import fingerprint, Fingerprint, _interned
+
+
+class FingerprintTestCase(unittest.TestCase):
+
+    def test_returns_hashable_values_as_they_are(self):
+        for value in (1, 'a', None, (1, 'b'), frozenset([1])):
+            self.assertTrue(fingerprint(value) is value)
+
+    def test_returns_hashable_fingerprint_for_unhashable_values(self):
+        for value in ({'a': [1]}, [1, {'b': set([2])}], set([1]), (1, [2])):
+            hash(fingerprint(value))
+
+    def test_equal_structures_have_equal_fingerprints(self):
+        self.assertEqual(fingerprint({'a': [1, {'b': 2}], 'c': set([3])}), \
+                fingerprint({'c': set([3]), 'a': [1, {'b': 2}]}))
+
+    def test_different_structures_have_different_fingerprints(self):
+        self.assertNotEqual(fingerprint({'a': 1}), fingerprint({'a': 2}))
+        self.assertNotEqual(fingerprint([1, 2]), fingerprint([2, 1]))
+        self.assertNotEqual(fingerprint([1]), fingerprint(set([1])))
+        self.assertNotEqual(fingerprint([1]), fingerprint((1,)))
+        self.assertNotEqual(fingerprint([{'a': 1}]), fingerprint([{'a': 2}]))
+        self.assertNotEqual(fingerprint({'a': [1]}), fingerprint({'b': [1]}))
+
+    def test_unhashable_values_are_represented_by_fingerprint_nodes(self):
+        value = fingerprint({'a': [1, set([2])]})
+        self.assertTrue(isinstance(value, Fingerprint))
+        self.assertEqual(hash(value), hash(fingerprint({'a': [1, set([2])]})))
+        self.assertNotEqual(value, ('a', 1))
+
+    def test_hash_of_fingerprint_is_computed_once(self):
+        leaf = mock.Mock()
+        leaf.__hash__ = mock.Mock(return_value=1)
+        value = fingerprint([[leaf], {'a': [leaf]}])
+        calls = leaf.__hash__.call_count
+        hash(value)
+        set([value, fingerprint([value, [value]])])
+        self.assertEqual(leaf.__hash__.call_count, calls)
+
+    def test_cache_reuses_fingerprints_of_the_same_objects(self):
+        shared = {'a': [1]}
+        cache = {}
+        first = fingerprint([shared, 1], cache)
+        self.assertTrue(cache[id(shared)][1] is fingerprint(shared, cache))
+        self.assertTrue(fingerprint({'b': shared}, cache)._items == \
+                frozenset([('b', cache[id(shared)][1])]))
+        self.assertEqual(first, fingerprint([{'a': [1]}, 1]))
+
+    def test_cache_ignores_other_objects_with_the_same_id(self):
+        value = [1]
+        cache = {id(value): ([2], fingerprint([2]))}
+        self.assertEqual(fingerprint(value, cache), fingerprint([1]))
+
+    def test_equal_fingerprints_are_the_same_object(self):
+        self.assertTrue(fingerprint({'a': [1, set([2])]}) is \
+                fingerprint({'a': [1, set([2])]}))
+
+    def test_interned_fingerprints_are_freed_when_released(self):
+        gc.collect()
+        size = len(_interned)
+        fingerprints = [fingerprint([{'id': i, 'x': [i]}]) \
+                for i in range(1000)]
+        self.assertTrue(len(_interned) >= size + 3000)
+        del fingerprints
+        gc.collect()
+        self.assertTrue(len(_interned) <= size)
+
+    def test_values_nested_deeper_than_recursion_limit(self):
+        (left, right) = (1, 1)
+        for i in range(sys.getrecursionlimit() * 2):
+            (left, right) = ({'k': [left]}, {'k': [right]})
+        self.assertEqual(fingerprint(left), fingerprint(right))
+        self.assertNotEqual(fingerprint(left), fingerprint({'k': [right]}))
+
+    def test_strict_fingerprints_distinguish_types_of_leaves(self):
+        for values in ((True, 1, 1.0), ((True,), (1,)), ([True], [1]), \
+                ({True: 'a'}, {1: 'a'}), (frozenset([1]), frozenset([1.0]))):
+            fingerprints = set(fingerprint(v, strict=True) for v in values)
+            self.assertEqual(len(fingerprints), len(values))
+        self.assertEqual(fingerprint([1]), fingerprint([True]))
+        self.assertEqual(fingerprint({'a': (1,)}, strict=True), \
+                fingerprint({'a': (1,)}, strict=True))
+
+    def test_values_containing_themselves_are_rejected(self):
+        value = [1]
+        value.append({'a': value})
+        self.assertRaises(ValueError, fingerprint, value)
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -4,8 +4,12 @@
 ##
 # python standard library
 #
+import pickle
+import sys
+import threading
 import unittest
-from functools import partial
+from collections import OrderedDict, Counter, defaultdict, namedtuple
+from functools import partial, reduce
 
 ##
 # test helpers
@@ -15,7 +19,10 @@ from testutils import mock
 ##
 # pycomber modules
 #
-from pycomber.manager import Manager
+from pycomber.manager import Manager, IterativeManager, Traversal
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType, \
+        ConfigurationImmutable
 
 
 class ManagerTestCase(unittest.TestCase):
@@ -61,6 +68,22 @@ class ManagerTestCase(unittest.TestCase):
         self.manager.set_factory(int, 'a')
         self.assertEqual(self.manager.get_factory(int), 'a')
 
+    def test_get_factory_falls_back_to_factory_for_base_classes(self):
+        self.manager.set_factory(dict, 'a')
+        self.assertEqual(self.manager.get_factory(OrderedDict), 'a')
+
+    def test_set_factory_invalidates_resolved_factories(self):
+        self.manager.set_factory(dict, 'a')
+        self.assertEqual(self.manager.get_factory(OrderedDict), 'a')
+        self.manager.set_factory(OrderedDict, 'b')
+        self.assertEqual(self.manager.get_factory(OrderedDict), 'b')
+        self.assertEqual(self.manager.get_factory(dict), 'a')
+
+    def test_call_returns_merged_value_when_there_is_no_factory(self):
+        self.manager.set_strategy(lambda a, b: [a], str, str)
+        self.manager.set_factory(tuple, tuple)
+        self.assertEqual(self.manager('a', 'b'), ['a'])
+
     def test_factory_must_be_callable(self):
         self.manager.set_strategy(lambda a, b: a, str, str)
         self.manager.set_factory(str, 'a')
@@ -129,6 +152,103 @@ class ManagerTestCase(unittest.TestCase):
         for a, b in (('a', 'c'), ('a', 'd'), ('b', 'c'), ('b', 'd')):
             self.assertEqual(self.manager.get_strategy(a, b), 'strategy')
 
+    def test_get_strategy_falls_back_to_strategy_for_base_classes(self):
+        self.manager.set_strategy('dict', dict)
+        self.manager.set_strategy('tuple', tuple)
+        self.assertEqual(self.manager.get_strategy(OrderedDict, dict), 'dict')
+        self.assertEqual(self.manager.get_strategy(Counter, \
+                defaultdict), 'dict')
+        self.assertEqual(self.manager.get_strategy(namedtuple('P', 'x'), \
+                tuple), 'tuple')
+
+    def test_get_strategy_prefers_closest_base_class(self):
+        self.manager.set_strategy('dict', dict)
+        self.manager.set_strategy('ordered', OrderedDict, dict)
+        self.assertEqual(self.manager.get_strategy(OrderedDict, \
+                OrderedDict), 'ordered')
+        self.assertEqual(self.manager.get_strategy(dict, OrderedDict), 'dict')
+
+    def test_set_strategy_invalidates_resolved_strategies(self):
+        self.manager.set_strategy('dict', dict)
+        self.assertEqual(self.manager.get_strategy(OrderedDict, dict), 'dict')
+        self.manager.set_strategy('ordered', OrderedDict, dict)
+        self.assertEqual(self.manager.get_strategy(OrderedDict, dict), \
+                'ordered')
+
+    def test_get_strategy_raises_type_error_for_unrelated_types(self):
+        self.manager.set_strategy('dict', dict)
+        self.assertRaises(TypeError, partial(self.manager.get_strategy, \
+                list, dict))
+
+    def test_freeze_returns_snapshot_of_configuration(self):
+        self.manager.set_strategy('a', str)
+        self.manager.set_factory(str, 'b')
+        table = self.manager.freeze()
+        self.manager.set_strategy('c', str)
+        self.manager.set_factory(str, 'd')
+        self.assertEqual(table.get_strategy(str, str), 'a')
+        self.assertEqual(table.get_factory(str), 'b')
+        self.assertEqual(self.manager.get_strategy(str, str), 'c')
+        self.assertEqual(self.manager.get_factory(str), 'd')
+
+    def test_concurrent_registrations_are_not_lost(self):
+        types = [[type('T%d_%d' % (i, j), (object,), {}) for j in range(100)] \
+                for i in range(4)]
+
+        def register(group):
+            for t in group:
+                self.manager.set_strategy('strategy', t)
+                self.manager.set_factory(t, 'factory')
+        threads = [threading.Thread(target=register, args=(group,)) \
+                for group in types]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for group in types:
+            for t in group:
+                self.assertEqual(self.manager.get_strategy(t, t), 'strategy')
+                self.assertEqual(self.manager.get_factory(t), 'factory')
+
+    def test_manager_can_be_pickled(self):
+        self.manager.set_strategy(max, int)
+        manager = pickle.loads(pickle.dumps(self.manager))
+        self.assertEqual(manager.get_strategy(int, int), max)
+        manager.set_strategy(min, int)
+        self.assertEqual(manager.get_strategy(int, int), min)
+
+    def test_leaf_types_returns_types_merged_as_primitives(self):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.assertTrue(set([int, str, float, bool]) <= \
+                self.manager.leaf_types())
+        self.assertFalse(set([list, dict, set, tuple]) & \
+                self.manager.leaf_types())
+        self.manager.enable_profiling()
+        self.assertEqual(self.manager.leaf_types(), frozenset())
+
+    def test_enable_profiling_records_calls_of_strategies_and_factories(self):
+        self.manager.set_strategy(lambda a, b: a + b, str)
+        self.manager.set_factory(str, str.upper)
+        profile = self.manager.enable_profiling()
+        self.assertEqual(self.manager('a', 'b'), 'AB')
+        stats = profile.as_dict()
+        self.assertEqual(stats['strategies'][(str, str)]['calls'], 1)
+        self.assertEqual(stats['factories'][str]['calls'], 1)
+
+    def test_profiling_survives_registration_of_strategies(self):
+        profile = self.manager.enable_profiling()
+        self.manager.set_strategy(lambda a, b: a, int)
+        self.manager(1, 2)
+        self.assertEqual(list(profile.as_dict()['strategies']), [(int, int)])
+
+    def test_disable_profiling_restores_plain_dispatch(self):
+        self.manager.set_strategy('a', str)
+        profile = self.manager.enable_profiling()
+        self.assertTrue(self.manager.disable_profiling() is profile)
+        self.assertTrue(self.manager.disable_profiling() is None)
+        self.assertEqual(self.manager.get_strategy(str, str), 'a')
+
     def test_strategy_must_be_callable(self):
         self.manager.set_strategy('a', str, str)
         self.assertRaises(TypeError, partial(self.manager, 'a', 'b'))
@@ -204,6 +324,210 @@ class ManagerTestCase(unittest.TestCase):
         self.assertEqual(self.manager('b', 'c'), 'g')
         f.assert_called_once_with(1)
 
+    def test_cast_uses_factory_for_type_of_given_value(self):
+        self.manager.set_factory(list, tuple)
+        self.assertEqual(self.manager.cast([1]), (1,))
+        self.assertEqual(self.manager.cast('a'), 'a')
+        self.assertEqual(self.manager.find_factory(list), tuple)
+        self.assertEqual(self.manager.find_factory(str), None)
+
+    def test_decompose_splits_merge_using_strategy(self):
+        s = mock.Mock()
+        s.decompose.return_value = ([('b', 'c')], ''.join)
+        self.manager.set_strategy(s, str, str)
+        self.assertEqual(self.manager.decompose('b', 'c'), \
+                ([('b', 'c')], ''.join))
+        s.decompose.assert_called_once_with('b', 'c')
+        self.assertEqual(s.call_count, 0)
+
+    def test_decompose_returns_none_for_plain_callables(self):
+        self.manager.set_strategy(lambda a, b: a, str, str)
+        self.assertEqual(self.manager.decompose('b', 'c'), None)
+
+    def test_merge_into_updates_target_in_place(self):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        (inner, items) = ({'b': 1}, [1])
+        target = {'a': inner, 'c': items, 'd': 'x'}
+        merged = self.manager.merge_into(target, {'a': {'e': 2}, 'c': [2], \
+                'd': 'y', 'f': None})
+        self.assertTrue(merged is target)
+        self.assertTrue(merged['a'] is inner)
+        self.assertTrue(merged['c'] is items)
+        self.assertEqual(merged, {'a': {'b': 1, 'e': 2}, 'c': [1, 2], \
+                'd': 'y', 'f': None})
+
+    def test_merge_into_does_not_share_subtrees_of_source(self):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        source = {'db': {'host': 'a', 'opts': [{'x': 1}]}, 's': set([1])}
+        target = self.manager.merge_into({}, source)
+        self.manager.merge_into(target, {'db': {'port': 5, \
+                'opts': [{'y': 2}]}, 's': set([2])})
+        self.assertEqual(source, {'db': {'host': 'a', 'opts': [{'x': 1}]}, \
+                's': set([1])})
+        copied = self.manager.merge_into(None, source)
+        self.assertEqual(copied, source)
+        self.manager.merge_into(copied, {'db': {'port': 5}})
+        self.assertEqual(source['db'], {'host': 'a', 'opts': [{'x': 1}]})
+
+    def test_merge_into_keeps_state_of_copied_containers(self):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+
+        class Named(dict):
+            def __init__(self, name, *args):
+                dict.__init__(self, *args)
+                self.name = name
+
+        class Uncopyable(dict):
+            def __copy__(self):
+                raise TypeError("Can not be copied")
+        source = {'d': defaultdict(list, {'a': [1]}), \
+                'n': Named('x', {'b': 1}), 'u': Uncopyable({'c': 1})}
+        target = self.manager.merge_into({}, source)
+        self.assertTrue(target['d'].default_factory is list)
+        self.assertEqual(target['d'], {'a': [1]})
+        self.assertFalse(target['d']['a'] is source['d']['a'])
+        self.assertEqual((type(target['n']), target['n'].name), (Named, 'x'))
+        self.assertEqual(target['n'], {'b': 1})
+        self.assertEqual(target['u'], {'c': 1})
+
+    def test_merge_many_gives_same_result_as_reduce(self):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        objs = ({'a': 1, 'b': {'c': [1]}}, {'a': 2, 'd': set([1])}, \
+                {'b': {'c': [2], 'e': None}, 'd': set([2])}, \
+                {'b': None, 'f': (1,)})
+        self.assertEqual(self.manager.merge_many(*objs), \
+                reduce(self.manager, objs))
+        self.assertEqual(self.manager.merge_many(*objs[:2]), \
+                self.manager(*objs[:2]))
+        self.assertEqual(self.manager.merge_many(objs[0]), \
+                self.manager(objs[0]))
+        self.assertEqual(self.manager.merge_many(), None)
+
+    def test_merge_many_merges_all_objects_at_once(self):
+        s = mock.Mock(return_value='a')
+        s.merge_many.return_value = 'b'
+        self.manager.set_strategy(s, str)
+        self.assertEqual(self.manager.merge_many('c', 'd', 'e'), 'b')
+        s.merge_many.assert_called_once_with(('c', 'd', 'e'))
+        self.assertEqual(s.call_count, 0)
+
+    def test_merge_many_reduces_objects_of_different_types(self):
+        self.manager.set_strategy(lambda a, b: a + b, str)
+        self.manager.set_strategy(lambda a, b: a + str(b), str, int)
+        self.assertEqual(self.manager.merge_many('a', 'b', 1), 'ab1')
+
+    def test_merge_many_reduces_objects_of_unregistered_type_pairs(self):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType(), \
+                ConfigurationImmutable())(self.manager)
+        objs = ([1], [2], (3,))
+        self.assertRaises(TypeError, partial(self.manager.get_strategy, \
+                list, tuple))
+        self.assertEqual(self.manager.merge_many(*objs), \
+                reduce(self.manager, objs))
+
+    def test_merge_into_returns_new_instance_when_strategy_allocates(self):
+        self.manager.set_strategy(lambda a, b: a + b, str)
+        self.manager.set_factory(str, len)
+        self.assertEqual(self.manager.merge_into('ab', 'c'), 3)
+
+
+class IterativeManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = self._configure(IterativeManager())
+        self.recursive = self._configure(Manager())
+
+    def _configure(self, manager):
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(manager)
+        return manager
+
+    def test_call_gives_same_results_as_recursive_manager(self):
+        a = {'a': 1, 'b': {'c': [3, {'d': 4}], 'e': set([5])}, 'f': (6,)}
+        b = {'a': 2, 'b': {'c': [3, 33], 'g': None}, 'f': (66,)}
+        for (f, t) in ((a, b), (b, a), (a, None), (1, 2)):
+            merged = self.manager(f, t)
+            expected = self.recursive(f, t)
+            if isinstance(expected, dict):
+                merged['b']['c'] = list(merged['b']['c'])
+                expected['b']['c'] = list(expected['b']['c'])
+            self.assertEqual(merged, expected)
+
+    def test_call_merges_objects_nested_deeper_than_recursion_limit(self):
+        (a, b) = ({}, {})
+        (left, right) = (a, b)
+        for i in range(sys.getrecursionlimit() * 2):
+            left['x'] = {}
+            right['x'] = {}
+            (left, right) = (left['x'], right['x'])
+        left['y'] = 1
+        right['z'] = 2
+        merged = self.manager(a, b)
+        depth = 0
+        while 'x' in merged:
+            merged = merged['x']
+            depth += 1
+        self.assertEqual(depth, sys.getrecursionlimit() * 2)
+        self.assertEqual(merged, {'y': 1, 'z': 2})
+
+    def test_call_merges_lists_nested_deeper_than_recursion_limit(self):
+        (left, right) = (1, 1)
+        for i in range(sys.getrecursionlimit() * 2):
+            (left, right) = ({'k': [left]}, {'k': [right]})
+        merged = self.manager(left, right)
+        depth = 0
+        while isinstance(merged, dict):
+            self.assertEqual(len(merged['k']), 1)
+            merged = merged['k'][0]
+            depth += 1
+        self.assertEqual(depth, sys.getrecursionlimit() * 2)
+        self.assertEqual(merged, 1)
+
+    def test_call_uses_strategies_that_can_not_be_decomposed(self):
+        s = mock.Mock(return_value='a', decompose=None)
+        self.manager.set_strategy(s, str, str)
+        self.assertEqual(self.manager('b', 'c'), 'a')
+        s.assert_called_once_with('b', 'c')
+
+    def test_call_casts_merged_containers(self):
+        self.manager.set_factory(dict, len)
+        self.assertEqual(self.manager({'a': {'b': 1}}, {'c': 2}), 2)
+
+
+class TraversalTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.left = {'a': 1, 'b': {'c': {'d': [1, {}]}, 'e': 2}, 'f': {}}
+        self.right = {'a': 2, 'b': {'c': {'g': 3}}, 'h': {'i': None}}
+
+    def test_run_merges_all_nodes_by_default(self):
+        traversal = Traversal(self.manager, \
+                *self.manager.decompose(self.left, self.right))
+        self.assertTrue(traversal.run())
+        self.assertEqual(traversal.value, self.manager(self.left, self.right))
+
+    def test_run_merges_given_number_of_nodes(self):
+        expected = self.manager(self.left, self.right)
+        steps = []
+        for nodes in range(1, 10):
+            traversal = Traversal(self.manager, \
+                    *self.manager.decompose(self.left, self.right))
+            steps.append(1)
+            while not traversal.run(nodes):
+                steps[-1] += 1
+            self.assertEqual(traversal.value, expected)
+        self.assertTrue(traversal.run(1))
+        self.assertEqual(steps, sorted(steps, reverse=True))
+        self.assertTrue(steps[0] > steps[-1] == 1)
+
 
 if "__main__" == __name__:
     unittest.main()
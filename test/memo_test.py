@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+from functools import partial
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.manager import Manager
+from pycomber.memo import MergeCache
+from pycomber.fingerprint import fingerprint
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType, \
+        ConfigurationImmutable
+
+
+class MergeCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType(), \
+                ConfigurationImmutable())(self.manager)
+        self.base = {'a': 1, 'b': {'c': [1, 2]}, 'd': {'e': 1}}
+        self.overlay = {'a': 2, 'b': {'c': [3]}}
+
+    def test_memoize_returns_merge_cache(self):
+        self.assertTrue(isinstance(self.manager.memoize(), MergeCache))
+
+    def test_init_requires_immutable_configuration(self):
+        manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(manager)
+        self.assertRaises(TypeError, partial(MergeCache, manager))
+
+    def test_call_gives_same_result_as_manager(self):
+        cache = self.manager.memoize()
+        self.assertEqual(dict(cache(self.overlay, self.base)), \
+                dict(self.manager(self.overlay, self.base)))
+
+    def test_call_returns_cached_result_for_equal_objects(self):
+        cache = self.manager.memoize()
+        merged = cache(self.overlay, self.base)
+        self.assertTrue(cache({'a': 2, 'b': {'c': [3]}}, self.base) is merged)
+        self.assertEqual(cache.info(), {'hits': 1, 'misses': 1, \
+                'evictions': 0, 'size': 1, 'maxsize': 128})
+
+    def test_call_distinguishes_objects_of_different_types(self):
+        cache = self.manager.memoize()
+        self.assertEqual(type(cache(1, None)), int)
+        self.assertEqual(type(cache(True, None)), bool)
+
+    def test_call_distinguishes_leaves_of_different_types(self):
+        cache = self.manager.memoize()
+        for value in (True, 1, 1.0):
+            merged = cache({'a': value, 'c': (value,)}, {'b': 2})
+            self.assertEqual(type(merged['a']), type(value))
+            self.assertEqual(type(merged['c'][0]), type(value))
+        for key in (True, 1):
+            self.assertEqual(type(list(cache({key: 1}, {}))[0]), \
+                    type(key))
+        self.assertEqual(cache.info()['hits'], 0)
+
+    def test_call_evicts_least_recently_used_results(self):
+        cache = self.manager.memoize(maxsize=2)
+        cache(1, 2)
+        cache(3, 4)
+        cache(1, 2)
+        cache(5, 6)
+        self.assertEqual(cache.info()['evictions'], 1)
+        cache(1, 2)
+        self.assertEqual(cache.info()['hits'], 2)
+        cache(3, 4)
+        self.assertEqual(cache.info()['misses'], 4)
+
+    def test_call_caches_subtrees_on_demand(self):
+        cache = self.manager.memoize(subtrees=True)
+        cache(self.overlay, self.base)
+        misses = cache.info()['misses']
+        cache({'a': 3, 'b': {'c': [3]}}, self.base)
+        self.assertTrue(cache.info()['hits'] > 0)
+        self.assertTrue(cache.info()['misses'] < misses * 2)
+
+    def test_call_shares_fingerprints_of_subtrees(self):
+        cache = self.manager.memoize(subtrees=True)
+        with mock.patch('pycomber.memo.fingerprint', \
+                wraps=fingerprint) as fingerprinted:
+            cache(self.overlay, self.base)
+        caches = set(id(args[1]) for (args, kwargs) \
+                in fingerprinted.call_args_list)
+        self.assertTrue(fingerprinted.call_count > 2)
+        self.assertEqual(len(caches), 1)
+
+    def test_clear_removes_cached_results(self):
+        cache = self.manager.memoize()
+        cache(1, 2)
+        cache.clear()
+        self.assertEqual(cache.info(), {'hits': 0, 'misses': 0, \
+                'evictions': 0, 'size': 0, 'maxsize': 128})
+
+
+if "__main__" == __name__:
+    unittest.main()
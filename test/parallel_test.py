@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.manager import Manager
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType
+from pycomber import parallel
+
+
+class MergeParallelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.left = dict(('k%d' % i, {'a': i, 'b': [i]}) for i in range(50))
+        self.right = dict(('k%d' % i, {'a': -i, 'c': set([i])}) \
+                for i in range(0, 100, 2))
+
+    def test_merge_gives_same_result_as_manager(self):
+        self.assertEqual(self.manager.merge_parallel(self.left, self.right, \
+                workers=2, threshold=1), self.manager(self.left, self.right))
+
+    def test_merge_stays_serial_below_threshold(self):
+        with mock.patch.object(parallel, 'ProcessPoolExecutor') as pool:
+            merged = self.manager.merge_parallel(self.left, self.right)
+        self.assertEqual(pool.call_count, 0)
+        self.assertEqual(merged, self.manager(self.left, self.right))
+
+    def test_merge_stays_serial_for_strategies_that_can_not_be_split(self):
+        with mock.patch.object(parallel, 'ProcessPoolExecutor') as pool:
+            merged = self.manager.merge_parallel(1, 2, threshold=0)
+        self.assertEqual(pool.call_count, 0)
+        self.assertEqual(merged, 1)
+
+    def test_merge_applies_factories_to_merged_object(self):
+        self.manager.set_factory(dict, len)
+        self.assertEqual(self.manager.merge_parallel(self.left, self.right, \
+                workers=2, threshold=1), 75)
+
+
+if "__main__" == __name__:
+    unittest.main()
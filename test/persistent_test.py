@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+from functools import partial
+
+##
+# pycomber modules
+#
+from pycomber.persistent import PersistentMap, PersistentVector
+
+
+class Collision(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, Collision) and self.name == other.name
+
+
+class PersistentMapTestCase(unittest.TestCase):
+
+    def test_init_accepts_mapping_or_pairs(self):
+        self.assertEqual(dict(PersistentMap()), {})
+        self.assertEqual(dict(PersistentMap({'a': 1})), {'a': 1})
+        self.assertEqual(dict(PersistentMap([('a', 1), ('a', 2)])), {'a': 2})
+
+    def test_instance_behaves_as_dict(self):
+        obj = PersistentMap({'a': 1})
+        self.assertEqual(obj['a'], 1)
+        self.assertEqual(len(obj), 1)
+        self.assertTrue('a' in obj)
+        self.assertFalse('b' in obj)
+        self.assertEqual(list(iter(obj)), ['a'])
+        self.assertEqual(obj.get('b', 2), 2)
+        self.assertRaises(KeyError, partial(obj.__getitem__, 'b'))
+
+    def test_instance_is_immutable(self):
+        obj = PersistentMap({'a': 1})
+        self.assertFalse(hasattr(obj, '__setitem__'))
+        self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_assoc_returns_new_map(self):
+        obj = PersistentMap({'a': 1})
+        new = obj.assoc('b', 2).assoc('a', 3)
+        self.assertEqual(dict(obj), {'a': 1})
+        self.assertEqual(dict(new), {'a': 3, 'b': 2})
+        self.assertTrue(obj.assoc('a', 1) is obj)
+
+    def test_dissoc_returns_new_map(self):
+        obj = PersistentMap({'a': 1, 'b': 2})
+        self.assertEqual(dict(obj.dissoc('a')), {'b': 2})
+        self.assertEqual(dict(obj.dissoc('a').dissoc('b')), {})
+        self.assertTrue(obj.dissoc('c') is obj)
+        self.assertEqual(dict(obj), {'a': 1, 'b': 2})
+
+    def test_handles_many_keys(self):
+        obj = PersistentMap()
+        for i in range(5000):
+            obj = obj.assoc(i, str(i))
+        self.assertEqual(len(obj), 5000)
+        self.assertEqual(dict(obj), dict((i, str(i)) for i in range(5000)))
+        for i in range(0, 5000, 2):
+            obj = obj.dissoc(i)
+        self.assertEqual(dict(obj), \
+                dict((i, str(i)) for i in range(1, 5000, 2)))
+
+    def test_handles_hash_collisions(self):
+        (a, b, c) = (Collision('a'), Collision('b'), Collision('c'))
+        obj = PersistentMap({a: 1, b: 2, 10: 3}).assoc(c, 4).assoc(a, 5)
+        self.assertEqual(len(obj), 4)
+        self.assertEqual((obj[a], obj[b], obj[c], obj[10]), (5, 2, 4, 3))
+        obj = obj.dissoc(b).dissoc(a)
+        self.assertEqual(dict(obj), {c: 4, 10: 3})
+
+    def test_assoc_shares_untouched_values(self):
+        value = {'x': 1}
+        obj = PersistentMap((i, value) for i in range(100)).assoc(1, 2)
+        self.assertTrue(obj[99] is value)
+
+    def test_instance_is_hashable(self):
+        self.assertEqual(hash(PersistentMap({'a': 1, 'b': 2})), \
+                hash(PersistentMap({'b': 2}).assoc('a', 1)))
+        self.assertEqual(len(set([PersistentMap({'a': 1}), \
+                PersistentMap({'a': 1}), PersistentMap({'a': 2})])), 2)
+
+    def test_instance_equals_mappings_with_same_items(self):
+        self.assertEqual(PersistentMap({'a': 1}), PersistentMap({'a': 1}))
+        self.assertEqual(PersistentMap({'a': 1}), {'a': 1})
+        self.assertNotEqual(PersistentMap({'a': 1}), PersistentMap({'a': 2}))
+        self.assertNotEqual(PersistentMap({'a': 1}), [('a', 1)])
+
+
+class PersistentVectorTestCase(unittest.TestCase):
+
+    def test_instance_behaves_as_sequence(self):
+        obj = PersistentVector([1, 2, 3])
+        self.assertEqual(len(obj), 3)
+        self.assertEqual(list(obj), [1, 2, 3])
+        self.assertEqual((obj[0], obj[-1]), (1, 3))
+        self.assertEqual(list(obj[1:]), [2, 3])
+        self.assertTrue(2 in obj)
+        self.assertEqual(obj.index(3), 2)
+        self.assertRaises(IndexError, partial(obj.__getitem__, 3))
+        self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_append_returns_new_vector(self):
+        obj = PersistentVector([1])
+        self.assertEqual(list(obj.append(2)), [1, 2])
+        self.assertEqual(list(obj), [1])
+
+    def test_assoc_returns_new_vector(self):
+        obj = PersistentVector(range(100))
+        new = obj.assoc(5, 'a').assoc(99, 'b').assoc(-1, 'c').assoc(100, 'd')
+        self.assertEqual(list(new), \
+                list(range(5)) + ['a'] + list(range(6, 99)) + ['c', 'd'])
+        self.assertEqual(list(obj), list(range(100)))
+        self.assertRaises(IndexError, partial(obj.assoc, 101, 1))
+
+    def test_handles_many_items(self):
+        obj = PersistentVector()
+        for i in range(40000):
+            obj = obj.append(i)
+        self.assertEqual(list(obj), list(range(40000)))
+        self.assertEqual(obj[1056], 1056)
+        self.assertEqual(obj.assoc(33000, 'a')[33000], 'a')
+        self.assertEqual(obj[33000], 33000)
+
+    def test_append_shares_nodes(self):
+        value = {'x': 1}
+        obj = PersistentVector([value] * 1000).append(1)
+        self.assertTrue(obj[0] is value)
+
+    def test_instance_is_hashable(self):
+        self.assertEqual(hash(PersistentVector([1, 2])), \
+                hash(PersistentVector([1]).append(2)))
+
+    def test_instance_equals_sequences_with_same_items(self):
+        self.assertEqual(PersistentVector([1, 2]), PersistentVector([1, 2]))
+        self.assertEqual(PersistentVector([1, 2]), [1, 2])
+        self.assertEqual(PersistentVector([1, 2]), (1, 2))
+        self.assertNotEqual(PersistentVector([1, 2]), [1, 3])
+        self.assertNotEqual(PersistentVector([1, 2]), [1])
+        self.assertNotEqual(PersistentVector([1, 2]), set([1, 2]))
+
+
+if "__main__" == __name__:
+    unittest.main()
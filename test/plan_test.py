@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+from functools import partial
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.manager import Manager
+from pycomber.plan import MergePlan
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType
+
+
+class MergePlanTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.left = {'a': 1, 'b': {'c': 'x', 'd': set([1])}, 'e': None}
+        self.right = {'a': 2, 'b': {'c': 'y', 'd': set([2])}, 'e': (1,)}
+
+    def test_compile_returns_merge_plan(self):
+        self.assertTrue(isinstance(self.manager.compile(self.left, \
+                self.right), MergePlan))
+
+    def test_compile_requires_strategies_for_samples(self):
+        self.assertRaises(TypeError, partial(self.manager.compile, {'a': 1}, \
+                {'a': object()}))
+
+    def test_plan_gives_same_results_as_manager(self):
+        plan = self.manager.compile(self.left, self.right)
+        other = {'a': 3, 'b': {'c': 'z', 'd': set([3])}, 'e': None}
+        self.assertEqual(plan(other, self.right), self.manager(other, \
+                self.right))
+
+    def test_plan_does_not_lookup_strategies_for_known_types(self):
+        plan = self.manager.compile(self.left, self.right)
+        self.manager.get_strategy = mock.Mock()
+        plan(self.left, self.right)
+        self.assertEqual(self.manager.get_strategy.call_count, 0)
+
+    def test_plan_merges_containers_not_decomposed_in_samples(self):
+        plan = self.manager.compile(set([1]), set([2]))
+        self.assertEqual(plan(set([(1,)]), set([2])), set([(1,), 2]))
+        plan = self.manager.compile(set([(1,)]), set([2]))
+        self.assertEqual(plan(set([1]), set([2])), set([1, 2]))
+
+    def test_plan_falls_back_to_manager_for_unknown_types(self):
+        plan = self.manager.compile(self.left, self.right)
+        merged = plan({'a': [1], 'b': 2.5}, {'a': [2], 'b': None})
+        self.assertEqual(list(merged['a']), [1, 2])
+        self.assertEqual(merged['b'], 2.5)
+
+    def test_plan_applies_factories(self):
+        self.manager.set_factory(set, frozenset)
+        plan = self.manager.compile(self.left, self.right)
+        self.assertEqual(plan(self.left, self.right)['b']['d'], \
+                frozenset([1, 2]))
+
+
+if "__main__" == __name__:
+    unittest.main()
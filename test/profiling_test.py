@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import unittest
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.dispatch import DispatchTable
+from pycomber.profiling import Profile, ProfilingTable, ProfiledStrategy
+from pycomber.manager import Manager, IterativeManager
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType
+
+
+class ProfileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = mock.Mock()
+        self.profile = Profile(self.hook)
+
+    def test_measure_strategy_returns_result_of_strategy(self):
+        self.assertEqual(self.profile.measure_strategy((int, int), \
+                lambda a, b: a + b, 1, 2), 3)
+
+    def test_measure_strategy_counts_calls_and_nodes(self):
+        key = (int, int)
+        self.profile.measure_strategy(key, lambda a, b: a, 1, 2)
+        self.profile.measure_strategy(key, lambda a, b: a, 1, 2)
+        stats = self.profile.as_dict()['strategies'][key]
+        self.assertEqual(stats['calls'], 2)
+        self.assertEqual(stats['nodes'], 2)
+        self.assertTrue(stats['time'] >= 0)
+
+    def test_nested_calls_are_counted_once_in_time_and_nodes(self):
+        (outer, inner) = ((list, list), (int, int))
+        def merge(a, b):
+            self.profile.measure_strategy(inner, lambda a, b: a, 1, 2)
+            if a:
+                self.profile.measure_strategy(outer, merge, a - 1, b)
+        self.profile.measure_strategy(outer, merge, 1, None)
+        stats = self.profile.as_dict()['strategies']
+        self.assertEqual(stats[outer]['calls'], 2)
+        self.assertEqual(stats[outer]['nodes'], 4)
+        self.assertEqual(stats[inner]['calls'], 2)
+        self.assertEqual(stats[inner]['nodes'], 2)
+
+    def test_measure_factory_counts_calls(self):
+        self.assertEqual(self.profile.measure_factory(list, tuple, [1]), (1,))
+        self.assertEqual(self.profile.as_dict()['factories'][list]['calls'], 1)
+
+    def test_hook_is_called_after_every_call(self):
+        self.profile.measure_strategy((int, int), lambda a, b: a, 1, 2)
+        self.profile.measure_factory(list, tuple, [1])
+        self.assertEqual([c[0][:2] for c in self.hook.call_args_list], \
+                [('strategy', (int, int)), ('factory', list)])
+
+    def test_failed_calls_are_recorded(self):
+        def fail(a, b):
+            raise TypeError()
+        self.assertRaises(TypeError, self.profile.measure_strategy, \
+                (int, int), fail, 1, 2)
+        self.assertEqual(self.profile.as_dict()['strategies'][(int, int)] \
+                ['calls'], 1)
+
+    def test_reset_removes_statistics(self):
+        self.profile.measure_strategy((int, int), lambda a, b: a, 1, 2)
+        self.profile.reset()
+        self.assertEqual(self.profile.as_dict(), \
+                {'strategies': {}, 'factories': {}})
+
+
+class ProfilingTableTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.strategy = mock.Mock(return_value=1)
+        self.profile = Profile()
+        self.table = ProfilingTable(DispatchTable().with_strategy( \
+                self.strategy, [(int, int)]).with_factory(list, tuple), \
+                self.profile)
+
+    def test_get_strategy_returns_wrapped_strategy(self):
+        strategy = self.table.get_strategy(int, int)
+        self.assertTrue(isinstance(strategy, ProfiledStrategy))
+        self.assertTrue(self.table.get_strategy(int, int) is strategy)
+        self.assertEqual(strategy(1, 2), 1)
+        self.strategy.assert_called_once_with(1, 2)
+        self.assertEqual(strategy.update, self.strategy.update)
+
+    def test_wrapped_strategy_measures_splits(self):
+        strategy = self.table.get_strategy(int, int)
+        self.strategy.decompose.return_value = ([], list)
+        self.assertEqual(strategy.decompose(1, 2), ([], list))
+        self.strategy.decompose.assert_called_once_with(1, 2)
+        self.strategy.decompose.return_value = None
+        self.assertTrue(strategy.decompose(1, 2) is None)
+        stats = self.profile.as_dict()['strategies'][(int, int)]
+        self.assertEqual((stats['calls'], stats['nodes']), (1, 1))
+
+    def test_wrapped_strategy_keeps_missing_decompose(self):
+        self.strategy.decompose = None
+        strategy = self.table.get_strategy(int, int)
+        self.assertTrue(strategy.decompose is None)
+
+    def test_find_factory_returns_wrapped_factory(self):
+        self.assertEqual(self.table.find_factory(list)([1]), (1,))
+        self.assertEqual(self.table.get_factory(list)([1]), (1,))
+        self.assertTrue(self.table.find_factory(set) is None)
+        self.assertEqual(self.profile.as_dict()['factories'][list]['calls'], 2)
+
+    def test_registration_returns_profiling_table(self):
+        table = self.table.with_strategy(self.strategy, [(str, str)])
+        self.assertTrue(isinstance(table, ProfilingTable))
+        self.assertTrue(table.profile is self.profile)
+        table = self.table.with_factory(set, frozenset)
+        self.assertTrue(isinstance(table, ProfilingTable))
+
+    def test_unwrap_returns_plain_table(self):
+        table = self.table.unwrap()
+        self.assertFalse(isinstance(table, ProfilingTable))
+        self.assertTrue(table.get_strategy(int, int) is self.strategy)
+
+
+class ProfiledMergeTestCase(unittest.TestCase):
+
+    def test_profile_covers_whole_merge(self):
+        manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(manager)
+        profile = manager.enable_profiling()
+        self.assertEqual(manager({'a': [1], 'b': 1}, {'a': [2]}), \
+                {'a': [1, 2], 'b': 1})
+        stats = profile.as_dict()['strategies']
+        self.assertEqual(stats[(dict, dict)]['nodes'], 5)
+        self.assertEqual(stats[(list, list)]['nodes'], 3)
+        self.assertEqual(stats[(int, type(None))]['calls'], 3)
+
+    def test_profile_covers_decomposed_merges(self):
+        manager = IterativeManager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(manager)
+        profile = manager.enable_profiling()
+        manager({'a': {'b': 1}}, {'a': {'c': 2}})
+        stats = profile.as_dict()['strategies']
+        self.assertEqual(stats[(dict, dict)]['calls'], 2)
+        self.assertEqual(stats[(dict, dict)]['nodes'], 2)
+        self.assertEqual(stats[(int, type(None))]['calls'], 2)
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -6,7 +6,10 @@ import sys
 import unittest
 
 TEST_MODULES = ['manager_test', 'strategies_test', 'value_objects_test', \
-        'configuration_test']
+        'configuration_test', 'plan_test', 'fingerprint_test', \
+        'parallel_test', 'dispatch_test', 'asynchronous_test', \
+        'stream_test', 'memo_test', 'persistent_test', \
+        'profiling_test', 'arrays_test']
 
 
 def all():
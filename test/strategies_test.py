@@ -18,14 +18,23 @@ from testutils import mock
 # pycomber modules
 #
 from pycomber.strategies import MergeAbstract, MergeList, MergeListOverride, \
-    MergeSet, MergeSetOverride, MergeTuple, MergeTupleOverride, MergeDict, \
-    MergeDictOverride, MergePrimitives, MergeNone
+    MergeListOrdered, MergeListOrderedOverride, MergeListStream, \
+    MergeListStreamOverride, MergeListPositional, MergeListKeyed, \
+    MergeSet, MergeSetOverride, MergeTuple, MergeTupleOverride, \
+    MergeTupleConcat, MergeTupleOrdered, MergeTuplePositional, MergeDict, \
+    MergeDictOverride, MergeDictHashJoin, MergeDictHashJoinOverride, \
+    MergeDictShared, MergeListShared, MergeSetShared, MergeTupleShared, \
+    MergePersistentMap, MergePersistentVector, MergePersistentSet, \
+    MergePrimitives, MergeNone
+from pycomber.persistent import PersistentMap, PersistentVector
 
 
 class MergeTestMixin(object):
 
     def setUp(self):
         self.manager = mock.Mock(side_effect = lambda a, b=None: a)
+        self.manager.merge_into.side_effect = lambda target, source: source
+        self.manager.leaf_types.return_value = frozenset()
         self.merger = self.merger_class(self.manager)
 
     def test_init_requires_one_argument(self):
@@ -63,6 +72,13 @@ class MergeAbstractTestCase(unittest.TestCase, MergeTestMixin):
     def test_call_must_be_implemented(self):
         self.assertRaises(RuntimeError, partial(self.merger, None, None))
 
+    def test_decompose_is_not_supported_by_default(self):
+        self.assertEqual(self.merger.decompose(None, None), None)
+
+    def test_update_calls_merger_by_default(self):
+        self.assertRaises(NotImplementedError, partial(self.merger.update, \
+                None, None))
+
 
 class MergeNoneTestCase(unittest.TestCase, MergeTestMixin):
 
@@ -97,7 +113,34 @@ class MergeListTestCase(unittest.TestCase, MergeTestMixin):
         MergeTestMixin.setUp(self)
 
     def test_merge_generates_union_of_two_list(self):
-        self.assertEqual(list(self.merger([1], [2])), [1, 2])
+        self.assertEqual(self.merger([1], [2]), [1, 2])
+
+    def test_merge_removes_equal_unhashable_values_only(self):
+        self.assertEqual(self.merger([{'a': 1}], [{'a': 2}]), \
+                [{'a': 1}, {'a': 2}])
+        self.assertEqual(self.merger([{'a': 1}], [{'a': 1}]), [{'a': 1}])
+        self.assertEqual(self.merger([{'a': 1}, [1]], [{'a': 1}]), \
+                [{'a': 1}, [1]])
+        self.assertEqual(self.merger([-1], [-2]), [-2, -1])
+
+    def test_leaf_values_are_not_merged_one_by_one(self):
+        self.manager.leaf_types.return_value = frozenset([int, str])
+        self.assertEqual(self.merger([3, 1, 'a'], [2, 1]), [1, 2, 3, 'a'])
+        self.assertEqual(self.merger.update([3, 1, 4], [1, 2]), [1, 2, 3, 4])
+        self.assertEqual(self.manager.call_count, 0)
+        self.assertEqual(self.merger([{'a': 1}], [1]), [1, {'a': 1}])
+        self.assertEqual(self.manager.call_count, 2)
+        self.assertEqual(self.merger.decompose([3, 1], [2]), None)
+
+    def test_merge_many_generates_union_of_all_lists(self):
+        self.assertEqual(self.merger.merge_many([[3, 1], [2], [1, 4]]), \
+                [1, 2, 3, 4])
+        self.assertEqual(self.manager.call_count, 4)
+
+    def test_decompose_builds_list(self):
+        (children, build) = self.merger.decompose([1], [2])
+        self.assertEqual(children, [(1,), (2,)])
+        self.assertEqual(build([1, 2]), [1, 2])
 
     def test_merge_returns_unique_values(self):
         self.assertEqual(list(self.merger([1, 2], [2, 3])), [1, 2, 3])
@@ -110,6 +153,14 @@ class MergeListTestCase(unittest.TestCase, MergeTestMixin):
         list(self.merger([1, 2, d], [2, 3]))
         self.assertEqual(self.manager.call_count, 4)
 
+    def test_update_appends_missing_values_to_merge_to(self):
+        merge_to = [3, {'a': 1}]
+        merged = self.merger.update([1, {'a': 2}, 3, {'a': 1}, 1], merge_to)
+        self.assertTrue(merged is merge_to)
+        self.assertEqual(merged, [3, {'a': 1}, 1, {'a': 2}])
+        self.manager.assert_called_once_with(1)
+        self.manager.merge_into.assert_called_once_with({}, {'a': 2})
+
 
 class MergeListOverrideTestCase(unittest.TestCase, MergeTestMixin):
 
@@ -117,8 +168,8 @@ class MergeListOverrideTestCase(unittest.TestCase, MergeTestMixin):
         self.merger_class = MergeListOverride
         MergeTestMixin.setUp(self)
 
-    def test_merge_returns_generator(self):
-        self.assertFalse(isinstance(self.merger([1,2], [3]), list))
+    def test_merge_returns_list(self):
+        self.assertEqual(self.merger([1,2], [3]), [1, 2])
 
     def test_merge_overrides_second_list_with_items_from_first_one(self):
         self.assertEqual(list(self.merger([1], [2])), [1])
@@ -134,6 +185,166 @@ class MergeListOverrideTestCase(unittest.TestCase, MergeTestMixin):
         list(self.merger([1, 2, d], [2, 3]))
         self.assertEqual(self.manager.call_count, 3)
 
+    def test_update_overrides_merge_to_in_place(self):
+        merge_to = [3]
+        merged = self.merger.update([2, 1, 2], merge_to)
+        self.assertTrue(merged is merge_to)
+        self.assertEqual(merged, [1, 2])
+
+
+class MergeListStreamTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListStream
+        MergeTestMixin.setUp(self)
+
+    def test_merge_returns_iterator(self):
+        merged = self.merger([1, 2], [2, 3])
+        self.assertFalse(isinstance(merged, list))
+        self.assertEqual(list(merged), [1, 2, 3])
+        self.assertEqual(list(merged), [])
+
+    def test_merges_values_while_iterator_is_consumed(self):
+        merged = self.merger([1, 2], [2, 3])
+        self.assertEqual(self.manager.call_count, 0)
+        next(merged)
+        self.assertEqual(self.manager.call_count, 1)
+
+
+class MergeListStreamOverrideTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListStreamOverride
+        MergeTestMixin.setUp(self)
+
+    def test_merge_returns_iterator(self):
+        merged = self.merger([1, 2], [3])
+        self.assertFalse(isinstance(merged, list))
+        self.assertEqual(list(merged), [1, 2])
+
+
+class MergeListOrderedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListOrdered
+        MergeTestMixin.setUp(self)
+
+    def test_merge_returns_list(self):
+        self.assertEqual(self.merger([1], [2]), [1, 2])
+
+    def test_merge_keeps_order_of_first_occurrences(self):
+        self.assertEqual(self.merger([3, 1, 2], [2, 0, 3]), [3, 1, 2, 0])
+        self.assertEqual(self.merger(['a', 1], [None, 'a']), ['a', 1, None])
+
+    def test_merge_removes_duplicates_of_unhashable_items(self):
+        (d1, d2) = ({'a': [1]}, {'a': [2]})
+        self.assertEqual(self.merger([d1, 1, [2]], [[2], {'a': [1]}, d2]), \
+                [d1, 1, [2], d2])
+
+    def test_calls_merge_manager_for_each_value(self):
+        self.merger([1, 2, {'a': 1}], [2, 3])
+        self.assertEqual(self.manager.call_count, 4)
+
+    def test_decompose_splits_merge_into_merges_for_each_value(self):
+        (children, build) = self.merger.decompose([1, 2], [2, 3])
+        self.assertEqual(children, [(1,), (2,), (3,)])
+        self.assertEqual(build([1, 2]), [1, 2])
+
+
+class MergeListOrderedOverrideTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListOrderedOverride
+        MergeTestMixin.setUp(self)
+
+    def test_merge_overrides_second_list_with_unique_items_from_first_one(self):
+        self.assertEqual(self.merger([2, 1, 2], [3]), [2, 1])
+
+
+class MergeTupleConcatTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeTupleConcat
+        MergeTestMixin.setUp(self)
+
+    def test_merge_joins_tuples_keeping_order(self):
+        self.assertEqual(self.merger((3, 1), (1, 2)), (3, 1, 1, 2))
+        self.assertEqual(self.merger(([1],), ({'a': 1},)), ([1], {'a': 1}))
+        self.assertEqual(self.merger.merge_many([(1,), (2,), (1,)]), \
+                (1, 2, 1))
+
+    def test_calls_merge_manager_for_each_value(self):
+        self.merger((1, 2), (2,))
+        self.assertEqual(self.manager.call_count, 3)
+
+    def test_leaf_values_are_not_merged_one_by_one(self):
+        self.manager.leaf_types.return_value = frozenset([int])
+        self.assertEqual(self.merger((1, 2), (2,)), (1, 2, 2))
+        self.assertEqual(self.merger.merge_many([(1,), (2,)]), (1, 2))
+        self.assertEqual(self.manager.call_count, 0)
+        self.assertEqual(self.merger.decompose((1, 2), (2,)), None)
+
+    def test_decompose_returns_child_merges_and_builder(self):
+        (children, build) = self.merger.decompose((1, 2), (2,))
+        self.assertEqual(children, [(1,), (2,), (2,)])
+        self.assertEqual(build([1, 2, 2]), (1, 2, 2))
+
+
+class MergeTupleOrderedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeTupleOrdered
+        MergeTestMixin.setUp(self)
+
+    def test_merge_removes_duplicates_keeping_order(self):
+        self.assertEqual(self.merger((3, 1, 3), (2, 1)), (3, 1, 2))
+        self.assertEqual(self.merger(({'a': 1}, [1]), ([1], {'a': 1})), \
+                ({'a': 1}, [1]))
+        self.assertEqual(self.merger.merge_many([(2,), (1,), (2, 3)]), \
+                (2, 1, 3))
+
+    def test_calls_merge_manager_for_each_unique_value(self):
+        self.merger((1, 2), (2,))
+        self.assertEqual(self.manager.call_count, 2)
+
+    def test_leaf_values_are_not_merged_one_by_one(self):
+        self.manager.leaf_types.return_value = frozenset([int])
+        self.assertEqual(self.merger((3, 1, 3), (2, 1)), (3, 1, 2))
+        self.assertEqual(self.manager.call_count, 0)
+        self.assertEqual(self.merger.decompose((3, 1), (2,)), None)
+
+    def test_decompose_returns_child_merges_and_builder(self):
+        (children, build) = self.merger.decompose((1, 2), (2, 3))
+        self.assertEqual(children, [(1,), (2,), (3,)])
+        self.assertEqual(build([1, 2, 3]), (1, 2, 3))
+
+
+class MergeTuplePositionalTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeTuplePositional
+        MergeTestMixin.setUp(self)
+
+    def test_merge_merges_items_on_the_same_positions(self):
+        self.assertEqual(self.merger((1, 2), (3, 4, 5)), (1, 2, 5))
+        self.assertEqual(self.merger((1, 2, 3), (4,)), (1, 2, 3))
+        self.assertEqual(self.merger((), ()), ())
+
+    def test_calls_merge_manager_for_each_position(self):
+        self.merger((1, 2), (3, 4, 5))
+        self.assertEqual(self.manager.call_args_list, \
+                [mock.call(1, 3), mock.call(2, 4), mock.call(5)])
+
+    def test_leaf_tail_is_not_merged_one_by_one(self):
+        self.manager.leaf_types.return_value = frozenset([int])
+        self.assertEqual(self.merger((1,), (3, 4, 5)), (1, 4, 5))
+        self.assertEqual(self.manager.call_count, 1)
+
+    def test_decompose_returns_child_merges_and_builder(self):
+        (children, build) = self.merger.decompose((1, 2), (3, 4, 5))
+        self.assertEqual(children, [(1, 3), (2, 4), (5,)])
+        self.assertEqual(build([1, 2, 5]), (1, 2, 5))
+
 
 class MergeSetTestCase(unittest.TestCase, MergeTestMixin):
 
@@ -145,10 +356,39 @@ class MergeSetTestCase(unittest.TestCase, MergeTestMixin):
         self.assertEqual(self.merger(set([1, 2]), set([2, 3])), set([1, 2, 3]))
         self.assertEqual(self.merger(set([1, 2]), set([3])), set([1, 2, 3]))
 
+    def test_leaf_values_are_not_merged_one_by_one(self):
+        self.manager.leaf_types.return_value = frozenset([int])
+        merged = self.merger(frozenset([1, 2]), set([3]))
+        self.assertEqual((type(merged), merged), (set, set([1, 2, 3])))
+        self.assertEqual(self.merger.update(set([1, 2]), set([3])), \
+                set([1, 2, 3]))
+        self.assertEqual(self.merger.merge_many([set([1]), set([2])]), \
+                set([1, 2]))
+        self.assertEqual(self.manager.call_count, 0)
+        self.assertEqual(self.merger.decompose(set([1]), set([2])), None)
+        self.merger(set(['a']), set([1]))
+        self.assertEqual(self.manager.call_count, 2)
+
+    def test_merge_many_generates_union_of_all_sets(self):
+        self.assertEqual(self.merger.merge_many([set([1]), set([2]), \
+                set([1, 3])]), set([1, 2, 3]))
+
     def test_calls_merge_manager_for_each_key(self):
         self.merger(set([1, 2]), set([2, 3]))
         self.assertEqual(self.manager.call_count, 3)
 
+    def test_update_adds_missing_values_to_merge_to(self):
+        merge_to = set([2, 3])
+        merged = self.merger.update(set([1, 2]), merge_to)
+        self.assertTrue(merged is merge_to)
+        self.assertEqual(merged, set([1, 2, 3]))
+        self.assertEqual(self.manager.call_count, 1)
+
+    def test_decompose_splits_merge_into_merges_for_each_value(self):
+        (children, build) = self.merger.decompose(set([1, 2]), set([2, 3]))
+        self.assertEqual(sorted(children), [(1,), (2,), (3,)])
+        self.assertEqual(build([1, 2]), set([1, 2]))
+
 
 class MergeSetOverrideTestCase(unittest.TestCase, MergeTestMixin):
 
@@ -164,6 +404,95 @@ class MergeSetOverrideTestCase(unittest.TestCase, MergeTestMixin):
         self.merger(set([1, 2]), set([2, 3]))
         self.assertEqual(self.manager.call_count, 2)
 
+    def test_update_overrides_merge_to_in_place(self):
+        merge_to = set([2, 3])
+        merged = self.merger.update(set([1, 2]), merge_to)
+        self.assertTrue(merged is merge_to)
+        self.assertEqual(merged, set([1, 2]))
+
+
+class MergeListPositionalTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListPositional
+        MergeTestMixin.setUp(self)
+
+    def test_merge_merges_items_on_the_same_positions(self):
+        self.assertEqual(self.merger([1, 2], [3, 4, 5]), [1, 2, 5])
+        self.assertEqual(self.merger([1, 2, 3], [4]), [1, 2, 3])
+        self.assertEqual(self.merger([], []), [])
+
+    def test_calls_merge_manager_for_pairs_only(self):
+        self.merger([1, 2], [3, 4, 5])
+        self.assertEqual(self.manager.call_args_list, \
+                [mock.call(1, 3), mock.call(2, 4)])
+
+    def test_tail_is_shared(self):
+        (x, y) = ({'x': 1}, [1])
+        merged = self.merger([{}], [{}, x, y])
+        self.assertTrue(merged[1] is x)
+        self.assertTrue(merged[2] is y)
+
+    def test_merge_does_not_modify_given_lists(self):
+        (a, b) = ([1], [2, 3])
+        self.merger(a, b)
+        self.assertEqual((a, b), ([1], [2, 3]))
+
+    def test_update_merges_into_merge_to(self):
+        self.manager.merge_into.side_effect = lambda target, source: source
+        target = [3, 4]
+        self.assertTrue(self.merger.update([1, 2, 5], target) is target)
+        self.assertEqual(target, [1, 2, 5])
+        self.assertEqual(self.merger.update([6], target), [6, 2, 5])
+
+    def test_decompose_returns_child_merges_and_builder(self):
+        (children, build) = self.merger.decompose([1, 2], [3, 4, 5])
+        self.assertEqual(children, [(1, 3), (2, 4)])
+        self.assertEqual(build([1, 2]), [1, 2, 5])
+
+
+class MergeListKeyedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListKeyed
+        MergeTestMixin.setUp(self)
+        self.manager.side_effect = lambda a, b=None: (a, b) if b else a
+
+    def test_merge_merges_items_with_the_same_identity(self):
+        (a1, a2, b, c) = ({'id': 1, 'v': 1}, {'id': 1, 'v': 2}, {'id': 2}, \
+                {'id': 3})
+        self.assertEqual(self.merger([c, a1], [b, a2]), [b, (a1, a2), c])
+
+    def test_items_without_identity_are_not_matched(self):
+        (a, b, c) = ({'id': [1]}, {'v': 1}, 'x')
+        self.assertEqual(self.merger([a, b, c], [a, b, c]), \
+                [a, b, c, a, b, c])
+
+    def test_duplicated_identities_are_matched_once(self):
+        (a1, a2, a3) = ({'id': 1, 'v': 1}, {'id': 1, 'v': 2}, {'id': 1})
+        self.assertEqual(self.merger([a1, a2], [a3, a3]), \
+                [(a1, a3), a3, a2])
+
+    def test_init_accepts_field_name_or_function(self):
+        (a, b) = ({'name': 'x', 'v': 1}, {'name': 'x', 'v': 2})
+        merger = self.merger_class(self.manager, 'name')
+        self.assertEqual(merger([a], [b]), [(a, b)])
+        merger = self.merger_class(self.manager, lambda item: item['v'] % 2)
+        self.assertEqual(merger([a], [b]), [b, a])
+
+    def test_update_merges_into_merge_to(self):
+        self.manager.merge_into.side_effect = lambda target, source: source
+        (a1, a2, b) = ({'id': 1, 'v': 1}, {'id': 1, 'v': 2}, {'id': 2})
+        target = [a2]
+        self.assertTrue(self.merger.update([b, a1], target) is target)
+        self.assertEqual(target, [a1, b])
+
+    def test_decompose_returns_child_merges_and_builder(self):
+        (a1, a2, b) = ({'id': 1, 'v': 1}, {'id': 1, 'v': 2}, {'id': 2})
+        (children, build) = self.merger.decompose([b, a1], [a2])
+        self.assertEqual(children, [(a1, a2), (b,)])
+        self.assertEqual(build([a1, b]), [a1, b])
+
 
 class MergeTupleTestCase(unittest.TestCase, MergeTestMixin):
 
@@ -175,6 +504,17 @@ class MergeTupleTestCase(unittest.TestCase, MergeTestMixin):
         self.assertEqual(self.merger((1, 2), (2, 3)), (1, 2, 3))
         self.assertEqual(self.merger((1, 2), (3,)), (1, 2, 3))
 
+    def test_leaf_values_are_not_merged_one_by_one(self):
+        self.manager.leaf_types.return_value = frozenset([int])
+        self.assertEqual(sorted(self.merger((1, 2), (2, 3))), [1, 2, 3])
+        self.assertEqual(sorted(self.merger.merge_many([(1,), (2,)])), [1, 2])
+        self.assertEqual(self.manager.call_count, 0)
+        self.assertEqual(self.merger.decompose((1, 2), (2, 3)), None)
+
+    def test_merge_many_generates_union_of_all_tuples(self):
+        self.assertEqual(sorted(self.merger.merge_many([(1,), (2, 1), \
+                (3,)])), [1, 2, 3])
+
     def test_calls_merge_manager_for_each_key(self):
         self.merger((1, 2), (2, 3))
         self.assertEqual(self.manager.call_count, 3)
@@ -205,6 +545,12 @@ class MergeDictTestCase(unittest.TestCase, MergeTestMixin):
         self.assertEqual(self.merger({'a': 1}, {'b': 1}), {'a': 1, 'b': 1})
         self.assertEqual(self.merger({'a': 1}, {'a': 2}), {'a': 1})
 
+    def test_decompose_splits_merge_into_merges_for_each_key(self):
+        (children, build) = self.merger.decompose({'a': 1, 'b': 2}, {'a': 3})
+        self.assertEqual(children, [(1, 3), (2,)])
+        self.assertEqual(build(['x', 'y']), {'a': 'x', 'b': 'y'})
+        self.assertEqual(self.manager.call_count, 0)
+
     def test_merge_of_values_depends_on_merge_manager_configuration(self):
         self.assertEqual(self.merger({'a': 1}, {'a': 2}), {'a': 1})
         self.manager.side_effect = lambda a, b: b
@@ -217,6 +563,22 @@ class MergeDictTestCase(unittest.TestCase, MergeTestMixin):
         self.merger({'a': 1}, {'b': 2})
         self.assertEqual(self.manager.call_count, 2)
 
+    def test_merge_many_merges_values_grouped_by_keys(self):
+        self.manager.merge_many.side_effect = lambda *a: a
+        self.assertEqual(self.merger.merge_many([{'a': 1, 'b': 2}, \
+                {'a': 3}, {'c': 4, 'a': 5}]), \
+                {'a': (1, 3, 5), 'b': (2,), 'c': (4,)})
+        self.assertEqual(self.manager.merge_many.call_count, 3)
+
+    def test_update_merges_values_into_merge_to(self):
+        self.manager.merge_into.side_effect = lambda t, s: s + t
+        merge_to = {'a': 1, 'b': 2}
+        merged = self.merger.update({'a': 10, 'c': 3}, merge_to)
+        self.assertTrue(merged is merge_to)
+        self.assertEqual(merged, {'a': 11, 'b': 2, 'c': 3})
+        self.manager.merge_into.assert_called_once_with(1, 10)
+        self.manager.assert_called_once_with(3)
+
 
 class MergeDictOverrideTestCase(unittest.TestCase, MergeTestMixin):
 
@@ -235,6 +597,244 @@ class MergeDictOverrideTestCase(unittest.TestCase, MergeTestMixin):
         self.merger({'a': 1}, {'b': 2})
         self.assertEqual(self.manager.call_count, 1)
 
+    def test_merge_many_overrides_with_first_dict(self):
+        self.assertEqual(self.merger.merge_many([{'a': 1}, {'b': 2}, \
+                {'a': 3}]), {'a': 1})
+
+    def test_update_overrides_merge_to_in_place(self):
+        merge_to = {'a': 1, 'b': 2}
+        merged = self.merger.update({'a': 10, 'c': 3}, merge_to)
+        self.assertTrue(merged is merge_to)
+        self.assertEqual(merged, {'a': 10, 'c': 3})
+
+
+class MergeDictHashJoinTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeDictHashJoin
+        MergeTestMixin.setUp(self)
+
+    def test_merge_generates_union_of_two_dicts(self):
+        self.assertEqual(self.merger({'a': 1}, {'b': 1}), {'a': 1, 'b': 1})
+        self.assertEqual(self.merger({'a': 1}, {'a': 2}), {'a': 1})
+
+    def test_merge_accepts_keys_that_are_not_comparable(self):
+        self.assertEqual(self.merger({1: 1, 'a': 2}, {(None,): 3, 'a': 4}), \
+                {1: 1, 'a': 2, (None,): 3})
+
+    def test_merge_keeps_insertion_order(self):
+        self.assertEqual(list(self.merger({'c': 1, 'a': 1}, {'b': 1, 'a': 2})), \
+                ['c', 'a', 'b'])
+
+    def test_calls_merge_manager_with_both_values_for_keys_in_common(self):
+        self.merger({'a': 1, 'b': 2}, {'a': 3, 'c': 4})
+        self.assertEqual(self.manager.call_args_list, \
+                [mock.call(1, 3), mock.call(2), mock.call(4)])
+
+
+class MergeDictHashJoinOverrideTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeDictHashJoinOverride
+        MergeTestMixin.setUp(self)
+
+    def test_merge_overrides_values_from_second_dict_with_first_one(self):
+        self.assertEqual(self.merger({'c': 3}, {'d': 4}), {'c': 3})
+        self.assertEqual(self.merger({'a': 1}, {'a': 2}), {'a': 1})
+
+    def test_calls_merge_manager_for_each_key(self):
+        self.merger({'a': 1, 'b': 2}, {'a': 2})
+        self.assertEqual(self.manager.call_count, 2)
+
+
+class MergeDictSharedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeDictShared
+        MergeTestMixin.setUp(self)
+
+    def test_merge_generates_union_of_two_dicts(self):
+        self.assertEqual(self.merger({'a': 1}, {'b': 1}), {'a': 1, 'b': 1})
+        self.assertEqual(self.merger({'a': 1}, {'a': 2}), {'a': 1})
+
+    def test_merge_does_not_modify_given_dicts(self):
+        (a, b) = ({'a': 1, 'c': 3}, {'a': 2, 'b': 2})
+        self.merger(a, b)
+        self.assertEqual(a, {'a': 1, 'c': 3})
+        self.assertEqual(b, {'a': 2, 'b': 2})
+
+    def test_values_present_on_one_side_are_shared(self):
+        (x, y) = ({'x': 1}, [1])
+        merged = self.merger({'a': x}, {'b': y})
+        self.assertTrue(merged['a'] is x)
+        self.assertTrue(merged['b'] is y)
+        self.assertEqual(self.manager.call_count, 0)
+
+    def test_calls_merge_manager_for_different_values_in_common(self):
+        x = {'x': 1}
+        self.merger({'a': x, 'b': 1}, {'a': x, 'b': 2, 'c': 3})
+        self.manager.assert_called_once_with(1, 2)
+
+
+class MergeSetSharedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeSetShared
+        MergeTestMixin.setUp(self)
+
+    def test_merge_generates_union_of_two_sets(self):
+        self.assertEqual(self.merger(set([1, 2]), set([2, 3])), set([1, 2, 3]))
+        self.assertEqual(self.merger(frozenset([1]), set([2])), set([1, 2]))
+        self.assertEqual(self.merger.merge_many([set([1]), set([2])]), \
+                set([1, 2]))
+        self.assertEqual(self.manager.call_count, 0)
+
+    def test_merge_shares_values_with_result(self):
+        value = (1, 2)
+        merged = self.merger(set([value]), set([(3,)]))
+        self.assertTrue([item for item in merged if item == value][0] \
+                is value)
+        self.assertTrue(self.merger.decompose(set([value]), set()) is None)
+
+
+class MergeListSharedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeListShared
+        MergeTestMixin.setUp(self)
+
+    def test_merge_joins_lists_without_duplicates(self):
+        self.assertEqual(self.merger([3, 1], [1, 2]), [1, 2, 3])
+        self.assertEqual(self.merger([{'a': 1}], [{'a': 1}, 1]), \
+                [1, {'a': 1}])
+        self.assertEqual(self.merger.merge_many([[1], [2], [1]]), [1, 2])
+        self.assertEqual(self.manager.call_count, 0)
+
+    def test_merge_shares_values_with_result(self):
+        (a, b) = ({'a': [1]}, {'b': [2]})
+        merged = self.merger([a], [b])
+        self.assertEqual(len(merged), 2)
+        self.assertTrue(merged[0] is a and merged[1] is b)
+        self.assertTrue(self.merger.decompose([a], [b]) is None)
+
+
+class MergeTupleSharedTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergeTupleShared
+        MergeTestMixin.setUp(self)
+
+    def test_merge_joins_tuples_without_duplicates(self):
+        self.assertEqual(sorted(self.merger((3, 1), (1, 2))), [1, 2, 3])
+        self.assertEqual(sorted(self.merger.merge_many([(1,), (2,), (1,)])), \
+                [1, 2])
+        self.assertEqual(self.manager.call_count, 0)
+
+    def test_merge_shares_values_with_result(self):
+        value = (1, (2,))
+        merged = self.merger((value,), ((3,),))
+        self.assertTrue([item for item in merged if item == value][0] \
+                is value)
+        self.assertTrue(self.merger.decompose((value,), ()) is None)
+
+
+class MergePersistentMapTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergePersistentMap
+        MergeTestMixin.setUp(self)
+
+    def test_merge_generates_union_of_two_maps(self):
+        merged = self.merger({'a': 1}, PersistentMap({'b': 1}))
+        self.assertTrue(isinstance(merged, PersistentMap))
+        self.assertEqual(merged, {'a': 1, 'b': 1})
+        self.assertEqual(self.merger(PersistentMap({'a': 1}), {'a': 2}), \
+                {'a': 1})
+        self.assertEqual(self.merger({'a': None}, None), {'a': None})
+
+    def test_merge_does_not_modify_given_maps(self):
+        (a, b) = ({'a': 1, 'c': 3}, PersistentMap({'a': 2, 'b': 2}))
+        self.merger(a, b)
+        self.assertEqual(a, {'a': 1, 'c': 3})
+        self.assertEqual(b, {'a': 2, 'b': 2})
+
+    def test_values_of_merge_to_are_shared(self):
+        y = PersistentVector([1])
+        merged = self.merger({'a': 1}, PersistentMap({'b': y}))
+        self.assertTrue(merged['b'] is y)
+        self.manager.assert_called_once_with(1, None)
+
+    def test_calls_merge_manager_for_different_values_in_common(self):
+        x = PersistentMap({'x': 1})
+        self.merger({'a': x, 'b': 1}, PersistentMap({'a': x, 'b': 2}))
+        self.manager.assert_called_once_with(1, 2)
+
+    def test_decompose_returns_child_merges_and_builder(self):
+        (children, build) = self.merger.decompose({'a': 1}, \
+                PersistentMap({'a': 2, 'b': 3}))
+        self.assertEqual(children, [(1, 2)])
+        self.assertEqual(build([4]), {'a': 4, 'b': 3})
+
+    def test_values_of_plain_merge_to_are_merged(self):
+        (x, y) = ([1], {'z': 1})
+        (children, build) = self.merger.decompose({'a': x}, {'a': x, 'b': y})
+        self.assertEqual(children, [(x, x), (y,)])
+        merged = build([(1,), 'y'])
+        self.assertTrue(isinstance(merged, PersistentMap))
+        self.assertEqual(merged, {'a': (1,), 'b': 'y'})
+
+
+class MergePersistentVectorTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergePersistentVector
+        MergeTestMixin.setUp(self)
+
+    def test_merge_appends_missing_values(self):
+        merged = self.merger([3, 1, 3, {'a': 1}], PersistentVector([1, 2]))
+        self.assertTrue(isinstance(merged, PersistentVector))
+        self.assertEqual(list(merged), [1, 2, 3, {'a': 1}])
+        self.assertEqual(list(self.merger([1], [2])), [2, 1])
+        self.assertEqual(list(self.merger([1], None)), [1])
+
+    def test_merge_does_not_modify_given_vectors(self):
+        (a, b) = ([1], PersistentVector([2]))
+        self.merger(a, b)
+        self.assertEqual(a, [1])
+        self.assertEqual(list(b), [2])
+
+    def test_calls_merge_manager_for_appended_values(self):
+        self.merger([1, 2, 2], PersistentVector([1]))
+        self.manager.assert_called_once_with(2)
+
+    def test_items_of_plain_merge_to_are_merged(self):
+        merged = self.merger([{'a': 1}, 2], [{'a': 1}])
+        self.assertTrue(isinstance(merged, PersistentVector))
+        self.assertEqual(list(merged), [{'a': 1}, 2])
+        self.assertEqual(self.manager.call_args_list, \
+                [mock.call({'a': 1}), mock.call(2)])
+
+
+class MergePersistentSetTestCase(unittest.TestCase, MergeTestMixin):
+
+    def setUp(self):
+        self.merger_class = MergePersistentSet
+        MergeTestMixin.setUp(self)
+
+    def test_merge_joins_sets(self):
+        self.assertEqual(self.merger(frozenset([1]), frozenset([2])), \
+                set([1, 2]))
+        self.assertEqual(self.merger(set([1]), frozenset([2])), set([1, 2]))
+        self.assertEqual(self.merger(frozenset([1]), set([2])), set([1, 2]))
+
+    def test_merge_shares_frozenset_holding_all_values(self):
+        merge_to = frozenset([1, 2])
+        self.assertTrue(self.merger(set([1]), merge_to) is merge_to)
+        self.assertTrue(self.merger(frozenset([2]), merge_to) is merge_to)
+        self.assertTrue(self.merger.decompose(set([1]), merge_to) is None)
+        merge_to = set([1, 2])
+        self.assertFalse(self.merger(set([1]), merge_to) is merge_to)
+
 
 if "__main__" == __name__:
     unittest.main()
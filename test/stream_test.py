@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# python standard library
+#
+import io
+import json
+import unittest
+from functools import partial
+
+##
+# test helpers
+#
+from testutils import mock
+
+##
+# pycomber modules
+#
+from pycomber.manager import Manager
+from pycomber.configuration import ConfigurationAggregate, \
+        ConfigurationComplex, ConfigurationPrimitives, ConfigurationNoneType, \
+        ConfigurationImmutable
+from pycomber.strategies import MergeDictOverride
+from pycomber.stream import merge_ndjson, merge_json, dump, _Document
+
+
+class MergeNdjsonTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.out = io.StringIO()
+
+    def _lines(self, *records):
+        return io.StringIO(u''.join(json.dumps(r) + '\n' for r in records))
+
+    def _written(self):
+        return [json.loads(line) for line in \
+                self.out.getvalue().splitlines()]
+
+    def test_merges_records_pairwise(self):
+        count = merge_ndjson(self.manager, \
+                self._lines({'a': 1, 'b': [1]}, {'c': 1}), \
+                self._lines({'a': 2, 'b': [2]}, {'d': 2}), self.out)
+        self.assertEqual(count, 2)
+        self.assertEqual(self._written(), [{'a': 1, 'b': [1, 2]}, \
+                {'c': 1, 'd': 2}])
+
+    def test_merges_remaining_records_with_none(self):
+        merge_ndjson(self.manager, self._lines({'a': 1}), \
+                self._lines({'a': 2}, {'b': 2}, None), self.out)
+        self.assertEqual(self._written(), [{'a': 1}, {'b': 2}, None])
+
+    def test_skips_blank_lines(self):
+        merge_ndjson(self.manager, io.StringIO(u'\n{"a": 1}\n\n'), \
+                io.StringIO(u'{"b": 2}'), self.out)
+        self.assertEqual(self._written(), [{'a': 1, 'b': 2}])
+
+    def test_reads_and_writes_records_one_by_one(self):
+        log = []
+
+        def lines():
+            for line in (u'{"a": 1}', u'{"a": 2}'):
+                log.append('read')
+                yield line
+        out = mock.Mock()
+        out.write.side_effect = lambda chunk: log.append('write') \
+                if chunk == '\n' else None
+        merge_ndjson(self.manager, lines(), [], out)
+        self.assertEqual(log, ['read', 'write', 'read', 'write'])
+
+
+class MergeJsonTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType())(self.manager)
+        self.left = {'a': 1, 'b': {'c': [1], 'd': {'e': u'x"}\\'}}, \
+                'f': [{'g': u'\u017c'}], 'h': None}
+        self.right = {'a': 2, 'b': {'c': [2], 'i': 1.5}, 'j': {'k': [True]}}
+
+    def _file(self, value, indent=None):
+        return io.BytesIO(json.dumps(value, indent=indent).encode('utf-8'))
+
+    def _merge(self, left, right, chunk_size=65536):
+        out = io.StringIO()
+        merge_json(self.manager, self._file(left, 2), \
+                None if right is None else self._file(right), out, chunk_size)
+        return json.loads(out.getvalue())
+
+    def test_gives_same_result_as_manager(self):
+        expected = self.manager(self.left, self.right)
+        for chunk_size in (1, 2, 7, 65536):
+            self.assertEqual(self._merge(self.left, self.right, chunk_size), \
+                    expected)
+        self.assertEqual(self._merge([1, {'a': 1}], [2]), \
+                self.manager([1, {'a': 1}], [2]))
+        self.assertEqual(self._merge(u'a', None), u'a')
+        self.assertEqual(self._merge(self.left, None), self.left)
+
+    def test_decodes_only_values_merged_by_manager(self):
+        with mock.patch.object(_Document, 'load', autospec=True, \
+                side_effect=_Document.load) as load:
+            self._merge(self.left, self.right)
+        loaded = sorted(json.dumps(c[0][0].load(c[0][1])) \
+                for c in load.call_args_list)
+        self.assertEqual(loaded, ['1', '1.5', '2', '[1]', '[2]', 'null'])
+
+    def test_merges_dicts_with_manager_if_not_merged_by_members(self):
+        self.manager.set_strategy(MergeDictOverride(self.manager), dict)
+        self.assertEqual(self._merge(self.left, self.right), \
+                self.manager(self.left, self.right))
+
+    def test_raises_value_error_for_invalid_documents(self):
+        for document in (b'{"a": 1', b'{"a" 1}', b'{"a": 1 "b": 2}', \
+                b'[1] 2', b'"a', b''):
+            self.assertRaises(ValueError, partial(merge_json, self.manager, \
+                    io.BytesIO(document), io.BytesIO(b'{}'), io.StringIO()))
+
+
+class DumpTestCase(unittest.TestCase):
+
+    def test_writes_merged_values_as_json(self):
+        manager = Manager()
+        ConfigurationAggregate(ConfigurationComplex(), \
+                ConfigurationPrimitives(), ConfigurationNoneType(), \
+                ConfigurationImmutable())(manager)
+        out = io.StringIO()
+        dump(manager({'a': {'b': [1]}, 'c': set([1])}, {'a': {'b': [2]}}), \
+                out)
+        self.assertEqual(json.loads(out.getvalue()), \
+                {'a': {'b': [1, 2]}, 'c': [1]})
+
+    def test_raises_type_error_for_unsupported_values(self):
+        self.assertRaises(TypeError, partial(dump, object(), io.StringIO()))
+
+
+if "__main__" == __name__:
+    unittest.main()
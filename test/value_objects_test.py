@@ -4,6 +4,7 @@
 ##
 # python standard library
 #
+import pickle
 import unittest
 from functools import partial
 
@@ -12,6 +13,12 @@ from functools import partial
 #
 from pycomber.value_objects import ImmutableDict
 
+# Python 2to3 support
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:
+    from collections import Mapping, MutableMapping
+
 
 class ImmutableDictTestCase(unittest.TestCase):
 
@@ -25,6 +32,28 @@ class ImmutableDictTestCase(unittest.TestCase):
         self.assertRaises(TypeError, partial(obj.__setitem__, 'b', 1))
         self.assertRaises(TypeError, partial(obj.__delitem__, 'a'))
         self.assertRaises(TypeError, partial(obj.update, {'b': 1}))
+        self.assertRaises(TypeError, ImmutableDict({}).clear)
+        self.assertRaises(TypeError, partial(obj.pop, 'b', None))
+        self.assertRaises(TypeError, partial(obj.setdefault, 'b', 1))
+        self.assertRaises(TypeError, obj.popitem)
+        self.assertEqual(obj, {'a': 1})
+
+    def test_instance_is_not_mutable_mapping(self):
+        obj = ImmutableDict({'a': 1})
+        self.assertTrue(isinstance(obj, Mapping))
+        self.assertFalse(isinstance(obj, MutableMapping))
+
+    def test_attributes_can_not_be_replaced(self):
+        obj = ImmutableDict({'a': 1})
+        self.assertRaises(TypeError, partial(setattr, obj, '_inner', {}))
+        self.assertRaises(TypeError, partial(delattr, obj, '_inner'))
+        self.assertRaises(TypeError, partial(setattr, obj, '_hash', 1))
+        self.assertEqual(obj, {'a': 1})
+
+    def test_instance_can_be_pickled(self):
+        obj = ImmutableDict({'a': 1})
+        hash(obj)
+        self.assertEqual(pickle.loads(pickle.dumps(obj)), obj)
 
     def test_instance_behaves_as_dict(self):
         obj = ImmutableDict({'a': 1})
@@ -33,6 +62,43 @@ class ImmutableDictTestCase(unittest.TestCase):
         self.assertTrue('a' in obj)
         self.assertEqual(list(iter(obj)), ['a'])
 
+    def test_instance_copies_given_dict(self):
+        inner = {'a': 1}
+        obj = ImmutableDict(inner)
+        inner['a'] = 2
+        self.assertEqual(obj['a'], 1)
+
+    def test_instance_has_no_dict(self):
+        self.assertFalse(hasattr(ImmutableDict({'a': 1}), '__dict__'))
+
+    def test_instance_is_hashable(self):
+        self.assertEqual(hash(ImmutableDict({'a': 1, 'b': (2,)})), \
+                hash(ImmutableDict({'b': (2,), 'a': 1})))
+        self.assertEqual(len(set([ImmutableDict({'a': 1}), \
+                ImmutableDict({'a': 1}), ImmutableDict({'a': 2})])), 2)
+        self.assertRaises(TypeError, partial(hash, ImmutableDict({'a': [1]})))
+
+    def test_hash_is_computed_once(self):
+        obj = ImmutableDict({'a': 1})
+        hash(obj)
+        object.__setattr__(obj, '_inner', {'a': 2})
+        self.assertEqual(hash(obj), hash(ImmutableDict({'a': 1})))
+
+    def test_instance_compares_by_value(self):
+        obj = ImmutableDict({'a': 1})
+        self.assertEqual(obj, ImmutableDict({'a': 1}))
+        self.assertEqual(obj, {'a': 1})
+        self.assertNotEqual(obj, ImmutableDict({'a': 2}))
+        self.assertNotEqual(obj, {'a': 2})
+        self.assertNotEqual(obj, [('a', 1)])
+
+    def test_instances_with_different_hashes_are_not_equal(self):
+        (a, b) = (ImmutableDict({'a': 1}), ImmutableDict({'a': 1}))
+        hash(a)
+        hash(b)
+        object.__setattr__(b, '_hash', b._hash + 1)
+        self.assertNotEqual(a, b)
+
 
 if "__main__" == __name__:
     unittest.main()